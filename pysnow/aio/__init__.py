@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from .client import AsyncClient
+from .resource import AsyncResource
+from .response import AsyncResponse
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+import aiohttp
+
+from ..exceptions import InvalidUsage
+from ..url_builder import URLBuilder
+from ..params_builder import ParamsBuilder
+from ..parser import get_backend
+from ..codec import get_codec
+from .resource import AsyncResource
+
+logger = logging.getLogger("pysnow")
+
+
+class AsyncClient(object):
+    """User-created AsyncClient object, the asyncio counterpart of :class:`pysnow.Client`.
+
+    :param instance: Instance name, used to construct host
+    :param host: Host can be passed as an alternative to instance
+    :param user: User name
+    :param password: Password
+    :param use_ssl: Enable or disable the use of SSL, defaults to True
+    :param session: Optional :class:`aiohttp.ClientSession` object to use instead of passing user/pass
+    :param json_codec: (optional) Name of the JSON library used to encode payloads, see :class:`pysnow.Client`
+    :raises:
+        - InvalidUsage: On argument validation error
+    """
+
+    def __init__(
+        self,
+        instance=None,
+        host=None,
+        user=None,
+        password=None,
+        use_ssl=True,
+        session=None,
+        json_codec=None,
+    ):
+
+        if (host and instance) is not None:
+            raise InvalidUsage(
+                "Arguments 'instance' and 'host' are mutually exclusive, you cannot use both."
+            )
+
+        if type(use_ssl) is not bool:
+            raise InvalidUsage("Argument 'use_ssl' must be of type bool")
+
+        if not (host or instance):
+            raise InvalidUsage("You must supply either 'instance' or 'host'")
+
+        if not (user and password) and not session:
+            raise InvalidUsage(
+                "You must supply either username and password or a session object"
+            )
+        elif (user and session) is not None:
+            raise InvalidUsage(
+                "Provide either username and password or a session, not both."
+            )
+
+        self.parameters = ParamsBuilder()
+        self.instance = instance
+        self.host = host
+        self._user = user
+        self._password = password
+        self._session = None
+        self.use_ssl = use_ssl
+        self.base_url = URLBuilder.get_base_url(use_ssl, instance, host)
+        self.json_codec = get_codec(json_codec)
+
+        if session is not None:
+            logger.debug("(SESSION_CREATE) Object: %s" % session)
+            self._session = self._get_session(session)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+    @property
+    def session(self):
+        """Returns the session, which is created with basic auth on first use unless one was provided.
+
+        :return:
+            - :class:`aiohttp.ClientSession` object
+        """
+
+        if self._session is None:
+            logger.debug("(SESSION_CREATE) User: %s" % self._user)
+            self._session = self._get_session(
+                aiohttp.ClientSession(
+                    auth=aiohttp.BasicAuth(self._user, self._password)
+                )
+            )
+
+        return self._session
+
+    @staticmethod
+    def _get_session(session):
+        """Sets headers on the session
+
+        :param session: :class:`aiohttp.ClientSession` object
+        :return:
+            - :class:`aiohttp.ClientSession` object
+        """
+
+        session.headers.update(
+            {
+                "content-type": "application/json",
+                "accept": "application/json",
+                "User-Agent": "pysnow",
+            }
+        )
+
+        return session
+
+    def resource(
+        self,
+        api_path=None,
+        base_path="/api/now",
+        chunk_size=None,
+        parser_backend=None,
+        **kwargs
+    ):
+        """Creates a new :class:`AsyncResource` object after validating paths
+
+        :param api_path: Path to the API to operate on
+        :param base_path: (optional) Base path override
+        :param chunk_size: Response stream parser chunk size (in bytes)
+        :param parser_backend: (optional) Name of the ijson backend to use, defaults to the fastest available
+        :param **kwargs: Pass request.request parameters to the Resource object
+        :return:
+            - :class:`AsyncResource` object
+        :raises:
+            - InvalidUsage: If a path or the parser backend fails validation
+        """
+
+        for path in [api_path, base_path]:
+            URLBuilder.validate_path(path)
+
+        return AsyncResource(
+            api_path=api_path,
+            base_path=base_path,
+            parameters=self.parameters,
+            chunk_size=chunk_size or 8192,
+            parser_backend=get_backend(parser_backend),
+            json_codec=self.json_codec,
+            session=self.session,
+            base_url=self.base_url,
+            **kwargs
+        )
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+import aiohttp
+
+from ..request import SnowRequest, get_changed_fields
+from ..parser import pop_parser_options
+from ..exceptions import InvalidUsage
+from .response import AsyncResponse
+
+logger = logging.getLogger("pysnow")
+
+
+class AsyncRequest(SnowRequest):
+    """Creates a new :class:`AsyncRequest` object, the asyncio counterpart of :class:`request.SnowRequest`.
+
+    :param parameters: :class:`params_builder.ParamsBuilder` object
+    :param session: :class:`aiohttp.ClientSession` object
+    :param url_builder: :class:`url_builder.URLBuilder` object
+    """
+
+    def _get_params(self):
+        """Returns query parameters in a form accepted by aiohttp, which rejects bool and None values
+
+        :return: Dictionary containing query parameters
+        """
+
+        params = {}
+
+        for key, value in self._parameters.as_dict().items():
+            if value is None or value == []:
+                continue
+
+            params[key] = str(value) if isinstance(value, bool) else value
+
+        return params
+
+    async def _send(self, method, url, **kwargs):
+        """Sends a request using the session
+
+        :param method: HTTP method
+        :param url: URL to send the request to
+        :param kwargs: kwargs to pass along to :meth:`aiohttp.ClientSession.request`
+        :return:
+            - :class:`aiohttp.ClientResponse` object
+        """
+
+        logger.debug(
+            "(REQUEST_SEND) Method: %s, Resource: %s" % (method, self._resource)
+        )
+
+        response = await self._session.request(
+            method, url, timeout=aiohttp.ClientTimeout(total=self._timeout), **kwargs
+        )
+
+        logger.debug(
+            "(RESPONSE_RECEIVE) Code: %d, Resource: %s"
+            % (response.status, self._resource)
+        )
+
+        return response
+
+    async def _get_response(self, method, **kwargs):
+        """Response wrapper - creates a :class:`aiohttp.ClientResponse` object and passes along to
+        :class:`AsyncResponse` for validation and parsing.
+
+        :param kwargs: kwargs to pass along to _send()
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        parser_options = kwargs.pop("parser_options", None)
+
+        if parser_options is None:
+            parser_options = pop_parser_options(kwargs)
+
+        response = await self._send(
+            method, self._url, params=self._get_params(), **kwargs
+        )
+
+        return AsyncResponse(
+            response=response,
+            resource=self._resource,
+            chunk_size=self._chunk_size,
+            parser_backend=self._parser_backend,
+            parser_options=parser_options,
+        )
+
+    async def get(self, *args, **kwargs):
+        """Fetches one or more records
+
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        query = kwargs.pop("query", {}) if len(args) == 0 else args[0]
+        parser_options = pop_parser_options(kwargs, fields=kwargs.get("fields"))
+        self._set_get_parameters(query, kwargs)
+
+        return await self._get_response("GET", parser_options=parser_options)
+
+    async def create(self, payload):
+        """Creates a new record
+
+        :param payload: Dictionary payload
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._get_response("POST", data=self._codec.dumps(payload))
+
+    async def update(self, query, payload):
+        """Updates a record
+
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :param payload: Dictionary payload
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        record = await (await self.get(query=query)).one()
+
+        return await self.update_by_sys_id(record["sys_id"], payload)
+
+    async def update_by_sys_id(self, sys_id, payload):
+        """Updates the record with the given sys_id, without looking it up first
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary payload
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        self._url = self._get_custom_endpoint(sys_id)
+        return await self._get_response("PUT", data=self._codec.dumps(payload))
+
+    async def patch(self, sys_id, payload, record=None):
+        """Partially updates the record with the given sys_id. If `record` is provided, only fields that changed are
+        sent, and no request is made if nothing changed.
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary payload
+        :param record: (optional) Dictionary of the previously fetched record
+        :return:
+            - :class:`AsyncResponse` object, or None if nothing changed
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        if record is not None:
+            payload = get_changed_fields(record, payload)
+
+            if not payload:
+                return None
+
+        self._url = self._get_custom_endpoint(sys_id)
+        return await self._get_response("PATCH", data=self._codec.dumps(payload))
+
+    async def delete(self, query):
+        """Deletes a record
+
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :return:
+            - Dictionary containing status of the delete operation
+        """
+
+        record = await (await self.get(query=query)).one()
+
+        return await self.delete_by_sys_id(record["sys_id"])
+
+    async def delete_by_sys_id(self, sys_id):
+        """Deletes the record with the given sys_id, without looking it up first
+
+        :param sys_id: sys_id of the record to delete
+        :return:
+            - Dictionary containing status of the delete operation
+        """
+
+        self._url = self._get_custom_endpoint(sys_id)
+
+        return await (await self._get_response("DELETE")).one()
+
+    async def custom(self, method, path_append=None, **kwargs):
+        """Creates a custom request
+
+        :param method: HTTP method
+        :param path_append: (optional) append path to resource.api_path
+        :param kwargs: kwargs to pass along to :meth:`aiohttp.ClientSession.request`
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        if path_append is not None:
+            self._url = self._get_custom_endpoint(path_append)
+
+        return await self._get_response(method, **kwargs)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from copy import copy, deepcopy
+
+from ..url_builder import URLBuilder
+from ..parser import get_backend, get_backend_name
+from .request import AsyncRequest
+
+logger = logging.getLogger("pysnow")
+
+
+class AsyncResource(object):
+    r"""Creates a new :class:`AsyncResource` object, the asyncio counterpart of :class:`pysnow.Resource`
+
+    :param base_path: Base path
+    :param api_path: API path
+    :param chunk_size: Response stream parser chunk size (in bytes)
+    :param parser_backend: ijson backend module used by the stream parser
+    :param json_codec: :class:`codec.JSONCodec` used to encode payloads
+    :param \*\*kwargs: Arguments to pass along to :class:`AsyncRequest`
+    """
+
+    def __init__(
+        self, base_url=None, base_path=None, api_path=None, parameters=None, **kwargs
+    ):
+
+        self._base_url = base_url
+        self._base_path = base_path
+        self._api_path = api_path
+        self._url_builder = URLBuilder(base_url, base_path, api_path)
+
+        self.kwargs = kwargs
+        self.parameters = deepcopy(parameters)
+
+        logger.debug(
+            "(RESOURCE_ADD) Object: %s, chunk_size: %d, parser_backend: %s"
+            % (self, kwargs.get("chunk_size"), self.parser_backend)
+        )
+
+    def __repr__(self):
+        return "<%s [%s] at %s>" % (self.__class__.__name__, self.path, hex(id(self)))
+
+    @property
+    def parser_backend(self):
+        """Name of the ijson backend used by the stream parser, e.g. `yajl2_c`"""
+
+        return get_backend_name(self.kwargs.get("parser_backend") or get_backend())
+
+    @property
+    def path(self):
+        """Get current path relative to base URL
+
+        :return: resource path
+        """
+
+        return "%s" % self._base_path + self._api_path
+
+    @property
+    def _request(self):
+        """Request wrapper
+
+        :return: AsyncRequest object
+        """
+
+        parameters = copy(self.parameters)
+
+        return AsyncRequest(
+            url_builder=self._url_builder,
+            parameters=parameters,
+            resource=self,
+            **self.kwargs
+        )
+
+    def get_record_link(self, sys_id):
+        """Provides full URL to the provided sys_id
+
+        :param sys_id: sys_id to generate URL for
+        :return: full sys_id URL
+        """
+
+        return "%s/%s" % (self._url_builder.get_url(), sys_id)
+
+    async def get(self, *args, **kwargs):
+        """Queries the API resource
+
+        :param args:
+            - :param query: Dictionary, string or :class:`QueryBuilder` object
+                            defaults to empty dict (all)
+
+        :param kwargs:
+            - :param limit: Limits the number of records returned
+            - :param fields: List of fields to include in the response
+            - :param offset: Number of records to skip before returning records
+
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._request.get(*args, **kwargs)
+
+    async def create(self, payload):
+        """Creates a new record in the API resource
+
+        :param payload: Dictionary containing key-value fields of the new record
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._request.create(payload)
+
+    async def update(self, query, payload):
+        """Updates a record in the API resource
+
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :param payload: Dictionary containing key-value fields of the record to be updated
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._request.update(query, payload)
+
+    async def update_by_sys_id(self, sys_id, payload):
+        """Updates the record with the given sys_id, without performing a lookup request first
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary containing key-value fields of the record to be updated
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._request.update_by_sys_id(sys_id, payload)
+
+    async def patch(self, sys_id, payload, record=None):
+        """Partially updates the record with the given sys_id using PATCH
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary containing key-value fields of the record to be updated
+        :param record: (optional) Dictionary of the previously fetched record, only changed fields are sent
+        :return:
+            - :class:`AsyncResponse` object, or None if nothing changed
+        """
+
+        return await self._request.patch(sys_id, payload, record=record)
+
+    async def delete(self, query):
+        """Deletes matching record
+
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :return:
+            - Dictionary containing information about deletion result
+        """
+
+        return await self._request.delete(query)
+
+    async def delete_by_sys_id(self, sys_id):
+        """Deletes the record with the given sys_id, without performing a lookup request first
+
+        :param sys_id: sys_id of the record to delete
+        :return:
+            - Dictionary containing information about deletion result
+        """
+
+        return await self._request.delete_by_sys_id(sys_id)
+
+    async def request(self, method, path_append=None, headers=None, **kwargs):
+        """Create a custom request
+
+        :param method: HTTP method to use
+        :param path_append: (optional) relative to :attr:`api_path`
+        :param headers: (optional) Dictionary of headers to add or override
+        :param kwargs: kwargs to pass along to :meth:`aiohttp.ClientSession.request`
+        :return:
+            - :class:`AsyncResponse` object
+        """
+
+        return await self._request.custom(
+            method, path_append=path_append, headers=headers, **kwargs
+        )
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+from ..parser import get_backend, get_parser
+from ..exceptions import (
+    NoResults,
+    InvalidUsage,
+    MultipleResults,
+    EmptyContent,
+)
+
+
+class AsyncResponse(object):
+    """Takes a :class:`aiohttp.ClientResponse` object and performs deserialization and validation.
+
+    Records are parsed incrementally from the response stream, either by iterating over the response with
+    `async for`, or by awaiting one of the accessor methods.
+
+    The body is read once, by a single parser. Records read by the accessor methods are kept, so :meth:`one` and
+    the convenience methods can be called again, e.g. :meth:`one` followed by :meth:`update`. :meth:`first` and
+    :meth:`one` release the connection once they have read enough records, after which only the kept records can
+    be read. Records yielded by `async for` are not kept.
+
+    :param response: :class:`aiohttp.ClientResponse` object
+    :param resource: parent :class:`aio.AsyncResource` object
+    :param chunk_size: Read and return up to this size (in bytes) in the stream parser
+    :param parser_backend: (optional) ijson backend module used by the stream parser, defaults to the fastest available
+    :param parser_options: (optional) Dictionary of options to pass along to :func:`parser.get_parser`
+    """
+
+    def __init__(
+        self,
+        response,
+        resource,
+        chunk_size=8192,
+        parser_backend=None,
+        parser_options=None,
+    ):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._parser_backend = parser_backend or get_backend()
+        self._parser_options = parser_options or {}
+        self._count = 0
+        self._resource = resource
+        self._parser = None
+        self._records = []
+        self._done = False
+        self._closed = None
+        self._error = None
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    @property
+    def status_code(self):
+        return self._response.status
+
+    @property
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, count):
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise TypeError("Count must be an integer")
+
+        self._count = count
+
+    def __repr__(self):
+        return "<%s [%d - %s]>" % (
+            self.__class__.__name__,
+            self._response.status,
+            self._response.method,
+        )
+
+    def __aiter__(self):
+        return self._iter_records()
+
+    def _get_response(self):
+        response = self._response
+
+        # Raise a ClientResponseError if we hit a non-200 status code
+        response.raise_for_status()
+
+        if response.method == "GET" and response.status == 202:
+            # GET request with a "202: no content" response: Raise NoContent Exception.
+            raise EmptyContent(
+                "Unexpected empty content in response for GET request: {}".format(
+                    response.url
+                )
+            )
+
+        return response
+
+    async def _parse_response(self):
+        """Parses the response stream using the async ijson parser
+
+        :raise:
+            - ResponseError: If there's an error in the response
+            - MissingResult: If no result nor error was found
+        """
+
+        response = self._get_response()
+        parser = get_parser(**self._parser_options)
+
+        try:
+            async for prefix, event, value in self._parser_backend.parse_async(
+                response.content, buf_size=self._chunk_size
+            ):
+                record = parser.feed(prefix, event, value)
+
+                if record is not None:
+                    self.count += 1
+                    yield record
+        finally:
+            response.release()
+
+        parser.close()
+
+    def _get_parser(self):
+        """Returns the parser shared by the accessor methods and `async for`"""
+
+        if self._parser is None:
+            response = self._get_response()
+
+            if response.method == "DELETE" and response.status == 204:
+                response.release()
+                self._records = [{"status": "record deleted"}]
+                self._done = True
+
+            self._parser = self._parse_response()
+
+        return self._parser
+
+    async def _get_records(self, limit=None, release=False):
+        """Returns up to `limit` records, parsing those that weren't read yet and keeping them
+
+        :param limit: (optional) Maximum number of records to return
+        :param release: Whether or not to release the connection once `limit` records were read
+        :return: List of records
+        :raise:
+            - InvalidUsage: If more records are needed after the connection was released
+        """
+
+        parser = self._get_parser()
+
+        while not self._done and (limit is None or len(self._records) < limit):
+            if self._error is not None:
+                # The parser is finished, and would otherwise look like it reached the end
+                raise self._error
+            elif self._closed is not None:
+                raise InvalidUsage(self._closed)
+
+            try:
+                record = await parser.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+            except Exception as error:
+                self._error = error
+                raise
+            else:
+                self._records.append(record)
+
+        if release and not self._done:
+            self._closed = "The connection was released after reading the first records"
+            await parser.aclose()
+
+        return self._records[:limit]
+
+    async def _iter_records(self):
+        """Yields the kept records, followed by those left in the stream, which are not kept"""
+
+        self._get_parser()
+
+        for record in list(self._records):
+            yield record
+
+        if self._done:
+            return
+        elif self._closed is not None:
+            raise InvalidUsage(self._closed)
+
+        self._closed = "The records were iterated over with `async for`, and not kept"
+
+        async for record in self._get_parser():
+            yield record
+
+        self._done = True
+
+    async def all(self):
+        """Returns a list containing all matching records. Iterate over the response using `async for` to
+        process records as they arrive instead.
+
+        :return:
+            - List of records
+        """
+
+        return await self._get_records()
+
+    async def first(self):
+        """Return the first record or raise an exception if the result doesn't contain any data
+
+        :return:
+            - Dictionary containing the first item in the response content
+
+        :raise:
+            - NoResults: If no results were found
+        """
+
+        records = await self._get_records(limit=1, release=True)
+
+        if not records:
+            raise NoResults("No records found")
+
+        return records[0]
+
+    async def first_or_none(self):
+        """Return the first record or None
+
+        :return:
+            - Dictionary containing the first item or None
+        """
+
+        try:
+            return await self.first()
+        except NoResults:
+            return None
+
+    async def one(self):
+        """Return exactly one record or raise an exception.
+
+        :return:
+            - Dictionary containing the only item in the response content
+
+        :raise:
+            - MultipleResults: If more than one records are present in the content
+            - NoResults: If the result is empty
+        """
+
+        records = await self._get_records(limit=2, release=True)
+
+        if not records:
+            raise NoResults("No records found")
+        elif len(records) > 1:
+            raise MultipleResults("Expected single-record result, got multiple")
+
+        return records[0]
+
+    async def one_or_none(self):
+        """Return at most one record or raise an exception.
+
+        :return:
+            - Dictionary containing the matching record or None
+
+        :raise:
+            - MultipleResults: If more than one records are present in the content
+        """
+
+        try:
+            return await self.one()
+        except NoResults:
+            return None
+
+    async def update(self, payload):
+        """Convenience method for updating a fetched record
+
+        :param payload: update payload
+        :return: update response object
+        """
+
+        record = await self.one()
+
+        return await self._resource.update_by_sys_id(record["sys_id"], payload)
+
+    async def patch(self, payload):
+        """Convenience method for partially updating a fetched record, sending only fields that changed
+
+        :param payload: update payload
+        :return: patch response object, or None if nothing changed
+        """
+
+        record = await self.one()
+
+        return await self._resource.patch(record["sys_id"], payload, record=record)
+
+    async def delete(self):
+        """Convenience method for deleting a fetched record
+
+        :return: delete response object
+        """
+
+        record = await self.one()
+
+        return await self._resource.delete_by_sys_id(record["sys_id"])
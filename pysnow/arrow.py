@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+
+def require_pyarrow():
+    """Imports pyarrow on first use, rather than along with pysnow, as it's slow to import
+
+    :return:
+        - The :mod:`pyarrow` module, with :mod:`pyarrow.parquet` imported
+    :raise:
+        - ImportError: If pyarrow isn't installed
+    """
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet support, install it with: pip install pysnow[arrow]"
+        )
+
+    return pyarrow
+
+
+def _get_array(pyarrow, values, type_=None):
+    if type_ is None:
+        array = pyarrow.array(values)
+
+        # All-null columns of the first batch are assumed to be strings
+        return (
+            array.cast(pyarrow.string()) if pyarrow.types.is_null(array.type) else array
+        )
+    elif pyarrow.types.is_string(type_) or pyarrow.types.is_large_string(type_):
+        return pyarrow.array(values, type=type_)
+
+    values = [None if value in ("", None) else value for value in values]
+
+    try:
+        return pyarrow.array(values, type=type_)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # ServiceNow serializes values as strings, let Arrow parse them
+        return pyarrow.array(values, type=pyarrow.string()).cast(type_)
+
+
+def get_record_batch(columns, schema=None):
+    """Creates an Arrow record batch from columns
+
+    :param columns: Dictionary of field names and columns, as returned by :meth:`columns.ColumnParser.flush`
+    :param schema: (optional) :class:`pyarrow.Schema` to convert the columns to, inferred if not given
+    :return:
+        - :class:`pyarrow.RecordBatch` object
+    """
+
+    pyarrow = require_pyarrow()
+
+    if schema is None:
+        return pyarrow.RecordBatch.from_arrays(
+            [_get_array(pyarrow, column) for column in columns.values()],
+            names=list(columns),
+        )
+
+    return pyarrow.RecordBatch.from_arrays(
+        [_get_array(pyarrow, columns[field.name], field.type) for field in schema],
+        schema=schema,
+    )
+
+
+def write_parquet(batches, where, schema=None):
+    """Writes record batches to a Parquet file as they are produced
+
+    :param batches: Iterable of :class:`pyarrow.RecordBatch` objects
+    :param where: Path or file-like object to write to
+    :param schema: (optional) :class:`pyarrow.Schema` of the file if there are no batches
+    :return: Number of rows written
+    """
+
+    pyarrow = require_pyarrow()
+    writer = None
+    rows = 0
+
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(where, batch.schema)
+
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+        if writer is None and schema is not None:
+            writer = pyarrow.parquet.ParquetWriter(where, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
@@ -90,4 +90,4 @@ class Attachment(object):
         :return: delete result
         """
 
-        return self.resource.delete(query={"sys_id": sys_id})
+        return self.resource.delete_by_sys_id(sys_id)
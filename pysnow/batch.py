@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import logging
+import io
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from .response import Response
+from .codec import get_codec
+from .exceptions import InvalidUsage, UnservicedRequest
+
+logger = logging.getLogger("pysnow")
+
+
+class BatchRequest(object):
+    """A request queued in a :class:`Batch`
+
+    :param request_id: Identifier of the request within the batch
+    :param method: HTTP method
+    :param url: Full URL of the request
+    :param body: (optional) Request body (bytes)
+    :param resource: :class:`resource.Resource` the request was made on
+    """
+
+    def __init__(self, request_id, method, url, body, resource):
+        self.id = request_id
+        self.method = method
+        self.url = url
+        self.body = body
+        self.resource = resource
+        self.sent = False
+        self._response = None
+
+    def __repr__(self):
+        return "<%s [%s - %s]>" % (self.__class__.__name__, self.id, self.method)
+
+    @property
+    def response(self):
+        """Returns a :class:`pysnow.Response` object for the serviced request
+
+        :raise:
+            - InvalidUsage: If the batch hasn't been sent
+            - UnservicedRequest: If ServiceNow didn't service the request
+        """
+
+        if not self.sent:
+            raise InvalidUsage("The batch containing %s hasn't been sent" % self)
+        elif self._response is None:
+            raise UnservicedRequest("%s was not serviced by ServiceNow" % self)
+
+        return Response(
+            response=self._response,
+            resource=self.resource,
+            chunk_size=self.resource.kwargs.get("chunk_size") or 8192,
+            parser_backend=self.resource.kwargs.get("parser_backend"),
+            json_codec=self.resource.kwargs.get("json_codec"),
+        )
+
+    def as_dict(self, base_url):
+        """Returns the request in the Batch API `rest_requests` format
+
+        :param base_url: Base URL to strip from the request URL
+        :return: Dictionary
+        """
+
+        request = {
+            "id": self.id,
+            "method": self.method,
+            "url": self.url[len(base_url) :],
+            "headers": [
+                {"name": "Content-Type", "value": "application/json"},
+                {"name": "Accept", "value": "application/json"},
+            ],
+        }
+
+        if self.body is not None:
+            request["body"] = base64.b64encode(self.body).decode("ascii")
+
+        return request
+
+    def set_response(self, serviced):
+        """Creates a :class:`requests.Response` from an item in the Batch API `serviced_requests` list
+
+        :param serviced: Dictionary describing the serviced request
+        """
+
+        content = base64.b64decode(serviced.get("body") or "")
+
+        response = requests.Response()
+        response.status_code = serviced["status_code"]
+        response.reason = serviced.get("status_text")
+        response.headers = CaseInsensitiveDict(
+            (header["name"], header["value"]) for header in serviced.get("headers", [])
+        )
+        response.url = self.url
+        response.encoding = "utf-8"
+        response.request = requests.Request(self.method, self.url).prepare()
+        response.raw = io.BytesIO(content)
+        response._content = content
+
+        self._response = response
+
+
+class Batch(object):
+    """Queues requests and sends them to the ServiceNow Batch API, up to `max_requests` per HTTP request.
+
+    Queued requests are sent when leaving the context, or by calling :meth:`send`.
+
+    :param session: :class:`requests.Session` object
+    :param base_url: Base URL of the instance
+    :param base_path: Base path of the Batch API
+    :param max_requests: Maximum number of requests to send in one batch
+    :param timeout: Timeout of each batch request
+    :param json_codec: (optional) :class:`codec.JSONCodec` object, defaults to the fastest available
+    """
+
+    def __init__(
+        self,
+        session,
+        base_url,
+        base_path="/api/now",
+        max_requests=100,
+        timeout=60,
+        json_codec=None,
+    ):
+        if (
+            not isinstance(max_requests, int)
+            or isinstance(max_requests, bool)
+            or max_requests < 1
+        ):
+            raise InvalidUsage("Argument 'max_requests' must be a positive integer")
+
+        self._session = session
+        self._base_url = base_url
+        self._url = "%s%s/v1/batch" % (base_url, base_path)
+        self._timeout = timeout
+        self._codec = json_codec or get_codec()
+        self._sent = 0
+
+        self.max_requests = max_requests
+        self.queue = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if exc_type is None:
+            self.send()
+
+    def _add(self, resource, method, path_append=None, payload=None):
+        request = resource._request
+        url = request._url
+
+        if path_append is not None:
+            url = request._get_custom_endpoint(path_append)
+
+        params = request._parameters.as_dict()
+        url = requests.Request(method, url, params=params).prepare().url
+        body = None
+
+        if payload is not None:
+            body = self._codec.dumps(payload)
+
+        batch_request = BatchRequest(
+            str(self._sent + len(self.queue) + 1), method, url, body, resource
+        )
+        self.queue.append(batch_request)
+
+        return batch_request
+
+    def create(self, resource, payload):
+        """Queues the creation of a new record
+
+        :param resource: :class:`resource.Resource` to create the record in
+        :param payload: Dictionary payload
+        :return:
+            - :class:`BatchRequest` object
+        """
+
+        return self._add(resource, "POST", payload=payload)
+
+    def update(self, resource, sys_id, payload):
+        """Queues an update of the record with the given sys_id
+
+        :param resource: :class:`resource.Resource` of the record
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary payload
+        :return:
+            - :class:`BatchRequest` object
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        return self._add(resource, "PUT", path_append=sys_id, payload=payload)
+
+    def delete(self, resource, sys_id):
+        """Queues the deletion of the record with the given sys_id
+
+        :param resource: :class:`resource.Resource` of the record
+        :param sys_id: sys_id of the record to delete
+        :return:
+            - :class:`BatchRequest` object
+        """
+
+        return self._add(resource, "DELETE", path_append=sys_id)
+
+    def request(self, resource, method, path_append=None, payload=None):
+        """Queues a custom request
+
+        :param resource: :class:`resource.Resource` to send the request to
+        :param method: HTTP method
+        :param path_append: (optional) append path to resource.api_path
+        :param payload: (optional) Dictionary payload
+        :return:
+            - :class:`BatchRequest` object
+        """
+
+        return self._add(resource, method, path_append=path_append, payload=payload)
+
+    def _send_chunk(self, chunk):
+        requests_by_id = dict((r.id, r) for r in chunk)
+
+        logger.debug("(BATCH_SEND) Requests: %d" % len(chunk))
+
+        response = self._session.post(
+            self._url,
+            data=self._codec.dumps(
+                {
+                    "batch_request_id": chunk[0].id,
+                    "rest_requests": [r.as_dict(self._base_url) for r in chunk],
+                }
+            ),
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+
+        content = self._codec.loads(response.content)
+
+        for serviced in content.get("serviced_requests", []):
+            requests_by_id[serviced["id"]].set_response(serviced)
+
+        for request in chunk:
+            request.sent = True
+
+    def send(self):
+        """Sends all queued requests, `max_requests` at a time. Requests are removed from the queue once their batch
+        was sent, so if sending a batch fails, it and the following ones stay queued and can be sent again.
+
+        :return:
+            - List of sent :class:`BatchRequest` objects
+        :raise:
+            - HTTPError: If sending a batch failed
+        """
+
+        sent = []
+
+        while self.queue:
+            chunk = self.queue[: self.max_requests]
+            self._send_chunk(chunk)
+
+            del self.queue[: len(chunk)]
+            self._sent += len(chunk)
+            sent.extend(chunk)
+
+        return sent
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from copy import copy, deepcopy
+
+from .concurrency import bounded_map, size_pool, validate_concurrency
+from .exceptions import InvalidUsage
+
+logger = logging.getLogger("pysnow")
+
+
+class BulkResult(object):
+    """Outcome of a single operation in a bulk run
+
+    :param item: The item the operation was performed for, e.g. a sys_id or payload
+    :param response: :class:`pysnow.Response` object, if the operation succeeded
+    :param error: The exception raised by the operation, if it failed
+    """
+
+    __slots__ = ("item", "response", "error")
+
+    def __init__(self, item, response=None, error=None):
+        self.item = item
+        self.response = response
+        self.error = error
+
+    def __repr__(self):
+        return "<%s [%s]>" % (self.__class__.__name__, "ok" if self.ok else "failed")
+
+    @property
+    def ok(self):
+        """Whether or not the operation succeeded"""
+        return self.error is None
+
+    @classmethod
+    def from_future(cls, item, future):
+        """Creates a :class:`BulkResult` from a completed future
+
+        :param item: The item the operation was performed for
+        :param future: :class:`concurrent.futures.Future` of the operation
+        """
+
+        error = future.exception()
+
+        if error is not None:
+            return cls(item, error=error)
+
+        return cls(item, response=future.result())
+
+
+class BulkSummary(object):
+    """Summary of a bulk run
+
+    :param succeeded: List of items for which the operation succeeded
+    :param failed: List of :class:`BulkResult` objects for failed operations
+    """
+
+    def __init__(self, succeeded=None, failed=None):
+        self.succeeded = succeeded or []
+        self.failed = failed or []
+
+    def __repr__(self):
+        return "<%s [succeeded: %d, failed: %d]>" % (
+            self.__class__.__name__,
+            len(self.succeeded),
+            len(self.failed),
+        )
+
+
+def update_many(resource, query, payload, concurrency=4, method="PATCH", limit=1000):
+    """Updates all records matching `query` with `payload`
+
+    Matching sys_ids are streamed using keyset pagination on sys_id, which is unaffected by records leaving the
+    result set as they are updated. Updates are sent by sys_id with at most `concurrency` requests in flight.
+
+    :param resource: :class:`pysnow.Resource` object
+    :param query: Dictionary, string or :class:`QueryBuilder` object
+    :param payload: Dictionary payload
+    :param concurrency: Maximum number of concurrent update requests
+    :param method: PATCH (default) or PUT
+    :param limit: Page size of the sys_id lookup
+    :return:
+        - :class:`BulkSummary` object
+    """
+
+    if not isinstance(payload, dict):
+        raise InvalidUsage("Update payload must be of type dict")
+    elif method not in ("PATCH", "PUT"):
+        raise InvalidUsage("Argument 'method' must be either PATCH or PUT")
+
+    validate_concurrency(concurrency)
+    size_pool(resource.kwargs.get("session"), concurrency)
+
+    # Requests of a resource share its parameters, which the lookup sets and the pager rewrites from page to page
+    lookup = copy(resource)
+    lookup.parameters = deepcopy(resource.parameters)
+
+    response = lookup.get(
+        query, fields=["sys_id"], stream=True, keyset="sys_id", limit=limit
+    )
+    sys_ids = (record["sys_id"] for record in response.all())
+
+    def update(sys_id):
+        if method == "PATCH":
+            result = resource.patch(sys_id, payload)
+        else:
+            result = resource.update_by_sys_id(sys_id, payload)
+
+        # Validate the response in the worker, so that errors end up in the summary
+        result.one()
+        return result
+
+    summary = BulkSummary()
+
+    for sys_id, future in bounded_map(update, sys_ids, concurrency, ordered=False):
+        result = BulkResult.from_future(sys_id, future)
+
+        if result.ok:
+            summary.succeeded.append(sys_id)
+        else:
+            logger.debug(
+                "(BULK_UPDATE_FAIL) sys_id: %s, Error: %s" % (sys_id, result.error)
+            )
+            summary.failed.append(result)
+
+    return summary
+
+
+def create_many(resource, payloads, concurrency=4, ordered=False):
+    """Creates a record for each payload in `payloads`, with at most `concurrency` requests in flight
+
+    Payloads are consumed lazily, so `payloads` can be a generator of any size.
+
+    :param resource: :class:`pysnow.Resource` object
+    :param payloads: Iterable of dictionary payloads
+    :param concurrency: Maximum number of concurrent create requests
+    :param ordered: Yield results in input order if True, otherwise as requests complete
+    :return:
+        - Generator of :class:`BulkResult` objects
+    """
+
+    validate_concurrency(concurrency)
+    size_pool(resource.kwargs.get("session"), concurrency)
+
+    def create(payload):
+        result = resource.create(payload)
+
+        # Validate the response in the worker, so that errors end up in the result
+        result.one()
+        return result
+
+    def results():
+        for payload, future in bounded_map(
+            create, payloads, concurrency, ordered=ordered
+        ):
+            yield BulkResult.from_future(payload, future)
+
+    return results()
@@ -11,8 +11,12 @@ from requests.auth import HTTPBasicAuth
 from .legacy_request import LegacyRequest
 from .exceptions import InvalidUsage
 from .resource import Resource
+from .batch import Batch
+from .import_set import ImportSet
 from .url_builder import URLBuilder
 from .params_builder import ParamsBuilder
+from .parser import get_backend
+from .codec import get_codec
 
 logger = logging.getLogger("pysnow")
 
@@ -28,6 +32,8 @@ class Client(object):
     :param request_params: Request params to send with requests globally (deprecated)
     :param use_ssl: Enable or disable the use of SSL, defaults to True
     :param session: Optional :class:`requests.Session` object to use instead of passing user/pass to :class:`Client`
+    :param json_codec: (optional) Name of the JSON library used to encode payloads and decode buffered responses,
+        one of `orjson`, `ujson`, `simdjson` or `json`. Defaults to the fastest available
     :raises:
         - InvalidUsage: On argument validation error
     """
@@ -42,6 +48,7 @@ class Client(object):
         request_params=None,
         use_ssl=True,
         session=None,
+        json_codec=None,
     ):
 
         if (host and instance) is not None:
@@ -96,6 +103,7 @@ class Client(object):
         self._password = password
         self.use_ssl = use_ssl
         self.base_url = URLBuilder.get_base_url(use_ssl, instance, host)
+        self.json_codec = get_codec(json_codec)
 
         if not isinstance(self, pysnow.OAuthClient):
             self.session = self._get_session(session)
@@ -160,20 +168,29 @@ class Client(object):
             session=self.session,
             instance=self.instance,
             base_url=self.base_url,
+            json_codec=self.json_codec,
             **kwargs
         )
 
-    def resource(self, api_path=None, base_path="/api/now", chunk_size=None, **kwargs):
+    def resource(
+        self,
+        api_path=None,
+        base_path="/api/now",
+        chunk_size=None,
+        parser_backend=None,
+        **kwargs
+    ):
         """Creates a new :class:`Resource` object after validating paths
 
         :param api_path: Path to the API to operate on
         :param base_path: (optional) Base path override
         :param chunk_size: Response stream parser chunk size (in bytes)
+        :param parser_backend: (optional) Name of the ijson backend to use, defaults to the fastest available
         :param **kwargs: Pass request.request parameters to the Resource object
         :return:
             - :class:`Resource` object
         :raises:
-            - InvalidUsage: If a path fails validation
+            - InvalidUsage: If a path or the parser backend fails validation
         """
 
         for path in [api_path, base_path]:
@@ -184,11 +201,61 @@ class Client(object):
             base_path=base_path,
             parameters=self.parameters,
             chunk_size=chunk_size or 8192,
+            parser_backend=get_backend(parser_backend),
+            json_codec=self.json_codec,
             session=self.session,
             base_url=self.base_url,
             **kwargs
         )
 
+    def import_set(
+        self, table_name, base_path="/api/now", chunk_size=None, parser_backend=None
+    ):
+        """Creates a new :class:`ImportSet` object for loading records into a staging table
+
+        :param table_name: Name of the staging table
+        :param base_path: (optional) Base path override
+        :param chunk_size: Response stream parser chunk size (in bytes)
+        :param parser_backend: (optional) Name of the ijson backend to use, defaults to the fastest available
+        :return:
+            - :class:`ImportSet` object
+        :raises:
+            - InvalidUsage: If a path fails validation
+        """
+
+        resource = self.resource(
+            api_path="/import/%s" % table_name,
+            base_path=base_path,
+            chunk_size=chunk_size,
+            parser_backend=parser_backend,
+        )
+
+        return ImportSet(resource, table_name)
+
+    def batch(self, max_requests=100, base_path="/api/now", timeout=60):
+        """Creates a new :class:`Batch` object for sending create, update and delete requests to the
+        ServiceNow Batch API, bundling up to `max_requests` requests per HTTP round trip.
+
+        :param max_requests: Maximum number of requests to send in one batch
+        :param base_path: (optional) Base path override
+        :param timeout: (optional) Timeout of each batch request
+        :return:
+            - :class:`Batch` object
+        :raises:
+            - InvalidUsage: If a path fails validation
+        """
+
+        URLBuilder.validate_path(base_path)
+
+        return Batch(
+            session=self.session,
+            base_url=self.base_url,
+            base_path=base_path,
+            max_requests=max_requests,
+            timeout=timeout,
+            json_codec=self.json_codec,
+        )
+
     def query(self, table, **kwargs):
         """Query (GET) request wrapper.
 
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import json
+
+from .exceptions import InvalidUsage
+
+# JSON libraries, fastest first
+CODECS = ("orjson", "ujson", "simdjson", "json")
+
+_codecs = {}
+
+
+class JSONCodec(object):
+    """Encodes to and decodes from JSON bytes, using the given library functions
+
+    :param name: Name of the library
+    :param dumps: Function serializing an object to bytes
+    :param loads: Function deserializing bytes
+    """
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return "<%s [%s]>" % (self.__class__.__name__, self.name)
+
+
+def _json_dumps(obj):
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    # Bytes are accepted by json.loads from Python 3.6
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+
+    return json.loads(data)
+
+
+def _create_codec(name):
+    if name == "json":
+        return JSONCodec(name, _json_dumps, _json_loads)
+
+    module = importlib.import_module(name)
+
+    if name == "orjson":
+        return JSONCodec(name, module.dumps, module.loads)
+    elif name == "ujson":
+        return JSONCodec(
+            name,
+            lambda obj: module.dumps(obj, ensure_ascii=False).encode("utf-8"),
+            module.loads,
+        )
+
+    # simdjson only decodes
+    return JSONCodec(name, _json_dumps, module.loads)
+
+
+def _import_codec(name):
+    if name not in _codecs:
+        try:
+            _codecs[name] = _create_codec(name)
+        except ImportError:
+            _codecs[name] = None
+
+    return _codecs[name]
+
+
+def get_codec(name=None):
+    """Returns a JSON codec
+
+    :param name: (optional) Name of the JSON library, defaults to the fastest one available
+    :return:
+        - :class:`JSONCodec` object
+    :raise:
+        - InvalidUsage: If the library is unknown or unavailable
+    """
+
+    if name is None:
+        for candidate in CODECS:
+            codec = _import_codec(candidate)
+            if codec is not None:
+                return codec
+    elif name not in CODECS:
+        raise InvalidUsage(
+            "Unknown JSON codec '%s', expected one of: %s" % (name, ", ".join(CODECS))
+        )
+
+    codec = _import_codec(name)
+
+    if codec is None:
+        raise InvalidUsage("JSON codec '%s' is not available" % name)
+
+    return codec
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+import array
+
+from collections import OrderedDict
+from functools import partial
+
+import six
+
+from .parser import ResultParser
+from .record import get_value
+from .exceptions import InvalidUsage
+
+# Array typecodes of common dtype names, used when NumPy isn't available
+TYPECODES = {
+    "float64": "d",
+    "float32": "f",
+    "int64": "q" if six.PY3 else "l",
+    "int32": "i",
+    "int16": "h",
+    "int8": "b",
+    "uint8": "B",
+    "bool": "B",
+    float: "d",
+    int: "q" if six.PY3 else "l",
+    bool: "B",
+}
+
+FALSE_VALUES = frozenset(["", "false", "0", False, 0, None])
+
+
+def get_numpy():
+    """Imports NumPy on first use, rather than along with pysnow, as it's slow to import
+
+    :return:
+        - The :mod:`numpy` module, or None if NumPy isn't installed
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class Column(object):
+    """Growable column of values, converted to `dtype` as they are appended.
+
+    Numeric and boolean columns are stored in an :class:`array.array` and exposed to NumPy without copying.
+    Other columns are stored in a list, and converted to `dtype` as a whole when finished, e.g. to parse dates.
+
+    :param name: Name of the field
+    :param dtype: (optional) NumPy dtype, or an :mod:`array` typecode if NumPy isn't installed
+    :param converter: (optional) Function to convert each value with, if there's no dtype
+    """
+
+    def __init__(self, name, dtype=None, converter=None):
+        self.name = name
+        self._dtype = None
+        self._typecode = None
+        self._kind = None
+        self._converter = converter
+
+        if dtype is not None:
+            self._set_dtype(dtype)
+
+        self._data = array.array(self._typecode) if self._typecode else []
+
+    def __len__(self):
+        return len(self._data)
+
+    def _set_dtype(self, dtype):
+        numpy = get_numpy()
+
+        if numpy is not None:
+            try:
+                self._dtype = numpy.dtype(dtype)
+            except TypeError:
+                raise InvalidUsage(
+                    "Invalid dtype for field '%s': %r" % (self.name, dtype)
+                )
+
+            self._kind = self._dtype.kind
+            typecode = "B" if self._kind == "b" else self._dtype.char
+
+            if (
+                self._kind in "biuf"
+                and typecode in array.typecodes
+                and array.array(typecode).itemsize == self._dtype.itemsize
+            ):
+                self._typecode = typecode
+        else:
+            typecode = TYPECODES.get(dtype, dtype)
+
+            if not isinstance(typecode, str) or typecode not in array.typecodes:
+                raise InvalidUsage(
+                    "Invalid dtype for field '%s': %r, expected an array typecode "
+                    "(install NumPy for dtype support)" % (self.name, dtype)
+                )
+
+            self._typecode = typecode
+
+            if dtype in ("bool", bool):
+                self._kind = "b"
+            elif typecode in "fd":
+                self._kind = "f"
+            else:
+                self._kind = "i"
+
+    def _convert(self, value):
+        if self._kind == "b":
+            return value not in FALSE_VALUES
+        elif self._kind == "f":
+            return float("nan") if value in ("", None) else float(value)
+        elif value in ("", None):
+            raise InvalidUsage(
+                "Field '%s' has empty values and cannot be converted to an integer column, "
+                "use a float or object dtype instead" % self.name
+            )
+
+        return int(value)
+
+    def append(self, value):
+        """Appends a value to the column
+
+        :param value: Value to append
+        """
+
+        if self._typecode is not None:
+            value = self._convert(value)
+        elif self._converter is not None:
+            value = self._converter(value)
+
+        self._data.append(value)
+
+    def finish(self):
+        """Returns the column data
+
+        :return:
+            - NumPy array if NumPy is installed, otherwise an :class:`array.array` or list
+        """
+
+        data = self._data
+        numpy = get_numpy()
+
+        if numpy is None:
+            return data
+        elif self._typecode is not None:
+            if not data:
+                return numpy.empty(0, dtype=self._dtype)
+
+            return numpy.frombuffer(data, dtype=self._dtype)
+        elif self._dtype is not None:
+            return numpy.asarray(data, dtype=self._dtype)
+
+        column = numpy.empty(len(data), dtype=object)
+
+        for i, value in enumerate(data):
+            column[i] = value
+
+        return column
+
+
+class ColumnParser(ResultParser):
+    """Builds columns of `fields` straight from the ijson events of a ServiceNow response, without creating a
+    dictionary per record. Reference and display value objects are reduced to their `value`, and fields missing
+    from a record are set to None.
+
+    :param fields: List of fields to build columns for
+    :param dtypes: (optional) Dictionary of field names and dtypes
+    :param batch_size: (optional) Number of rows after which the columns are returned by :meth:`feed`
+    :param intern: (optional) :class:`parser.InternTable` to pass keys and string values through
+    :param schema: (optional) :class:`schema.Schema` of field types, used for the dtypes of fields not in `dtypes`.
+        Fields whose types have no dtype without NumPy are converted value by value instead
+    """
+
+    def __init__(self, fields, dtypes=None, batch_size=None, intern=None, schema=None):
+        if isinstance(fields, six.string_types) or not fields:
+            raise InvalidUsage("Argument 'fields' must be a list of field names")
+
+        super(ColumnParser, self).__init__(
+            fields=fields, intern=intern, references="value"
+        )
+
+        self._names = list(fields)
+        self._dtypes = dict(dtypes or {})
+        self._converters = {}
+        self._batch_size = batch_size
+
+        for name in self._dtypes:
+            if name not in self._fields:
+                raise InvalidUsage("dtype given for unknown field '%s'" % name)
+
+        if schema is not None:
+            numpy = get_numpy()
+
+            for name in self._names:
+                dtype = schema.get_dtype(name)
+
+                if dtype is None or name in self._dtypes:
+                    continue
+                elif numpy is not None or dtype in TYPECODES:
+                    self._dtypes[name] = dtype
+                else:
+                    self._converters[name] = partial(schema.convert, name)
+
+        self.rows = 0
+        self.columns = self._get_columns()
+
+    def _get_columns(self):
+        return OrderedDict(
+            (name, Column(name, self._dtypes.get(name), self._converters.get(name)))
+            for name in self._names
+        )
+
+    def _new_record(self):
+        # Values are appended to the columns, there's no record object
+        return None
+
+    def _set_field(self, record, key, value):
+        self.columns[key].append(get_value(value))
+
+    def _end_record(self, record):
+        self.rows += 1
+
+        for column in self.columns.values():
+            if len(column) < self.rows:
+                column.append(None)
+
+        if self._batch_size and self.rows >= self._batch_size:
+            return self.flush()
+
+        return None
+
+    def append(self, record):
+        """Appends a record to the columns
+
+        :param record: Dictionary
+        :return:
+            - Dictionary of columns if the batch is full, otherwise None
+        """
+
+        for name, column in self.columns.items():
+            column.append(get_value(record.get(name)))
+
+        self.count += 1
+        return self._end_record(None)
+
+    def flush(self):
+        """Returns the columns built so far, and starts new ones
+
+        :return:
+            - Ordered dictionary of field names and columns
+        """
+
+        columns = OrderedDict(
+            (name, column.finish()) for name, column in self.columns.items()
+        )
+
+        self.rows = 0
+        self.columns = self._get_columns()
+
+        return columns
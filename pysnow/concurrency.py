@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from requests.adapters import HTTPAdapter
+
+from .exceptions import InvalidUsage
+
+
+def validate_concurrency(value, name="concurrency"):
+    """Validates a worker count argument
+
+    :param value: number of workers
+    :param name: name of the argument, used in the exception message
+    :raise:
+        :InvalidUsage: If the value isn't a positive integer
+    """
+
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise InvalidUsage("Argument '%s' must be a positive integer" % name)
+
+    return value
+
+
+def size_pool(session, workers):
+    """Grows the connection pools of the session's HTTP adapters to hold at least `workers` connections per host.
+
+    requests keeps 10 connections per host by default, and discards those that don't fit in the pool once their
+    request completes, so concurrent requests beyond that would open a new connection each time.
+
+    :param session: :class:`requests.Session` object, or None
+    :param workers: number of concurrent requests
+    """
+
+    if session is None:
+        return
+
+    for adapter in session.adapters.values():
+        # Resized in place, to keep the configuration of custom adapters, e.g. retries
+        if isinstance(adapter, HTTPAdapter) and adapter._pool_maxsize < workers:
+            adapter.init_poolmanager(
+                adapter._pool_connections, workers, block=adapter._pool_block
+            )
+
+
+def bounded_map(func, iterable, workers, ordered=True):
+    """Calls `func` for each item in `iterable` using a thread pool, keeping at most `workers` calls in flight.
+
+    The iterable is consumed lazily, so items are only pulled as workers become available.
+
+    :param func: callable taking one item
+    :param iterable: items to process
+    :param workers: maximum number of concurrent calls
+    :param ordered: yield in input order if True, otherwise as calls complete
+    :return:
+        - Generator of (item, :class:`concurrent.futures.Future`) tuples
+    """
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+
+    def drain(until):
+        while len(pending) > until:
+            if ordered:
+                future, item = pending.popleft()
+                wait([future])
+                yield item, future
+                continue
+
+            done, _ = wait([f for f, _ in pending], return_when=FIRST_COMPLETED)
+
+            for future, item in [p for p in pending if p[0] in done]:
+                pending.remove((future, item))
+                yield item, future
+
+    try:
+        for item in iterable:
+            for completed in drain(workers - 1):
+                yield completed
+
+            pending.append((executor.submit(func, item), item))
+
+        for completed in drain(0):
+            yield completed
+    finally:
+        for future, _ in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
@@ -46,6 +46,10 @@ class MultipleResults(PysnowException):
     pass
 
 
+class UnservicedRequest(PysnowException):
+    pass
+
+
 class MissingToken(PysnowException):
     pass
 
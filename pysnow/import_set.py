@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from .codec import get_codec
+from .concurrency import bounded_map, size_pool, validate_concurrency
+from .exceptions import InvalidUsage
+
+BODY_START = b'{"records": ['
+BODY_END = b"]}"
+
+
+class ImportSet(object):
+    """Import Set API interface for loading records into a staging table, to be transformed by its transform maps
+
+    :param resource: :class:`resource.Resource` object of the Import Set API for the staging table
+    :param table_name: Name of the staging table
+    """
+
+    def __init__(self, resource, table_name):
+        self.resource = resource
+        self.table_name = table_name
+
+    def __repr__(self):
+        return "<%s [%s]>" % (self.__class__.__name__, self.table_name)
+
+    def insert(self, payload):
+        """Inserts a single record into the staging table
+
+        :param payload: Dictionary payload
+        :return:
+            - :class:`pysnow.Response` object containing the transform result
+        """
+
+        return self.resource.create(payload)
+
+    @staticmethod
+    def _get_chunks(records, chunk_size, max_bytes, codec=None):
+        """Serializes records and groups them into `insertMultiple` request bodies
+
+        :param records: Iterable of dictionaries
+        :param chunk_size: Maximum number of records per body
+        :param max_bytes: Maximum size of a body (in bytes)
+        :param codec: (optional) :class:`codec.JSONCodec` to serialize records with, defaults to the fastest available
+        :return: Generator of request bodies (bytes)
+        :raise:
+            - InvalidUsage: If a record doesn't fit in a body of `max_bytes`
+        """
+
+        dumps = (codec or get_codec()).dumps
+        envelope = len(BODY_START) + len(BODY_END)
+        chunk = []
+        size = envelope
+
+        for record in records:
+            serialized = dumps(record)
+
+            if envelope + len(serialized) > max_bytes:
+                raise InvalidUsage(
+                    "Record of %d bytes doesn't fit in a request body of max_bytes=%d"
+                    % (len(serialized), max_bytes)
+                )
+            elif chunk and (
+                len(chunk) >= chunk_size or size + 1 + len(serialized) > max_bytes
+            ):
+                yield BODY_START + b",".join(chunk) + BODY_END
+                chunk, size = [], envelope
+
+            # Records after the first are preceded by a comma
+            size += len(serialized) + (1 if chunk else 0)
+            chunk.append(serialized)
+
+        if chunk:
+            yield BODY_START + b",".join(chunk) + BODY_END
+
+    def _insert_chunk(self, body):
+        response = self.resource.request(
+            "POST", path_append="/insertMultiple", data=body, stream=True
+        )
+
+        return list(response.all())
+
+    def insert_multiple(
+        self, records, chunk_size=1000, max_bytes=5242880, concurrency=4
+    ):
+        """Streams records into the staging table using `insertMultiple`
+
+        Records are consumed lazily and sent in chunks bounded by both `chunk_size` and `max_bytes`, with up to
+        `concurrency` chunks in flight.
+
+        :param records: Iterable (e.g. generator) of dictionaries
+        :param chunk_size: Maximum number of records per request
+        :param max_bytes: Maximum size of a request body (in bytes)
+        :param concurrency: Maximum number of concurrent requests
+        :return:
+            - Generator of per-row transform results, in input order
+        :raise:
+            - InvalidUsage: If a record doesn't fit in a request body of `max_bytes`, when it's reached
+        """
+
+        validate_concurrency(chunk_size, "chunk_size")
+        validate_concurrency(max_bytes, "max_bytes")
+        validate_concurrency(concurrency)
+        size_pool(self.resource.kwargs.get("session"), concurrency)
+
+        chunks = self._get_chunks(
+            records, chunk_size, max_bytes, self.resource.kwargs.get("json_codec")
+        )
+
+        def results():
+            for _, future in bounded_map(self._insert_chunk, chunks, concurrency):
+                for row in future.result():
+                    yield row
+
+        return results()
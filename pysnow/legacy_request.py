@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import itertools
-import json
 import os
 import six
 import ntpath
@@ -17,6 +16,8 @@ from .legacy_exceptions import (
     UnexpectedResponse,
     MissingResult,
 )
+from .record import get_value
+from .codec import get_codec
 
 
 class LegacyRequest(object):
@@ -35,6 +36,7 @@ class LegacyRequest(object):
         self.request_params = kwargs.pop("request_params")
         self.raise_on_empty = kwargs.pop("raise_on_empty")
         self.session = kwargs.pop("session")
+        self.json_codec = kwargs.pop("json_codec", None) or get_codec()
         self._last_response = None
 
         if method in ("GET", "DELETE"):
@@ -160,7 +162,9 @@ class LegacyRequest(object):
         :return:
             - Created record
         """
-        response = self.session.post(self._get_table_url(), data=json.dumps(payload))
+        response = self.session.post(
+            self._get_table_url(), data=self.json_codec.dumps(payload)
+        )
         return self._get_content(response)
 
     def delete(self):
@@ -209,7 +213,8 @@ class LegacyRequest(object):
             raise InvalidUsage("Update payload must be of type dict")
 
         response = self.session.put(
-            self._get_table_url(sys_id=result["sys_id"]), data=json.dumps(payload)
+            self._get_table_url(sys_id=result["sys_id"]),
+            data=self.json_codec.dumps(payload),
         )
         return self._get_content(response)
 
@@ -247,11 +252,8 @@ class LegacyRequest(object):
                 continue
 
             item = response[field]
-            # Check if the item is of type dict and has a sys_id ref (value)
-            if isinstance(item, dict) and "value" in item:
-                payload[field] = item["value"]
-            else:
-                payload[field] = item
+            # Reduce references to their sys_id (value)
+            payload[field] = get_value(item)
 
         try:
             return self.insert(payload)
@@ -316,7 +318,7 @@ class LegacyRequest(object):
         server_error = {"summary": None, "details": None}
 
         try:
-            content_json = response.json()
+            content_json = self.json_codec.loads(response.content)
             if "error" in content_json:
                 e = content_json["error"]
                 if "message" in e:
@@ -116,12 +116,15 @@ class OAuthClient(Client):
             "You must set_token() before creating a legacy request with OAuthClient"
         )
 
-    def resource(self, api_path=None, base_path="/api/now", chunk_size=None):
+    def resource(
+        self, api_path=None, base_path="/api/now", chunk_size=None, parser_backend=None
+    ):
         """Overrides :meth:`resource` provided by :class:`pysnow.Client` with extras for OAuth
 
         :param api_path: Path to the API to operate on
         :param base_path: (optional) Base path override
         :param chunk_size: Response stream parser chunk size (in bytes)
+        :param parser_backend: (optional) Name of the ijson backend to use, defaults to the fastest available
         :return:
             - :class:`Resource` object
         :raises:
@@ -130,12 +133,33 @@ class OAuthClient(Client):
 
         if isinstance(self.token, dict):
             self.session = self._get_oauth_session()
-            return super(OAuthClient, self).resource(api_path, base_path, chunk_size)
+            return super(OAuthClient, self).resource(
+                api_path, base_path, chunk_size, parser_backend
+            )
 
         raise MissingToken(
             "You must set_token() before creating a resource with OAuthClient"
         )
 
+    def batch(self, *args, **kwargs):
+        """Overrides :meth:`batch` provided by :class:`pysnow.Client` with extras for OAuth
+
+        :param args: args to pass along to batch()
+        :param kwargs: kwargs to pass along to batch()
+        :return:
+            - :class:`Batch` object
+        :raises:
+            - MissingToken: If token hasn't been set
+        """
+
+        if isinstance(self.token, dict):
+            self.session = self._get_oauth_session()
+            return super(OAuthClient, self).batch(*args, **kwargs)
+
+        raise MissingToken(
+            "You must set_token() before creating a batch with OAuthClient"
+        )
+
     def generate_token(self, user, password):
         """Takes user and password credentials and generates a new token
 
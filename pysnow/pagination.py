@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import six
+
+from copy import deepcopy
+
+from .criterion import BasicCriterion, Criterion, Field, StringValueWrapper
+from .enums import Equality
+from .exceptions import InvalidUsage
+from .record import get_value
+
+
+class LinkPager(object):
+    """Follows the `next` link in the `Link` header of each page.
+
+    The next page can be requested as soon as the headers of the current one are available, hence `prefetch`.
+
+    :param request: :class:`request.SnowRequest` object used for sending requests
+    :param stream: Whether or not subsequent pages should be streamed
+    """
+
+    prefetch = True
+
+    def __init__(self, request, stream=False):
+        self._request = request
+        self._stream = stream
+
+    def next_page(self, response, last_record=None, count=None):
+        """Requests the page following `response`
+
+        :param response: :class:`requests.Response` of the current page
+        :return:
+            - :class:`requests.Response` of the next page, or None if this was the last page
+        """
+
+        if "next" not in response.links:
+            return None
+
+        return self._request._send(
+            "GET", response.links["next"]["url"], stream=self._stream
+        )
+
+
+class KeysetPager(object):
+    """Seeks past the last record of each page by adding `key > last_seen` to the query, rather than using offsets.
+
+    The records are ordered by `keys`, which should be an indexed, unique (combination of) field(s), such as
+    `sys_id` or `sys_updated_on,sys_id`.
+
+    :param request: :class:`request.SnowRequest` object used for sending requests
+    :param keys: List of fields to order and seek by
+    :param stream: Whether or not subsequent pages should be streamed
+    """
+
+    prefetch = False
+
+    def __init__(self, request, keys, stream=False):
+        if isinstance(keys, six.string_types):
+            keys = keys.split(",")
+
+        if not keys or not all(isinstance(k, six.string_types) and k for k in keys):
+            raise InvalidUsage("keyset must be a field name or a list of field names")
+
+        self._request = request
+        self._stream = stream
+        # The request shares its parameters with the resource, which may be used for other requests between pages
+        self._parameters = deepcopy(request._parameters)
+        self.keys = list(keys)
+        self.base_query = self._parameters.query
+
+        if "^NQ" in self.base_query or "ORDERBY" in self.base_query:
+            raise InvalidUsage(
+                "Keyset pagination cannot be combined with ^NQ or ORDERBY in the query"
+            )
+
+    @property
+    def ordering(self):
+        """Returns the ORDERBY part of the query"""
+
+        return "^".join(str(Field(key).order("asc")) for key in self.keys)
+
+    def get_query(self, last_record=None):
+        """Returns the query of the page following `last_record`, or the first page
+
+        :param last_record: Last record of the current page
+        :return: ServiceNow-compatible string-type query
+        """
+
+        if last_record is None:
+            return "^".join(filter(None, [self.base_query, self.ordering]))
+
+        branches = []
+
+        # (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+        for i, key in enumerate(self.keys):
+            seek = Criterion.all(
+                [
+                    BasicCriterion(
+                        Equality.eq, Field(k), self._get_value(last_record, k)
+                    )
+                    for k in self.keys[:i]
+                ]
+                + [
+                    BasicCriterion(
+                        Equality.gt, Field(key), self._get_value(last_record, key)
+                    )
+                ]
+            )
+
+            branches.append("^".join(filter(None, [self.base_query, str(seek)])))
+
+        return "^NQ".join(branches) + "^" + self.ordering
+
+    def _get_value(self, record, key):
+        if key not in record:
+            raise InvalidUsage("Keyset field '%s' missing in the response" % key)
+
+        return StringValueWrapper(get_value(record[key]))
+
+    def next_page(self, response, last_record=None, count=None):
+        """Requests the page following `last_record`
+
+        :param response: :class:`requests.Response` of the current page
+        :param last_record: Last record of the current page
+        :param count: Number of records in the current page
+        :return:
+            - :class:`requests.Response` of the next page, or None if this was the last page
+        """
+
+        if last_record is None or count < self._parameters.limit:
+            return None
+
+        self._parameters.query = self.get_query(last_record)
+
+        return self._request._send(
+            "GET",
+            self._request._url,
+            params=self._parameters.as_dict(),
+            stream=self._stream,
+        )
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+
+from collections import OrderedDict
+
+import six
+
+from ijson.common import ObjectBuilder
+
+from .record import DisplayValue, Reference, get_record_class
+from .schema import get_schema
+from .exceptions import ResponseError, MissingResult, InvalidUsage
+
+# ijson backends, fastest first
+BACKENDS = ("yajl2_c", "yajl2_cffi", "yajl2", "yajl", "python")
+
+# Values of the `references` and `display_values` options
+REFERENCES = ("value", "tuple")
+DISPLAY_VALUES = ("tuple",)
+
+_backends = {}
+
+
+def _import_backend(name):
+    if name not in _backends:
+        try:
+            _backends[name] = importlib.import_module("ijson.backends.%s" % name)
+        except ImportError:
+            _backends[name] = None
+
+    return _backends[name]
+
+
+def get_backend(name=None):
+    """Returns an ijson backend module
+
+    :param name: (optional) Name of the backend, defaults to the fastest one available
+    :return:
+        - ijson backend module
+    :raise:
+        - InvalidUsage: If the backend is unknown or unavailable
+    """
+
+    if name is None:
+        for candidate in BACKENDS:
+            backend = _import_backend(candidate)
+            if backend is not None:
+                return backend
+    elif name not in BACKENDS:
+        raise InvalidUsage(
+            "Unknown parser backend '%s', expected one of: %s"
+            % (name, ", ".join(BACKENDS))
+        )
+
+    backend = _import_backend(name)
+
+    if backend is None:
+        raise InvalidUsage("Parser backend '%s' is not available" % name)
+
+    return backend
+
+
+def get_backend_name(backend):
+    """Returns the name of an ijson backend module
+
+    :param backend: ijson backend module
+    :return: Backend name, e.g. `yajl2_c`
+    """
+
+    return backend.__name__.rsplit(".", 1)[-1]
+
+
+class InternTable(object):
+    """Bounded table of strings, used to make repeated values share one string object.
+
+    Strings longer than `max_length` are not interned, and the table is cleared when it reaches `max_size` entries.
+
+    :param max_size: Maximum number of strings in the table
+    :param max_length: Maximum length of the strings to intern
+    """
+
+    def __init__(self, max_size=10000, max_length=128):
+        self.max_size = max_size
+        self.max_length = max_length
+
+        self._table = {}
+
+    def __len__(self):
+        return len(self._table)
+
+    def __call__(self, value):
+        """Returns the interned equal of `value`
+
+        :param value: String
+        :return: String
+        """
+
+        if len(value) > self.max_length:
+            return value
+
+        table = self._table
+        interned = table.get(value)
+
+        if interned is None:
+            if len(table) >= self.max_size:
+                table.clear()
+
+            table[value] = interned = value
+
+        return interned
+
+
+class ResultParser(object):
+    """Incrementally builds records from the ijson events of a ServiceNow response.
+
+    Looks for `result.item` (array), `result` (object) and `error` (object) keys. Events are pushed one at a time,
+    which lets the same parser be driven by a blocking or an asynchronous event source.
+
+    Records are built field by field: scalar values are set as they arrive, flat objects such as references are
+    built into a dictionary directly, while nested objects and arrays are built with an
+    :class:`ijson.common.ObjectBuilder`. Subclasses can change what a record is by overriding :meth:`_new_record`,
+    :meth:`_set_field` and :meth:`_end_record`.
+
+    :param fields: (optional) List of fields to build, the events of other fields are discarded
+    :param intern: (optional) :class:`InternTable` to pass keys and string values through
+    :param references: (optional) Collapse `{link, value}` reference objects to their `value` ('value'), or to a
+        :class:`record.Reference` ('tuple')
+    :param display_values: (optional) Collapse `{display_value, value}` objects to a :class:`record.DisplayValue`
+        ('tuple')
+    :param schema: (optional) :class:`schema.Schema` to convert values with
+    """
+
+    def __init__(
+        self,
+        fields=None,
+        intern=None,
+        references=None,
+        display_values=None,
+        schema=None,
+    ):
+        self.has_result_single = False
+        self.has_result_many = False
+        self.has_error = False
+        self.count = 0
+
+        self._builder = ObjectBuilder()
+        self._fields = frozenset(fields) if fields else None
+        self._intern = intern
+        self._references = references
+        self._display_values = display_values
+        self._convert = schema.convert if schema is not None else None
+        self._item_prefix = None
+        self._record = None
+        self._key = None
+        self._skip_depth = None
+        self._object = None
+        self._object_key = None
+        self._value_builder = None
+        self._value_depth = 0
+
+    def _new_record(self):
+        return {}
+
+    def _set_field(self, record, key, value):
+        record[key] = value
+
+    def _end_record(self, record):
+        return record
+
+    def _reduce_object(self, value):
+        """Returns the value to set for a flat object, e.g. the `value` of a reference"""
+
+        if (
+            "display_value" in value
+            and "value" in value
+            and len(value) == (3 if "link" in value else 2)
+        ):
+            if self._convert is not None:
+                # Only the raw value can be converted, display values are formatted for the user
+                value["value"] = self._convert(self._key, value["value"])
+
+            if self._display_values is not None:
+                return DisplayValue(
+                    value["value"], value["display_value"], value.get("link")
+                )
+        elif (
+            self._references is not None
+            and len(value) == 2
+            and "value" in value
+            and "link" in value
+        ):
+            if self._references == "value":
+                return value["value"]
+
+            return Reference(value["value"], value["link"])
+
+        return value
+
+    def _start_value_builder(self):
+        """Hands the flat object being built over to an ObjectBuilder, after reaching a nested container"""
+
+        builder = ObjectBuilder()
+        builder.event("start_map", None)
+
+        for key, value in self._object.items():
+            builder.event("map_key", key)
+            builder.event("string", value)
+
+        builder.event("map_key", self._object_key)
+
+        self._object = None
+        self._value_builder = builder
+        self._value_depth = 1
+
+    def _skip_field(self, key):
+        """Returns True if the value of `key` should be discarded"""
+
+        return self._fields is not None and key not in self._fields
+
+    def _build(self, prefix, event, value):
+        """Processes an event of the result
+
+        :return:
+            - The completed record, or None
+        """
+
+        if self._intern is not None and (event == "string" or event == "map_key"):
+            value = self._intern(value)
+
+        if self._skip_depth is not None:
+            # Discarding the value of an unwanted field, track the depth of containers
+            if event == "start_map" or event == "start_array":
+                self._skip_depth += 1
+            elif event == "end_map" or event == "end_array":
+                self._skip_depth -= 1
+
+            if self._skip_depth == 0:
+                self._skip_depth = None
+        elif self._object is not None:
+            # Building a flat object value
+            if event == "map_key":
+                self._object_key = value
+            elif event == "end_map":
+                self._set_field(
+                    self._record, self._key, self._reduce_object(self._object)
+                )
+                self._object = None
+            elif event == "start_map" or event == "start_array":
+                self._start_value_builder()
+                return self._build(prefix, event, value)
+            else:
+                self._object[self._object_key] = value
+        elif self._value_builder is not None:
+            # Building an object or array value
+            self._value_builder.event(event, value)
+
+            if event == "start_map" or event == "start_array":
+                self._value_depth += 1
+            elif event == "end_map" or event == "end_array":
+                self._value_depth -= 1
+
+                if self._value_depth == 0:
+                    self._set_field(self._record, self._key, self._value_builder.value)
+                    self._value_builder = None
+        elif prefix == self._item_prefix:
+            if event == "map_key":
+                if self._skip_field(value):
+                    self._skip_depth = 0
+                else:
+                    self._key = value
+            elif event == "start_map":
+                self._record = self._new_record()
+            elif event == "end_map":
+                # Reached end of object. Set count and return
+                self.count += 1
+                return self._end_record(self._record)
+        elif not prefix.startswith(self._item_prefix):
+            # Outside of the result object, e.g. the `result` array itself
+            pass
+        elif event == "start_map":
+            self._object = {}
+        elif event == "start_array":
+            self._value_builder = ObjectBuilder()
+            self._value_builder.event(event, value)
+            self._value_depth = 1
+        else:
+            if self._convert is not None:
+                value = self._convert(self._key, value)
+
+            self._set_field(self._record, self._key, value)
+
+        return None
+
+    def feed(self, prefix, event, value):
+        """Processes an event
+
+        :param prefix: ijson prefix
+        :param event: ijson event
+        :param value: ijson value
+        :return:
+            - The completed record, or None
+        :raise:
+            - ResponseError: If there's an error in the response
+        """
+
+        if self._item_prefix is not None:
+            return self._build(prefix, event, value)
+        elif (prefix, event) == ("error", "start_map"):
+            # Matched ServiceNow `error` object at the root
+            self.has_error = True
+        elif prefix == "result" and event in ["start_map", "start_array"]:
+            # Matched ServiceNow `result`
+            if event == "start_map":  # Matched object
+                self.has_result_single = True
+                self._item_prefix = "result"
+            elif event == "start_array":  # Matched array
+                self.has_result_many = True
+                self._item_prefix = "result.item"
+
+            return self._build(prefix, event, value)
+
+        if self.has_error:
+            if (prefix, event) == ("error", "end_map"):
+                # Reached end of the error object - raise ResponseError exception
+                raise ResponseError(getattr(self._builder, "value"))
+            elif prefix.startswith("error"):
+                # Build the error object
+                self._builder.event(event, value)
+
+        return None
+
+    def close(self):
+        """Validates the parsed response after the last event
+
+        :raise:
+            - MissingResult: If no result nor error was found
+        """
+
+        if not (
+            self.has_result_single or self.has_result_many or self.has_error
+        ):  # None of the expected keys were found
+            raise MissingResult(
+                "The expected `result` key was missing in the response. Cannot continue"
+            )
+
+
+class SlotsParser(ResultParser):
+    """Builds records as instances of a generated :class:`record.Record` type, rather than dictionaries.
+
+    :param record_class: :class:`record.Record` subclass, as returned by :func:`record.get_record_class`
+    :param intern: (optional) :class:`InternTable` to pass keys and string values through
+    :param references: (optional) Collapse reference objects, see :class:`ResultParser`
+    :param display_values: (optional) Collapse display value objects, see :class:`ResultParser`
+    :param schema: (optional) :class:`schema.Schema` to convert values with
+    """
+
+    def __init__(
+        self,
+        record_class,
+        intern=None,
+        references=None,
+        display_values=None,
+        schema=None,
+    ):
+        super(SlotsParser, self).__init__(
+            fields=record_class._fields,
+            intern=intern,
+            references=references,
+            display_values=display_values,
+            schema=schema,
+        )
+
+        self._record_class = record_class
+        self._size = len(record_class._fields)
+        self._index = dict((field, i) for i, field in enumerate(record_class._fields))
+
+    def _new_record(self):
+        return [None] * self._size
+
+    def _set_field(self, record, key, value):
+        record[self._index[key]] = value
+
+    def _end_record(self, record):
+        return self._record_class(*record)
+
+
+def pop_parser_options(kwargs, fields=None, required=None):
+    """Pops and validates the parser options in the kwargs of a request method
+
+    :param kwargs: Keyword arguments, e.g. of :meth:`request.SnowRequest.get`
+    :param fields: (optional) List of fields requested with `sysparm_fields`
+    :param required: (optional) List of fields to add to the projection, e.g. the keys of a keyset pager
+    :return:
+        - Dictionary of options to pass along to :func:`get_parser`
+    :raise:
+        - InvalidUsage: If an option fails validation
+    """
+
+    options = {}
+    projection = kwargs.pop("projection", None)
+    record_class = kwargs.pop("record_class", None)
+    intern = kwargs.pop("intern", None)
+    references = kwargs.pop("references", None)
+    display_values = kwargs.pop("display_values", None)
+    types = kwargs.pop("types", None)
+
+    if projection is not None and (
+        isinstance(projection, six.string_types)
+        or not all(isinstance(field, six.string_types) for field in projection)
+    ):
+        raise InvalidUsage("Argument 'projection' must be a list of field names")
+
+    if projection and required:
+        projection = list(projection) + [
+            field for field in required if field not in projection
+        ]
+
+    if record_class not in (None, "dict", "slots"):
+        raise InvalidUsage("Argument 'record_class' must be either 'dict' or 'slots'")
+    elif record_class == "slots":
+        projection = projection or fields
+
+        if not projection:
+            raise InvalidUsage(
+                "record_class='slots' requires the record fields, set `fields` or `projection`"
+            )
+
+        options["record_class"] = get_record_class(OrderedDict.fromkeys(projection))
+
+    if projection:
+        options["fields"] = list(projection)
+
+    if intern is True:
+        options["intern"] = 10000
+    elif intern is not None and intern is not False:
+        if (
+            isinstance(intern, bool)
+            or not isinstance(intern, six.integer_types)
+            or intern < 1
+        ):
+            raise InvalidUsage(
+                "Argument 'intern' must be a boolean or the maximum size of the intern table"
+            )
+
+        options["intern"] = intern
+
+    if references is not None:
+        if references not in REFERENCES:
+            raise InvalidUsage(
+                "Argument 'references' must be either 'value' or 'tuple'"
+            )
+
+        options["references"] = references
+
+    if display_values is not None:
+        if display_values not in DISPLAY_VALUES:
+            raise InvalidUsage("Argument 'display_values' must be 'tuple'")
+
+        options["display_values"] = display_values
+
+    if types is not None:
+        options["schema"] = get_schema(types)
+
+    return options
+
+
+def get_parser(
+    fields=None,
+    record_class=None,
+    intern=None,
+    references=None,
+    display_values=None,
+    schema=None,
+):
+    """Returns a parser for the given options
+
+    :param fields: (optional) List of fields to build
+    :param record_class: (optional) :class:`record.Record` subclass to build records as
+    :param intern: (optional) Maximum size of the table of interned strings, interning is disabled if not set
+    :param references: (optional) Collapse reference objects to their 'value' or to a 'tuple'
+    :param display_values: (optional) Collapse display value objects to a 'tuple'
+    :param schema: (optional) :class:`schema.Schema` to convert values with
+    :return:
+        - :class:`ResultParser` object
+    """
+
+    options = dict(
+        intern=InternTable(intern) if intern else None,
+        references=references,
+        display_values=display_values,
+        schema=schema,
+    )
+
+    if record_class is not None:
+        return SlotsParser(record_class, **options)
+
+    return ResultParser(fields=fields, **options)
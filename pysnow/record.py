@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import keyword
+import re
+import threading
+
+from collections import namedtuple
+
+import six
+
+_IDENTIFIER = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+_classes = {}
+_classes_lock = threading.Lock()
+
+
+class Reference(namedtuple("Reference", ["value", "link"])):
+    """Reference field, as returned by the parser with references='tuple' in place of a `{link, value}` object
+
+    :param value: sys_id of the referenced record
+    :param link: URL of the referenced record
+    """
+
+    __slots__ = ()
+
+
+class DisplayValue(namedtuple("DisplayValue", ["value", "display_value", "link"])):
+    """Field of a display_value='all' response, as returned by the parser with display_values='tuple' in place of a
+    `{display_value, value}` object
+
+    :param value: Raw value of the field
+    :param display_value: Display value of the field
+    :param link: URL of the referenced record, or None if the field isn't a reference
+    """
+
+    __slots__ = ()
+
+
+def get_value(value):
+    """Returns the `value` of reference and display value objects, other values are returned as-is"""
+
+    if isinstance(value, (Reference, DisplayValue)):
+        return value.value
+    elif isinstance(value, dict) and "value" in value:
+        return value["value"]
+
+    return value
+
+
+def get_display_value(value):
+    """Returns the `display_value` of display value objects, other values are returned as-is"""
+
+    if isinstance(value, DisplayValue):
+        return value.display_value
+    elif isinstance(value, dict) and "display_value" in value:
+        return value["display_value"]
+
+    return value
+
+
+def _make_record(fields, values):
+    """Unpickles a record by getting its class from the cache"""
+
+    return get_record_class(fields)(*values)
+
+
+class Record(object):
+    """Base class of the compact record types generated by :func:`get_record_class`.
+
+    Records store their values in `__slots__`, and can be used as read-only mappings of field names and values, e.g.
+    ``record['sys_id']`` or ``record.get('caller_id.name')``. Fields that are valid Python identifiers can also be
+    accessed as attributes, e.g. ``record.sys_id``. Fields missing from the response are set to None.
+    """
+
+    __slots__ = ()
+
+    # Field names and the names of the attributes they're stored in
+    _fields = ()
+    _attrs = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._attrs[key])
+        except KeyError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        attr = self._attrs.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def __contains__(self, key):
+        return key in self._attrs
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def keys(self):
+        return list(self._fields)
+
+    def values(self):
+        return [getattr(self, self._attrs[key]) for key in self._fields]
+
+    def items(self):
+        return list(zip(self._fields, self.values()))
+
+    def _asdict(self):
+        """Returns the record as a dictionary"""
+
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return self.items() == other.items()
+        elif isinstance(other, dict):
+            return self._asdict() == other
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _make_record, (self._fields, tuple(self.values()))
+
+    def __repr__(self):
+        return "<%s [%s]>" % (
+            self.__class__.__name__,
+            ", ".join("%s=%r" % item for item in self.items()),
+        )
+
+
+def get_record_class(fields):
+    """Returns a :class:`Record` type with a slot for each field, generating and caching it on first use
+
+    :param fields: List of field names
+    :return:
+        - :class:`Record` subclass
+    """
+
+    fields = tuple(fields)
+
+    if fields in _classes:
+        return _classes[fields]
+
+    with _classes_lock:
+        if fields not in _classes:
+            _classes[fields] = _create_record_class(fields)
+
+    return _classes[fields]
+
+
+def _create_record_class(fields):
+    if len(set(fields)) != len(fields):
+        raise ValueError("Duplicate field names: %r" % (fields,))
+
+    reserved = set(dir(Record))
+    attrs = []
+
+    for i, field in enumerate(fields):
+        if (
+            isinstance(field, six.string_types)
+            and _IDENTIFIER.match(field)
+            and not keyword.iskeyword(field)
+            and field not in reserved
+        ):
+            attrs.append(str(field))
+        else:
+            # Stored in a positional slot, accessible by key only
+            attrs.append("_%d" % i)
+
+    # Generated like namedtuple, as an __init__ assigning each slot is much faster than a loop over setattr
+    source = "def __init__(self, %s):\n%s" % (
+        ", ".join(attrs),
+        "".join("    self.%s = %s\n" % (attr, attr) for attr in attrs),
+    )
+    namespace = {}
+    six.exec_(source, namespace)
+
+    return type(
+        "Record",
+        (Record,),
+        {
+            "__slots__": tuple(attrs),
+            "__init__": namespace["__init__"],
+            "_fields": fields,
+            "_attrs": dict(zip(fields, attrs)),
+        },
+    )
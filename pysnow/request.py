@@ -1,21 +1,59 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import json
 import six
 
-from .response import Response
-from .exceptions import InvalidUsage
+from .response import Response, get_spill_size
+from .parser import pop_parser_options
+from .codec import get_codec
+from .record import Reference, get_value
+from .concurrency import bounded_map, size_pool, validate_concurrency
+from .pagination import LinkPager, KeysetPager
+from .exceptions import InvalidUsage, UnexpectedResponseFormat
 
 logger = logging.getLogger("pysnow")
 
 
+def get_changed_fields(record, payload):
+    """Returns the fields in `payload` that differ from those of a previously fetched `record`
+
+    Values are compared in their serialized form, reference and display value objects by their `value`.
+
+    :param record: Dictionary of the previously fetched record
+    :param payload: Dictionary payload
+    :return:
+        - Dictionary containing changed fields
+    """
+
+    def normalize(value):
+        value = get_value(value)
+
+        if isinstance(value, dict):
+            # Object without a `value`, e.g. a reference with display_value=True
+            value = None
+
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif value is None:
+            return ""
+
+        return six.text_type(value)
+
+    return dict(
+        (key, value)
+        for key, value in payload.items()
+        if key not in record or normalize(record[key]) != normalize(value)
+    )
+
+
 class SnowRequest(object):
     """Creates a new :class:`SnowRequest` object.
 
     :param parameters: :class:`params_builder.ParamsBuilder` object
     :param session: :class:`request.Session` object
     :param url_builder: :class:`url_builder.URLBuilder` object
+    :param parser_backend: (optional) ijson backend module used by the stream parser
+    :param json_codec: (optional) :class:`codec.JSONCodec` object, defaults to the fastest available
     """
 
     def __init__(
@@ -26,36 +64,35 @@ class SnowRequest(object):
         chunk_size=None,
         resource=None,
         timeout=60,
+        parser_backend=None,
+        json_codec=None,
     ):
         self._parameters = parameters
         self._url_builder = url_builder
         self._session = session
         self._chunk_size = chunk_size
+        self._parser_backend = parser_backend
+        self._codec = json_codec or get_codec()
         self._resource = resource
         self._timeout = timeout
 
         self._url = url_builder.get_url()
 
-    def _get_response(self, method, **kwargs):
-        """Response wrapper - creates a :class:`requests.Response` object and passes along to :class:`pysnow.Response`
-        for validation and parsing.
+    def _send(self, method, url, **kwargs):
+        """Sends a request using the session and enables transparent decompression of the raw stream.
 
-        :param args: args to pass along to _send()
-        :param kwargs: kwargs to pass along to _send()
+        :param method: HTTP method
+        :param url: URL to send the request to
+        :param kwargs: kwargs to pass along to :meth:`requests.Session.request`
         :return:
-            - :class:`pysnow.Response` object
+            - :class:`requests.Response` object
         """
 
-        params = self._parameters.as_dict()
-        use_stream = kwargs.pop("stream", False)
-
         logger.debug(
             "(REQUEST_SEND) Method: %s, Resource: %s" % (method, self._resource)
         )
 
-        response = self._session.request(
-            method, self._url, stream=use_stream, params=params, timeout=self._timeout, **kwargs
-        )
+        response = self._session.request(method, url, timeout=self._timeout, **kwargs)
         response.raw.decode_content = True
 
         logger.debug(
@@ -63,17 +100,52 @@ class SnowRequest(object):
             % (response.status_code, self._resource)
         )
 
+        return response
+
+    def _get_response(self, method, **kwargs):
+        """Response wrapper - creates a :class:`requests.Response` object and passes along to :class:`pysnow.Response`
+        for validation and parsing.
+
+        :param args: args to pass along to _send()
+        :param kwargs: kwargs to pass along to _send()
+        :return:
+            - :class:`pysnow.Response` object
+        """
+
+        params = self._parameters.as_dict()
+        use_stream = kwargs.pop("stream", False)
+        pager = kwargs.pop("pager", None)
+        parser_options = kwargs.pop("parser_options", None)
+        spill = kwargs.pop("spill", None)
+
+        if parser_options is None:
+            parser_options = pop_parser_options(kwargs)
+
+        # Spilled bodies are written to disk as they are received
+        response = self._send(
+            method,
+            self._url,
+            stream=use_stream or spill is not None,
+            params=params,
+            **kwargs
+        )
+
         return Response(
             response=response,
             resource=self._resource,
             chunk_size=self._chunk_size,
             stream=use_stream,
+            pager=pager,
+            parser_backend=self._parser_backend,
+            parser_options=parser_options,
+            json_codec=self._codec,
+            spill=spill,
         )
 
     def _get_custom_endpoint(self, value):
-        if isinstance(value, dict) and "value" in value:
-            value = value["value"]
-        elif not isinstance(value, six.string_types):
+        value = get_value(value)
+
+        if not isinstance(value, six.string_types):
             raise InvalidUsage(
                 "Argument 'path_append' must be a string in the following format: "
                 "/path-to-append[/.../...]"
@@ -82,19 +154,17 @@ class SnowRequest(object):
         segment = value if value.startswith("/") else "/{0}".format(value)
         return self._url_builder.get_appended_custom(segment)
 
-    def get(self, *args, **kwargs):
-        """Fetches one or more records
+    def _set_get_parameters(self, query, kwargs):
+        """Sets the query and GET-specific parameters, popping them from `kwargs`
 
-        :return:
-            - :class:`pysnow.Response` object
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :param kwargs: keyword arguments passed to the GET-type method
         """
 
-        query = kwargs.pop("query", {}) if len(args) == 0 else args[0]
-
         if isinstance(query, dict):
             for key, value in query.items():
-                if isinstance(value, dict):
-                    query[key] = value["value"]
+                if isinstance(value, (dict, Reference)):
+                    query[key] = get_value(value)
 
         self._parameters.query = query
         self._parameters.limit = kwargs.pop("limit", 10000)
@@ -111,7 +181,155 @@ class SnowRequest(object):
                 "suppress_pagination_header"
             )
 
-        return self._get_response("GET", stream=kwargs.pop("stream", False))
+    def get(self, *args, **kwargs):
+        """Fetches one or more records
+
+        :return:
+            - :class:`pysnow.Response` object
+        """
+
+        query = kwargs.pop("query", {}) if len(args) == 0 else args[0]
+        keyset = kwargs.pop("keyset", None)
+
+        if isinstance(keyset, six.string_types):
+            keyset = keyset.split(",")
+
+        if keyset is not None and kwargs.get("fields"):
+            # Keyset pagination needs the key values of the last record
+            kwargs["fields"] = kwargs["fields"] + [
+                key for key in keyset if key not in kwargs["fields"]
+            ]
+
+        parser_options = pop_parser_options(
+            kwargs, fields=kwargs.get("fields"), required=keyset
+        )
+
+        self._set_get_parameters(query, kwargs)
+
+        if (
+            parser_options.get("schema") is not None
+            and self._parameters.display_value is True
+        ):
+            raise InvalidUsage(
+                "Argument 'types' can't be used with display_value=True, as display values are formatted "
+                "for the user. Use display_value='all' to convert the raw values"
+            )
+
+        stream = kwargs.pop("stream", False)
+        spill = get_spill_size(kwargs.pop("spill", None))
+        pager = None
+
+        if stream and spill is not None:
+            raise InvalidUsage("Arguments 'stream' and 'spill' can't be combined")
+
+        if keyset is not None:
+            pager = KeysetPager(self, keyset, stream=stream or spill is not None)
+            self._parameters.query = pager.get_query()
+        elif kwargs.pop("paginate", False):
+            pager = LinkPager(self, stream=stream or spill is not None)
+
+        return self._get_response(
+            "GET",
+            stream=stream,
+            pager=pager,
+            parser_options=parser_options,
+            spill=spill,
+        )
+
+    def _get_total_count(self, params):
+        """Performs a single-record probe and reads the total number of matching records from `X-Total-Count`
+
+        :param params: query parameters of the scan
+        :return: number of matching records
+        :raise:
+            - UnexpectedResponseFormat: If the `X-Total-Count` header is missing
+        """
+
+        response = self._send(
+            "GET",
+            self._url,
+            params=dict(
+                params, sysparm_limit=1, sysparm_offset=0, sysparm_fields="sys_id"
+            ),
+            stream=True,
+        )
+        response.close()
+        response.raise_for_status()
+
+        if "X-Total-Count" not in response.headers:
+            raise UnexpectedResponseFormat(
+                "The X-Total-Count header was missing in the response. Cannot scan"
+            )
+
+        return int(response.headers["X-Total-Count"])
+
+    def _get_window(self, params, window, parser_options=None):
+        """Fetches and parses the records of one offset window
+
+        :param params: query parameters of the scan
+        :param window: tuple of (offset, limit)
+        :param parser_options: (optional) Dictionary of parser options
+        :return: list of records
+        """
+
+        offset, limit = window
+        response = self._send(
+            "GET",
+            self._url,
+            params=dict(params, sysparm_offset=offset, sysparm_limit=limit),
+            stream=True,
+        )
+
+        return list(
+            Response(
+                response=response,
+                resource=self._resource,
+                chunk_size=self._chunk_size,
+                stream=True,
+                parser_backend=self._parser_backend,
+                parser_options=parser_options,
+                json_codec=self._codec,
+            ).all()
+        )
+
+    def scan(self, *args, **kwargs):
+        """Fetches all matching records using concurrent requests over disjoint offset windows
+
+        :return:
+            - Generator of records
+        """
+
+        query = kwargs.pop("query", {}) if len(args) == 0 else args[0]
+        parallel = validate_concurrency(kwargs.pop("parallel", 4), "parallel")
+        ordered = kwargs.pop("ordered", True)
+        parser_options = pop_parser_options(kwargs, fields=kwargs.get("fields"))
+
+        self._set_get_parameters(query, kwargs)
+
+        if "ORDERBY" not in self._parameters.query:
+            # Windows must be cut from a stable ordering to be disjoint
+            self._parameters.query = "^".join(
+                filter(None, [self._parameters.query, "ORDERBYsys_id"])
+            )
+
+        params = dict(self._parameters.as_dict())
+        total = self._get_total_count(params)
+        size = max(1, min(params["sysparm_limit"], -(-total // parallel)))
+        windows = ((offset, size) for offset in range(0, total, size))
+
+        size_pool(self._session, parallel)
+
+        def scan_windows():
+            for _, future in bounded_map(
+                lambda window: self._get_window(params, window, parser_options),
+                windows,
+                parallel,
+                ordered=ordered,
+            ):
+                for record in future.result():
+                    yield record
+
+        return scan_windows()
 
     def create(self, payload):
         """Creates a new record
@@ -121,7 +339,7 @@ class SnowRequest(object):
             - Dictionary of the inserted record
         """
 
-        return self._get_response("POST", data=json.dumps(payload))
+        return self._get_response("POST", data=self._codec.dumps(payload))
 
     def update(self, query, payload):
         """Updates a record
@@ -137,8 +355,46 @@ class SnowRequest(object):
 
         record = self.get(query=query).one()
 
-        self._url = self._get_custom_endpoint(record["sys_id"])
-        return self._get_response("PUT", data=json.dumps(payload))
+        return self.update_by_sys_id(record["sys_id"], payload)
+
+    def update_by_sys_id(self, sys_id, payload):
+        """Updates the record with the given sys_id, without looking it up first
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary payload
+        :return:
+            - Dictionary of the updated record
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        self._url = self._get_custom_endpoint(sys_id)
+        return self._get_response("PUT", data=self._codec.dumps(payload))
+
+    def patch(self, sys_id, payload, record=None):
+        """Partially updates the record with the given sys_id. If `record` is provided, only fields that changed are
+        sent, and no request is made if nothing changed.
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary payload
+        :param record: (optional) Dictionary of the previously fetched record
+        :return:
+            - :class:`pysnow.Response` object, or None if nothing changed
+        """
+
+        if not isinstance(payload, dict):
+            raise InvalidUsage("Update payload must be of type dict")
+
+        if record is not None:
+            payload = get_changed_fields(record, payload)
+
+            if not payload:
+                logger.debug("(PATCH_SKIP) No changes, Resource: %s" % self._resource)
+                return None
+
+        self._url = self._get_custom_endpoint(sys_id)
+        return self._get_response("PATCH", data=self._codec.dumps(payload))
 
     def delete(self, query):
         """Deletes a record
@@ -149,7 +405,18 @@ class SnowRequest(object):
         """
 
         record = self.get(query=query).one()
-        self._url = self._get_custom_endpoint(record["sys_id"])
+
+        return self.delete_by_sys_id(record["sys_id"])
+
+    def delete_by_sys_id(self, sys_id):
+        """Deletes the record with the given sys_id, without looking it up first
+
+        :param sys_id: sys_id of the record to delete
+        :return:
+            - Dictionary containing status of the delete operation
+        """
+
+        self._url = self._get_custom_endpoint(sys_id)
 
         return self._get_response("DELETE").one()
 
@@ -159,6 +426,12 @@ class SnowRequest(object):
         :param method: HTTP method
         :param path_append: (optional) append path to resource.api_path
         :param headers: (optional) Dictionary of headers to add or override
+        :param projection: (optional) List of fields to keep in the parsed records
+        :param record_class: (optional) Build records as `dict` (default) or `slots`, see :meth:`Resource.get`
+        :param intern: (optional) Intern repeated strings while parsing, see :meth:`Resource.get`
+        :param references: (optional) Collapse reference objects while parsing, see :meth:`Resource.get`
+        :param display_values: (optional) Collapse display value objects while parsing, see :meth:`Resource.get`
+        :param types: (optional) Convert values to Python types while parsing, see :meth:`Resource.get`
         :param kwargs: kwargs to pass along to :class:`requests.Request`
         :return:
             - :class:`pysnow.Response` object
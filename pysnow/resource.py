@@ -7,6 +7,11 @@ from copy import copy, deepcopy
 from .request import SnowRequest
 from .attachment import Attachment
 from .url_builder import URLBuilder
+from .bulk import create_many, update_many
+from .parser import get_backend, get_backend_name
+from .params_builder import ParamsBuilder
+from .schema import Schema
+from .arrow import require_pyarrow, write_parquet
 from .exceptions import InvalidUsage
 
 logger = logging.getLogger("pysnow")
@@ -20,6 +25,8 @@ class Resource(object):
     :param base_path: Base path
     :param api_path: API path
     :param chunk_size: Response stream parser chunk size (in bytes)
+    :param parser_backend: ijson backend module used by the stream parser
+    :param json_codec: :class:`codec.JSONCodec` used to encode payloads and decode buffered responses
     :param \*\*kwargs: Arguments to pass along to :class:`Request`
     """
 
@@ -34,15 +41,22 @@ class Resource(object):
 
         self.kwargs = kwargs
         self.parameters = deepcopy(parameters)
+        self._schema = None
 
         logger.debug(
-            "(RESOURCE_ADD) Object: %s, chunk_size: %d"
-            % (self, kwargs.get("chunk_size"))
+            "(RESOURCE_ADD) Object: %s, chunk_size: %d, parser_backend: %s"
+            % (self, kwargs.get("chunk_size"), self.parser_backend)
         )
 
     def __repr__(self):
         return "<%s [%s] at %s>" % (self.__class__.__name__, self.path, hex(id(self)))
 
+    @property
+    def parser_backend(self):
+        """Name of the ijson backend used by the stream parser, e.g. `yajl2_c`"""
+
+        return get_backend_name(self.kwargs.get("parser_backend") or get_backend())
+
     @property
     def path(self):
         """Get current path relative to base URL
@@ -97,6 +111,67 @@ class Resource(object):
 
         return "%s/%s" % (self._url_builder.get_url(), sys_id)
 
+    def _get_table_resource(self, table):
+        """Returns a :class:`Resource` of the table API with default parameters, sharing the session"""
+
+        return Resource(
+            base_url=self._base_url,
+            base_path=self._base_path,
+            api_path="/table/%s" % table,
+            parameters=ParamsBuilder(),
+            **self.kwargs
+        )
+
+    def get_schema(self):
+        """Loads the types of the fields of the table, including inherited fields, from `sys_dictionary`.
+        The schema is loaded once and cached.
+
+        :return:
+            - :class:`schema.Schema` object
+        :raise:
+            - InvalidUsage: If the resource isn't a table API resource
+        """
+
+        if self._schema is not None:
+            return self._schema
+
+        path = self._api_path.strip("/").split("/")
+
+        if path[0] != "table" or len(path) < 2:
+            raise InvalidUsage("Schemas can only be loaded for table API resources")
+
+        # Walk up the table hierarchy, e.g. incident -> task
+        tables = []
+        table = path[1]
+        db_objects = self._get_table_resource("sys_db_object")
+
+        while table and table not in tables:
+            tables.append(table)
+            record = db_objects.get(
+                query={"name": table}, fields=["super_class.name"], limit=1
+            ).one_or_none()
+            table = record and record.get("super_class.name")
+
+        # Fields of parent tables first, so the definitions of child tables take precedence
+        entries = (
+            self._get_table_resource("sys_dictionary")
+            .get(
+                query="nameIN%s^elementISNOTEMPTY" % ",".join(tables),
+                fields=["name", "element", "internal_type"],
+            )
+            .all()
+        )
+        entries = sorted(entries, key=lambda entry: -tables.index(entry["name"]))
+
+        self._schema = Schema.from_dictionary(entries)
+        return self._schema
+
+    def _set_types(self, kwargs):
+        """Replaces types=True with the schema loaded from `sys_dictionary`"""
+
+        if kwargs.get("types") is True:
+            kwargs["types"] = self.get_schema()
+
     def get(self, *args, **kwargs):
         """Queries the API resource
 
@@ -110,13 +185,100 @@ class Resource(object):
                              created_on in descending order.
             - :param offset: Number of records to skip before returning records
             - :param stream: Whether or not to use streaming / generator response interface
+            - :param spill: Write the body to a temporary file as it's received, and parse the records from it
+                            whenever they are read, rather than loading it at once. True, or the number of bytes to
+                            keep in memory before moving the file to disk (default 1 MB). Can't be combined with
+                            `stream`
+            - :param paginate: Whether or not to follow `next` links in the `Link` header, `limit` sets the page size
+            - :param keyset: Field or list of fields to order by and paginate on with `key > last_seen` conditions,
+                             rather than offsets. `limit` sets the page size
+            - :param projection: List of fields to keep in the parsed records, for when `fields` can't be used.
+                                 The values of other fields are discarded by the parser without being built
+            - :param record_class: `dict` (default), or `slots` to build records as instances of a compact
+                                   :class:`record.Record` type generated for `projection` or `fields`
+            - :param intern: Make repeated keys and short string values share one string object while parsing.
+                             True, or the maximum size of the intern table (default 10000)
+            - :param references: Collapse `{link, value}` reference objects while parsing, to their `value`
+                                 (`value`) or to a :class:`record.Reference` tuple (`tuple`)
+            - :param display_values: `tuple` to collapse the `{display_value, value}` objects of display_value='all'
+                                     responses to a :class:`record.DisplayValue` tuple while parsing
+            - :param types: Convert values to Python types while parsing: a dictionary of field names and types or
+                            a :class:`schema.Schema`, or True to load the types from `sys_dictionary`,
+                            see :meth:`get_schema`
 
         :return:
             - :class:`Response` object
         """
 
+        self._set_types(kwargs)
         return self._request.get(*args, **kwargs)
 
+    def scan(self, *args, **kwargs):
+        """Fetches all matching records by splitting the result set into disjoint offset windows, which are
+        fetched concurrently over the shared session.
+
+        The number of matching records is read from the `X-Total-Count` header of a single-record probe.
+        Results are sorted by `sys_id` unless the query contains an ordering of its own.
+
+        :param args:
+            - :param query: Dictionary, string or :class:`QueryBuilder` object
+                            defaults to empty dict (all)
+
+        :param kwargs:
+            - :param parallel: Number of concurrent requests, defaults to 4. The connection pools of the session
+                               are grown to hold as many connections
+            - :param ordered: Yield records in order (default) or as windows complete
+            - :param limit: Maximum number of records per window
+            - :param fields: List of fields to include in the response
+            - :param projection: List of fields to keep in the parsed records
+            - :param record_class: `dict` (default) or `slots`, see :meth:`get`
+            - :param intern: Intern repeated strings while parsing, see :meth:`get`
+            - :param references: Collapse reference objects while parsing, see :meth:`get`
+            - :param display_values: Collapse display value objects while parsing, see :meth:`get`
+            - :param types: Convert values to Python types while parsing, see :meth:`get`
+
+        :return:
+            - Generator of records
+        """
+
+        self._set_types(kwargs)
+        return self._request.scan(*args, **kwargs)
+
+    def export_parquet(
+        self, where, query=None, fields=None, batch_size=10000, schema=None, **kwargs
+    ):
+        """Streams matching records into a Parquet file, one record batch at a time, keeping memory bounded
+        by `batch_size`
+
+        :param where: Path or file-like object to write to
+        :param query: (optional) Dictionary, string or :class:`QueryBuilder` object, defaults to all records
+        :param fields: (optional) List of fields to export, defaults to the fields of `schema` or all fields
+        :param batch_size: Number of records per record batch
+        :param schema: (optional) :class:`pyarrow.Schema` of the file, inferred from the first batch if not given
+        :param kwargs: kwargs to pass along to :meth:`get`, e.g. `limit` and `keyset`
+        :return:
+            - Number of records written
+        """
+
+        pyarrow = require_pyarrow()
+
+        if schema is not None and fields is None:
+            fields = schema.names
+
+        response = self.get(
+            query if query is not None else {},
+            fields=fields or [],
+            stream=True,
+            **kwargs
+        )
+        batches = response.iter_arrow_batches(batch_size, fields=fields, schema=schema)
+
+        if schema is None and fields:
+            # Schema of the file if there are no records
+            schema = pyarrow.schema([(field, pyarrow.string()) for field in fields])
+
+        return write_parquet(batches, where, schema)
+
     def create(self, payload):
         """Creates a new record in the API resource
 
@@ -127,6 +289,20 @@ class Resource(object):
 
         return self._request.create(payload)
 
+    def create_many(self, payloads, concurrency=4, ordered=False):
+        """Creates a new record for each payload, sending the requests concurrently
+
+        Payloads are consumed lazily, with at most `concurrency` requests in flight.
+
+        :param payloads: Iterable (e.g. generator) of dictionaries containing key-value fields of the new records
+        :param concurrency: Maximum number of concurrent create requests
+        :param ordered: Yield results in input order if True, otherwise as requests complete
+        :return:
+            - Generator of :class:`bulk.BulkResult` objects
+        """
+
+        return create_many(self, payloads, concurrency, ordered)
+
     def update(self, query, payload):
         """Updates a record in the API resource
 
@@ -138,6 +314,49 @@ class Resource(object):
 
         return self._request.update(query, payload)
 
+    def update_by_sys_id(self, sys_id, payload):
+        """Updates the record with the given sys_id, without performing a lookup request first
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary containing key-value fields of the record to be updated
+        :return:
+            - Dictionary of the updated record
+        """
+
+        return self._request.update_by_sys_id(sys_id, payload)
+
+    def patch(self, sys_id, payload, record=None):
+        """Partially updates the record with the given sys_id using PATCH
+
+        If the previously fetched `record` is passed, only fields differing from it are sent, and the request is
+        skipped altogether if nothing changed.
+
+        :param sys_id: sys_id of the record to update
+        :param payload: Dictionary containing key-value fields of the record to be updated
+        :param record: (optional) Dictionary of the previously fetched record, e.g. from :meth:`Response.one`
+        :return:
+            - :class:`Response` object, or None if nothing changed
+        """
+
+        return self._request.patch(sys_id, payload, record=record)
+
+    def update_many(self, query, payload, concurrency=4, method="PATCH", limit=1000):
+        """Updates all records matching the query, sending the updates concurrently
+
+        Matching sys_ids are streamed using keyset pagination, and each record is updated by sys_id with at most
+        `concurrency` requests in flight.
+
+        :param query: Dictionary, string or :class:`QueryBuilder` object
+        :param payload: Dictionary containing key-value fields of the records to be updated
+        :param concurrency: Maximum number of concurrent update requests
+        :param method: PATCH (default) or PUT
+        :param limit: Page size of the sys_id lookup
+        :return:
+            - :class:`bulk.BulkSummary` object containing succeeded sys_ids and failed results
+        """
+
+        return update_many(self, query, payload, concurrency, method, limit)
+
     def delete(self, query):
         """Deletes matching record
 
@@ -148,17 +367,35 @@ class Resource(object):
 
         return self._request.delete(query)
 
+    def delete_by_sys_id(self, sys_id):
+        """Deletes the record with the given sys_id, without performing a lookup request first
+
+        :param sys_id: sys_id of the record to delete
+        :return:
+            - Dictionary containing information about deletion result
+        """
+
+        return self._request.delete_by_sys_id(sys_id)
+
     def request(self, method, path_append=None, headers=None, **kwargs):
         """Create a custom request
 
         :param method: HTTP method to use
         :param path_append: (optional) relative to :attr:`api_path`
         :param headers: (optional) Dictionary of headers to add or override
+        :param projection: (optional) List of fields to keep in the parsed records
+        :param record_class: (optional) `dict` (default) or `slots`, see :meth:`get`
+        :param intern: (optional) Intern repeated strings while parsing, see :meth:`get`
+        :param references: (optional) Collapse reference objects while parsing, see :meth:`get`
+        :param display_values: (optional) Collapse display value objects while parsing, see :meth:`get`
+        :param types: (optional) Convert values to Python types while parsing, see :meth:`get`
         :param kwargs: kwargs to pass along to :class:`requests.Request`
         :return:
             - :class:`Response` object
         """
 
+        self._set_types(kwargs)
+
         return self._request.custom(
             method, path_append=path_append, headers=headers, **kwargs
         )
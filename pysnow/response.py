@@ -1,11 +1,25 @@
 # -*- coding: utf-8 -*-
 
-import ijson
-
-from ijson.common import ObjectBuilder
-from itertools import chain
+import io
+import json
+import mmap
+import os
+import tempfile
+
+import six
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import chain, islice
+from .parser import InternTable, get_backend, get_parser
+from .codec import get_codec
+from .record import DisplayValue, Reference
+from .views import scan
+from .columns import ColumnParser
+from .arrow import get_record_batch, require_pyarrow
+from .concurrency import validate_concurrency
 from .exceptions import (
-    ResponseError,
     NoResults,
     InvalidUsage,
     MultipleResults,
@@ -14,20 +28,142 @@ from .exceptions import (
 )
 
 
+def _to_json(obj):
+    """Returns a JSON serializable form of the objects built by the parser, for the `default` of :func:`json.dumps`"""
+
+    if isinstance(obj, (datetime, date)):
+        # Formatted back to ServiceNow's `YYYY-MM-DD hh:mm:ss` and `YYYY-MM-DD`
+        return obj.isoformat(" ") if isinstance(obj, datetime) else obj.isoformat()
+    elif isinstance(obj, Decimal):
+        # Written as a string, like ServiceNow does, rather than as a lossy float
+        return str(obj)
+
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+def _to_json_record(record):
+    """Returns a dictionary of a record's fields, with reference and display value tuples turned back into objects,
+    which :func:`json.dumps` would write as arrays without calling `default`
+
+    :param record: Dictionary or :class:`record.Record` object
+    """
+
+    fields = {}
+
+    for key, value in record.items():
+        if isinstance(value, Reference):
+            value = {"link": value.link, "value": value.value}
+        elif isinstance(value, DisplayValue):
+            link = value.link
+            value = {"display_value": value.display_value, "value": value.value}
+
+            if link is not None:
+                value["link"] = link
+
+        fields[key] = value
+
+    return fields
+
+
+# Default number of bytes of a spilled body kept in memory
+SPILL_SIZE = 1024 * 1024
+
+
+def get_spill_size(spill):
+    """Returns the number of bytes of a body to keep in memory before spilling it to disk
+
+    :param spill: True for the default size, a positive number of bytes, or None or False to not spill
+    :return:
+        - Number of bytes, or None
+    :raise:
+        - InvalidUsage: If `spill` is invalid
+    """
+
+    if spill is None or spill is False:
+        return None
+    elif spill is True:
+        return SPILL_SIZE
+    elif (
+        not isinstance(spill, six.integer_types) or isinstance(spill, bool) or spill < 1
+    ):
+        raise InvalidUsage(
+            "Argument 'spill' must be True or a positive number of bytes"
+        )
+
+    return spill
+
+
+class SpoolReader(object):
+    """Reads a spooled body from the start, independently of other readers of the same file
+
+    :param spool: File object
+    """
+
+    def __init__(self, spool):
+        self._spool = spool
+        self._pos = 0
+
+    def read(self, size=-1):
+        self._spool.seek(self._pos)
+        data = self._spool.read(size)
+        self._pos += len(data)
+        return data
+
+
 class Response(object):
     """Takes a :class:`requests.Response` object and performs deserialization and validation.
 
+    The response is decoded once: buffered records and their count are cached on first access, and shared by
+    :meth:`all`, :meth:`one` and the convenience methods. Streamed (and paginated) responses are parsed once by a
+    single parser, which :meth:`all`, :meth:`first` and :meth:`one` read from. The first two records are kept, so
+    :meth:`first` and :meth:`one` return the same records before and after iterating, while the rest are only
+    yielded once: iterating again continues where the stream was left. The kept records are only yielded again
+    until the stream was read past them, so an exhausted stream yields nothing.
+
+    Spilled responses are written to a temporary file as they are received, which is kept in memory up to `spill`
+    bytes and moved to disk past that. Records are parsed from the file by the stream parser whenever they are
+    read, so :meth:`all` returns a generator and can be called again, and memory use doesn't grow with the body.
+
     :param response: :class:`requests.Response` object
     :param resource: parent :class:`resource.Resource` object
     :param chunk_size: Read and return up to this size (in bytes) in the stream parser
+    :param stream: Whether or not to use the stream parser
+    :param pager: (optional) :mod:`pagination` pager object used for fetching subsequent pages
+    :param parser_backend: (optional) ijson backend module used by the stream parser, defaults to the fastest available
+    :param parser_options: (optional) Dictionary of options to pass along to :func:`parser.get_parser`
+    :param json_codec: (optional) :class:`codec.JSONCodec` used to decode buffered responses, defaults to the fastest
+        available
+    :param spill: (optional) Number of bytes of the body to keep in memory before spilling it to a temporary file
     """
 
-    def __init__(self, response, resource, chunk_size=8192, stream=False):
+    def __init__(
+        self,
+        response,
+        resource,
+        chunk_size=8192,
+        stream=False,
+        pager=None,
+        parser_backend=None,
+        parser_options=None,
+        json_codec=None,
+        spill=None,
+    ):
         self._response = response
         self._chunk_size = chunk_size
+        self._parser_backend = parser_backend or get_backend()
         self._count = 0
         self._resource = resource
         self._stream = stream
+        self._pager = pager
+        self._parser_options = parser_options or {}
+        self._codec = json_codec or get_codec()
+        self._buffered = None
+        self._records = None
+        self._head = []
+        self._past_head = False
+        self._spill = spill
+        self._spool = None
+        self._consumed = False
 
     @property
     def headers(self):
@@ -54,75 +190,45 @@ class Response(object):
             self._response.request.method,
         )
 
-    def _parse_response(self):
+    def _parse_response(self, response=None, parser=None):
         """Looks for `result.item` (array), `result` (object) and `error` (object) keys and parses
         the raw response content (stream of bytes)
 
+        :param response: (optional) :class:`requests.Response` to parse, defaults to the wrapped response
+        :param parser: (optional) Parser to feed events to, defaults to a :class:`parser.ResultParser`
         :raise:
             - ResponseError: If there's an error in the response
             - MissingResult: If no result nor error was found
         """
 
-        response = self._get_response()
+        response = self._get_response(response)
+        parser = parser or get_parser(**self._parser_options)
 
-        has_result_single = False
-        has_result_many = False
-        has_error = False
+        if self._stream:
+            self._check_consumed(response)
+            source = response.raw
+        elif self._spill is not None:
+            source = SpoolReader(self._get_spool(response))
+        else:
+            source = io.BytesIO(response.content)
+
+        # Pages add up, spilled responses are counted again on every parse
+        count = self.count if self._pager is not None else 0
+
+        for prefix, event, value in self._parser_backend.parse(
+            source, buf_size=self._chunk_size
+        ):
+            item = parser.feed(prefix, event, value)
 
-        builder = ObjectBuilder()
+            if item is not None:
+                self.count = count + parser.count
+                yield item
 
-        for prefix, event, value in ijson.parse(
-            response.raw, buf_size=self._chunk_size
-        ):
-            if (prefix, event) == ("error", "start_map"):
-                # Matched ServiceNow `error` object at the root
-                has_error = True
-            elif prefix == "result" and event in ["start_map", "start_array"]:
-                # Matched ServiceNow `result`
-                if event == "start_map":  # Matched object
-                    has_result_single = True
-                elif event == "start_array":  # Matched array
-                    has_result_many = True
-
-            if has_result_many:
-                # Build the result
-                if (prefix, event) == ("result.item", "end_map"):
-                    # Reached end of object. Set count and yield
-                    builder.event(event, value)
-                    self.count += 1
-                    yield getattr(builder, "value")
-                elif prefix.startswith("result.item"):
-                    # Build the result object
-                    builder.event(event, value)
-            elif has_result_single:
-                if (prefix, event) == ("result", "end_map"):
-                    # Reached end of the result object. Set count and yield.
-                    builder.event(event, value)
-                    self.count += 1
-                    yield getattr(builder, "value")
-                elif prefix.startswith("result"):
-                    # Build the error object
-                    builder.event(event, value)
-            elif has_error:
-                if (prefix, event) == ("error", "end_map"):
-                    # Reached end of the error object - raise ResponseError exception
-                    raise ResponseError(getattr(builder, "value"))
-                elif prefix.startswith("error"):
-                    # Build the error object
-                    builder.event(event, value)
-
-        if (has_result_single or has_result_many) and self.count == 0:  # Results empty
-            return
-
-        if not (
-            has_result_single or has_result_many or has_error
-        ):  # None of the expected keys were found
-            raise MissingResult(
-                "The expected `result` key was missing in the response. Cannot continue"
-            )
+        parser.close()
+        self.count = count + parser.count
 
-    def _get_response(self):
-        response = self._response
+    def _get_response(self, response=None):
+        response = response if response is not None else self._response
 
         # Raise an HTTPError if we hit a non-200 status code
         response.raise_for_status()
@@ -137,6 +243,35 @@ class Response(object):
 
         return response
 
+    def _check_consumed(self, response=None):
+        """Raises an exception if the body of the wrapped streamed response was read by :meth:`views`, or straight
+        into columns"""
+
+        if self._consumed and (response is None or response is self._response):
+            raise InvalidUsage(
+                "The stream was read by views() or into columns and can't be parsed"
+            )
+
+    def _get_spool(self, response):
+        """Writes the body of a response to a temporary file, kept in memory up to the spill size. The body of the
+        wrapped response is written once, and read again by each parse
+
+        :param response: :class:`requests.Response` object
+        :return:
+            - :class:`tempfile.SpooledTemporaryFile` object
+        """
+
+        if response is self._response and self._spool is not None:
+            return self._spool
+
+        spool = tempfile.SpooledTemporaryFile(max_size=self._spill)
+        self._write(spool, response.iter_content(self._chunk_size))
+
+        if response is self._response:
+            self._spool = spool
+
+        return spool
+
     def _get_streamed_response(self):
         """Parses byte stream (memory efficient)
 
@@ -145,18 +280,38 @@ class Response(object):
 
         yield self._parse_response()
 
-    def _get_buffered_response(self):
-        """Returns a buffered response
+    def _get_buffered_response(self, response=None):
+        """Returns a buffered response, decoding the wrapped response only once
 
+        :param response: (optional) :class:`requests.Response` to decode, defaults to the wrapped response
         :return: Buffered response
         """
 
-        response = self._get_response()
+        if response is not None:
+            return self._decode_response(response)
+        elif self._buffered is None:
+            self._buffered = self._decode_response(self._response)
+            self.count = self._buffered[1]
+
+        return self._buffered
+
+    def _decode_response(self, response):
+        """Decodes a response body
+
+        :param response: :class:`requests.Response` to decode
+        :return: List of records and their count
+        """
+
+        response = self._get_response(response)
 
         if response.request.method == "DELETE" and response.status_code == 204:
             return [{"status": "record deleted"}], 1
+        elif self._parser_options:
+            # Build the records with the configured parser, rather than as decoded JSON
+            result = list(self._parse_response(response))
+            return result, len(result)
 
-        result = self._response.json().get("result", None)
+        result = self._codec.loads(response.content).get("result", None)
 
         if result is None:
             raise MissingResult(
@@ -173,6 +328,106 @@ class Response(object):
 
         return result, length
 
+    def _get_page(self, response, page):
+        """Yields the records of a page, keeping track of the last record and the number of records in `page`
+
+        :param response: :class:`requests.Response` of the page
+        :param page: Dictionary in which to track page state
+        """
+
+        if self._stream or self._spill is not None:
+            records = self._parse_response(response)
+        else:
+            # Pages add up, whether or not the page was decoded by the parser
+            count = self.count
+            records, length = self._get_buffered_response(response)
+            self.count = count + length
+
+        for record in records:
+            page["last"] = record
+            page["count"] += 1
+            yield record
+
+    def _get_paginated_response(self):
+        """Fetches subsequent pages using the pager, yielding the records of one page at a time.
+
+        If the pager supports it, the next page is requested in a background thread as soon as the headers of the
+        current page are available, which lets the network wait of page N+1 overlap with the parsing of page N.
+
+        :return: Generator of pages
+        """
+
+        pager = self._pager
+        executor = ThreadPoolExecutor(max_workers=1)
+        response = self._response
+
+        try:
+            while response is not None:
+                page = {"last": None, "count": 0}
+                next_page = None
+
+                if pager.prefetch:
+                    next_page = executor.submit(pager.next_page, response)
+
+                yield self._get_page(response, page)
+
+                if next_page is not None:
+                    response = next_page.result()
+                else:
+                    response = pager.next_page(response, page["last"], page["count"])
+        finally:
+            executor.shutdown(wait=False)
+
+    def _get_records(self):
+        """Returns the iterator of records shared by the methods of a streamed or paginated response"""
+
+        self._check_consumed()
+
+        if self._records is None:
+            if self._pager is not None:
+                self._records = chain.from_iterable(self._get_paginated_response())
+            else:
+                self._records = chain.from_iterable(self._get_streamed_response())
+
+        return self._records
+
+    def _read_head(self, size):
+        """Reads up to `size` records of a streamed or paginated response, keeping them
+
+        :param size: Number of records to read
+        :return: List of records
+        """
+
+        records = self._get_records()
+
+        while len(self._head) < size:
+            record = next(records, None)
+
+            if record is None:
+                break
+
+            self._head.append(record)
+
+        return self._head[:size]
+
+    def _iter_records(self):
+        """Yields the kept records, unless the stream was read past them, followed by those left in the stream"""
+
+        index = 0
+        records = self._get_records()
+
+        while not self._past_head and index < len(self._head):
+            yield self._head[index]
+            index += 1
+
+        for record in records:
+            if len(self._head) < 2:
+                self._head.append(record)
+            else:
+                self._past_head = True
+
+            yield record
+
     def all(self):
         """Returns a chained generator response containing all matching records
 
@@ -180,11 +435,282 @@ class Response(object):
             - Iterable response
         """
 
-        if self._stream:
-            return chain.from_iterable(self._get_streamed_response())
+        if self._pager is not None or self._stream:
+            return self._iter_records()
+        elif self._spill is not None:
+            return self._parse_response()
 
         return self._get_buffered_response()[0]
 
+    def _get_column_parser(self, fields, dtypes=None, batch_size=None):
+        intern = self._parser_options.get("intern")
+
+        return ColumnParser(
+            fields,
+            dtypes,
+            batch_size,
+            intern=InternTable(intern) if intern else None,
+            schema=self._parser_options.get("schema"),
+        )
+
+    def _iter_columns(self, parser, records=None):
+        """Feeds the response to a :class:`columns.ColumnParser`, yielding the batches it returns
+
+        :param parser: :class:`columns.ColumnParser` object
+        :param records: (optional) Iterable of records to append, instead of parsing the response events
+        """
+
+        if records is None and (self._pager is not None or self._records is not None):
+            # Pagers need the last record of each page, and a stream that was read from must be continued
+            records = self.all()
+        elif records is None and self._buffered is not None:
+            records = self._buffered[0]
+
+        if records is None:
+            try:
+                for columns in self._parse_response(parser=parser):
+                    yield columns
+            finally:
+                # The records aren't kept, and the body of a streamed response can only be read once
+                self._consumed = self._consumed or self._stream
+        else:
+            for record in records:
+                columns = parser.append(record)
+
+                if columns is not None:
+                    yield columns
+
+    def to_columns(self, fields, dtypes=None):
+        """Returns the values of `fields` as columns, built straight from the parser events without creating a
+        dictionary per record. Reference and display value objects are reduced to their `value`.
+
+        Columns are NumPy arrays if NumPy is installed, otherwise typed columns are :class:`array.array` objects
+        and others are lists.
+
+        :param fields: List of fields to return columns for
+        :param dtypes: (optional) Dictionary of field names and dtypes, e.g. {'reassignment_count': 'int64'}.
+            Array typecodes, or the names `float64`, `int64` and `bool`, can be used if NumPy isn't installed
+        :return:
+            - Ordered dictionary of field names and columns
+        """
+
+        parser = self._get_column_parser(fields, dtypes)
+
+        for _ in self._iter_columns(parser):
+            pass
+
+        return parser.flush()
+
+    def iter_arrow_batches(self, batch_size=10000, fields=None, schema=None):
+        """Converts the records into Arrow record batches of up to `batch_size` rows, as they are parsed.
+
+        The schema is taken from `schema` if given, otherwise it's inferred from the first batch and used for the
+        rest. Fields default to the fields of `schema`, or those of the first record.
+
+        :param batch_size: Maximum number of rows per batch
+        :param fields: (optional) List of fields to include
+        :param schema: (optional) :class:`pyarrow.Schema` to convert the records to
+        :return:
+            - Generator of :class:`pyarrow.RecordBatch` objects
+        """
+
+        require_pyarrow()
+        validate_concurrency(batch_size, "batch_size")
+
+        if schema is not None:
+            fields = schema.names
+
+        def batches():
+            records = None
+            batch_schema = schema
+
+            if fields is None:
+                records = iter(self.all())
+                first = next(records, None)
+
+                if first is None:
+                    return
+
+                parser = self._get_column_parser(
+                    list(first.keys()), batch_size=batch_size
+                )
+                records = chain([first], records)
+            else:
+                parser = self._get_column_parser(fields, batch_size=batch_size)
+
+            for columns in self._iter_columns(parser, records):
+                batch = get_record_batch(columns, batch_schema)
+                batch_schema = batch.schema
+                yield batch
+
+            if parser.rows:
+                yield get_record_batch(parser.flush(), batch_schema)
+
+        return batches()
+
+    def iter_batches(self, batch_size, fields=None, dtypes=None):
+        """Yields the records in lists of up to `batch_size` records, or in columns if `fields` is given
+
+        :param batch_size: Maximum number of records per batch
+        :param fields: (optional) List of fields to yield batches of columns for, see :meth:`to_columns`
+        :param dtypes: (optional) Dictionary of field names and column dtypes
+        :return:
+            - Generator of lists of records, or of ordered dictionaries of columns
+        """
+
+        validate_concurrency(batch_size, "batch_size")
+
+        if fields is not None:
+            parser = self._get_column_parser(fields, dtypes, batch_size)
+
+            def column_batches():
+                for columns in self._iter_columns(parser):
+                    yield columns
+
+                if parser.rows:
+                    yield parser.flush()
+
+            return column_batches()
+
+        def batches():
+            records = self.all()
+
+            if isinstance(records, list):
+                for offset in range(0, len(records), batch_size):
+                    yield records[offset : offset + batch_size]
+                return
+
+            while True:
+                batch = list(islice(records, batch_size))
+
+                if not batch:
+                    return
+
+                yield batch
+
+        return batches()
+
+    @staticmethod
+    def _map(spool):
+        """Maps a file into memory, read-only
+
+        :param spool: File object, moved to disk first if it's a spooled file
+        :return:
+            - :class:`mmap.mmap` object
+        """
+
+        fileno = spool.fileno()
+        spool.flush()
+
+        if not os.fstat(fileno).st_size:
+            raise MissingResult(
+                "The expected `result` key was missing in the response. Cannot continue"
+            )
+
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def views(self, spill=False):
+        """Returns lazy views of the records, for keeping many records around while only reading a few fields.
+
+        The raw body is kept, and the records are located by scanning it without decoding anything. Each
+        :class:`views.RecordView` stores the byte offsets of its record, and decodes a field only when it's accessed.
+
+        :param spill: (optional) Write the body to a temporary file and map it into memory, rather than keeping it
+            in memory, e.g. for large responses requested with stream=True. Spilled responses are always mapped
+        :return:
+            - :class:`views.RecordViews` sequence of record views
+        :raise:
+            - InvalidUsage: If the response is paginated, or its stream was read
+            - ResponseError: If there's an error in the response
+        """
+
+        if self._pager is not None:
+            raise InvalidUsage("views() is not available for paginated responses")
+        elif self._records is not None or self._consumed:
+            raise InvalidUsage("views() is not available once the stream was read")
+
+        response = self._get_response()
+
+        # The body of a streamed response can only be read once, by the views or by the parser
+        self._consumed = self._stream
+
+        if self._spill is not None:
+            buffer = self._map(self._get_spool(response))
+        elif spill:
+            with tempfile.TemporaryFile() as spool:
+                self._write(spool, response.iter_content(self._chunk_size))
+                buffer = self._map(spool)
+        else:
+            buffer = response.content
+
+        views = scan(buffer, self._codec)
+
+        self.count = len(views)
+        return views
+
+    def iter_raw(self, chunk_size=None):
+        """Yields the response body as it's received, without parsing it
+
+        :param chunk_size: (optional) Read and return up to this size (in bytes), defaults to the parser chunk size
+        :return:
+            - Generator of bytes
+        :raise:
+            - InvalidUsage: If the response is paginated
+        """
+
+        if self._pager is not None:
+            raise InvalidUsage("iter_raw() is not available for paginated responses")
+        elif self._records is not None or self._consumed:
+            raise InvalidUsage("iter_raw() is not available once the stream was read")
+        elif self._spill is not None:
+            reader = SpoolReader(self._get_spool(self._get_response()))
+            return iter(lambda: reader.read(chunk_size or self._chunk_size), b"")
+
+        return self._get_response().iter_content(chunk_size or self._chunk_size)
+
+    def iter_ndjson(self):
+        """Yields each record as a line of newline-delimited JSON
+
+        :return:
+            - Generator of bytes
+        """
+
+        for record in self.all():
+            line = json.dumps(
+                _to_json_record(record), separators=(",", ":"), default=_to_json
+            )
+            yield (line + "\n").encode("utf-8")
+
+    def save(self, where, chunk_size=None, ndjson=False):
+        """Writes the response body to a file without parsing it, or transcoded to newline-delimited JSON
+        if `ndjson` is True
+
+        :param where: Path or writable file-like object, e.g. a file or a socket opened with `makefile("wb")`
+        :param chunk_size: (optional) Read and write up to this size (in bytes), defaults to the parser chunk size
+        :param ndjson: Whether or not to write one record per line instead of the raw body
+        :return:
+            - Number of bytes written
+        """
+
+        chunks = self.iter_ndjson() if ndjson else self.iter_raw(chunk_size)
+
+        if isinstance(where, six.string_types):
+            with open(where, "wb") as f:
+                return self._write(f, chunks)
+
+        return self._write(where, chunks)
+
+    @staticmethod
+    def _write(f, chunks):
+        size = 0
+
+        for chunk in chunks:
+            f.write(chunk)
+            size += len(chunk)
+
+        return size
+
     def first(self):
         """Return the first record or raise an exception if the result doesn't contain any data
 
@@ -198,12 +724,12 @@ class Response(object):
         if not self._stream:
             raise InvalidUsage("first() is only available when stream=True")
 
-        try:
-            content = next(self.all())
-        except StopIteration:
+        head = self._read_head(1)
+
+        if not head:
             raise NoResults("No records found")
 
-        return content
+        return head[0]
 
     def first_or_none(self):
         """Return the first record or None
@@ -228,7 +754,15 @@ class Response(object):
             - NoResults: If the result is empty
         """
 
-        result, count = self._get_buffered_response()
+        if self._pager is not None or self._stream:
+            # Two records are enough to tell
+            result = self._read_head(2)
+            count = len(result)
+        elif self._spill is not None:
+            result = list(islice(self._parse_response(), 2))
+            count = len(result)
+        else:
+            result, count = self._get_buffered_response()
 
         if count == 0:
             raise NoResults("No records found")
@@ -259,7 +793,18 @@ class Response(object):
         :return: update response object
         """
 
-        return self._resource.update({"sys_id": self["sys_id"]}, payload)
+        return self._resource.update_by_sys_id(self["sys_id"], payload)
+
+    def patch(self, payload):
+        """Convenience method for partially updating a fetched record, sending only fields that changed
+
+        :param payload: update payload
+        :return: patch response object, or None if nothing changed
+        """
+
+        record = self.one()
+
+        return self._resource.patch(record["sys_id"], payload, record=record)
 
     def delete(self):
         """Convenience method for deleting a fetched record
@@ -267,7 +812,7 @@ class Response(object):
         :return: delete response object
         """
 
-        return self._resource.delete({"sys_id": self["sys_id"]})
+        return self._resource.delete_by_sys_id(self["sys_id"])
 
     def upload(self, *args, **kwargs):
         """Convenience method for attaching files to a fetched record
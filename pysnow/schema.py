@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import six
+
+from .exceptions import InvalidUsage
+
+
+def _to_bool(value):
+    return value in ("true", "1", True)
+
+
+def _to_datetime(value):
+    # Slicing is much faster than strptime, values are formatted as `YYYY-MM-DD hh:mm:ss`
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+    )
+
+
+def _to_date(value):
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+# Converters and column dtypes of the supported types
+CONVERTERS = {
+    int: (int, "float64"),
+    float: (float, "float64"),
+    Decimal: (Decimal, "float64"),
+    bool: (_to_bool, "bool"),
+    datetime: (_to_datetime, "datetime64[s]"),
+    date: (_to_date, "datetime64[D]"),
+}
+
+# Types of ServiceNow internal types and type names
+TYPES = {
+    "int": int,
+    "integer": int,
+    "longint": int,
+    "float": float,
+    "decimal": Decimal,
+    "currency": Decimal,
+    "price": Decimal,
+    "bool": bool,
+    "boolean": bool,
+    "datetime": datetime,
+    "glide_date_time": datetime,
+    "due_date": datetime,
+    "date": date,
+    "glide_date": date,
+}
+
+
+class Schema(object):
+    """Types of fields, used by the parser to convert values as they are parsed.
+
+    Values are converted once, when they arrive: `integer` fields to :class:`int`, `decimal` and `currency` fields
+    to :class:`decimal.Decimal`, `boolean` fields to :class:`bool`, and `glide_date_time` and `glide_date` fields to
+    naive (UTC) :class:`datetime.datetime` and :class:`datetime.date` objects. Empty values are converted to None.
+    Only raw values can be converted, not display values, which are formatted for the user.
+    In columnar mode, the columns are given matching dtypes instead and converted as a whole.
+
+    :param types: Dictionary of field names and types: Python types (int, float, bool, Decimal, datetime, date), or
+        ServiceNow internal types, e.g. {'opened_at': 'glide_date_time', 'reassignment_count': 'integer'}
+    :raise:
+        - InvalidUsage: If a type is not supported
+    """
+
+    def __init__(self, types):
+        self.types = {}
+
+        for field, type_ in dict(types).items():
+            if isinstance(type_, six.string_types):
+                type_ = TYPES.get(type_, type_)
+
+            if type_ not in CONVERTERS:
+                raise InvalidUsage(
+                    "Unsupported type for field '%s': %r, expected one of: %s"
+                    % (field, type_, ", ".join(sorted(TYPES)))
+                )
+
+            self.types[field] = type_
+
+        self.converters = dict(
+            (field, CONVERTERS[type_][0]) for field, type_ in self.types.items()
+        )
+
+    def __repr__(self):
+        return "<%s [%s]>" % (self.__class__.__name__, ", ".join(sorted(self.types)))
+
+    def __eq__(self, other):
+        return isinstance(other, Schema) and self.types == other.types
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    @classmethod
+    def from_dictionary(cls, entries):
+        """Creates a schema from `sys_dictionary` records, ignoring the fields of unsupported types.
+        Entries of the same field override earlier ones.
+
+        :param entries: Iterable of dictionaries with `element` and `internal_type` keys
+        :return:
+            - :class:`Schema` object
+        """
+
+        types = {}
+
+        for entry in entries:
+            internal_type = entry.get("internal_type")
+
+            if isinstance(internal_type, dict):
+                internal_type = internal_type.get("value")
+
+            if not entry.get("element"):
+                continue
+            elif internal_type in TYPES:
+                types[entry["element"]] = internal_type
+            else:
+                # Later entries take precedence, e.g. those of a child table
+                types.pop(entry["element"], None)
+
+        return cls(types)
+
+    def convert(self, field, value):
+        """Converts a value of `field`, values of fields not in the schema are returned as-is
+
+        :param field: Field name
+        :param value: Value, as returned by ServiceNow
+        :return: Converted value, or None if the value is empty
+        """
+
+        converter = self.converters.get(field)
+
+        if converter is None or not isinstance(value, six.string_types):
+            return value
+        elif value == "":
+            return None
+
+        return converter(value)
+
+    def get_dtype(self, field):
+        """Returns the column dtype of `field`, or None if the field is not in the schema
+
+        :param field: Field name
+        :return: NumPy dtype name
+        """
+
+        type_ = self.types.get(field)
+
+        return None if type_ is None else CONVERTERS[type_][1]
+
+
+def get_schema(types):
+    """Returns a :class:`Schema` for the `types` option of a request method
+
+    :param types: :class:`Schema` object, or dictionary of field names and types
+    :return:
+        - :class:`Schema` object
+    :raise:
+        - InvalidUsage: If `types` is not a schema or a dictionary
+    """
+
+    if isinstance(types, Schema):
+        return types
+    elif isinstance(types, dict):
+        return Schema(types)
+
+    raise InvalidUsage(
+        "Argument 'types' must be a dictionary of field names and types, a Schema or True"
+    )
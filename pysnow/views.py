@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+import array
+import re
+
+import six
+
+from .codec import get_codec
+from .exceptions import ResponseError, MissingResult
+
+# Patterns are unrolled so that runs of plain characters are matched at once
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+# Contents of an object or array holding only strings and scalars
+_FLAT = r'[^{}\[\]"]*(?:%s[^{}\[\]"]*)*' % _STRING
+
+# A string, a scalar, or an object or array of strings and scalars, e.g. a reference
+_VALUE = r'%s|[^"{}\[\],:\s]+|\{%s\}|\[%s\]' % (_STRING, _FLAT, _FLAT)
+
+
+def _compile(pattern):
+    return re.compile(pattern.encode("ascii"))
+
+
+_WHITESPACE = _compile(r"\s*")
+_TOKEN = _compile(r"%s|[{}\[\]]" % _STRING)
+_KEY = _compile(r"\s*(%s)\s*:\s*" % _STRING)
+_MEMBER = _compile(r"\s*(%s)\s*:\s*(%s)\s*(?:,|(?=\}))" % (_STRING, _VALUE))
+_RECORD = _compile(r"\{%s(?:(?:\{%s\}|\[%s\])%s)*\}" % (_FLAT, _FLAT, _FLAT, _FLAT))
+_SCALAR = _compile(r"[^,}\]\s]+")
+
+
+def _skip_whitespace(buffer, pos):
+    return _WHITESPACE.match(buffer, pos).end()
+
+
+def _skip_value(buffer, pos):
+    """Returns the end offset of the JSON value starting at `pos`"""
+
+    char = buffer[pos : pos + 1]
+
+    if char == b'"':
+        return _TOKEN.match(buffer, pos).end()
+    elif char not in (b"{", b"["):
+        return _SCALAR.match(buffer, pos).end()
+
+    # Containers nested deeper than the fast patterns allow, track the depth token by token
+    depth = 0
+
+    for match in _TOKEN.finditer(buffer, pos):
+        token = match.group()
+
+        if token in (b"{", b"["):
+            depth += 1
+        elif token in (b"}", b"]"):
+            depth -= 1
+
+            if depth == 0:
+                return match.end()
+
+    raise MissingResult("Unexpected end of the response content")
+
+
+def _decode(codec, raw):
+    if raw[:1] == b'"' and b"\\" not in raw:
+        # Plain strings don't need a JSON decoder
+        return raw[1:-1].decode("utf-8")
+
+    return codec.loads(raw)
+
+
+def _scan_records(buffer, pos, offsets):
+    """Appends the start and end offsets of the objects of the `result` array at `pos` to `offsets`"""
+
+    pos = _skip_whitespace(buffer, pos + 1)
+
+    while buffer[pos : pos + 1] != b"]":
+        match = _RECORD.match(buffer, pos)
+        end = match.end() if match is not None else _skip_value(buffer, pos)
+
+        if buffer[pos : pos + 1] == b"{":
+            offsets.append(pos)
+            offsets.append(end)
+
+        pos = _skip_whitespace(buffer, end)
+
+        if buffer[pos : pos + 1] == b",":
+            pos = _skip_whitespace(buffer, pos + 1)
+        elif buffer[pos : pos + 1] != b"]":
+            raise MissingResult("Unexpected end of the response content")
+
+
+def scan(buffer, codec=None):
+    """Finds the byte offsets of the records in a ServiceNow response, without decoding them
+
+    :param buffer: Bytes-like object, e.g. bytes or :class:`mmap.mmap`, of the response content
+    :param codec: (optional) :class:`codec.JSONCodec` to decode values with
+    :return:
+        - :class:`RecordViews` object
+    :raise:
+        - ResponseError: If there's an error in the response
+        - MissingResult: If no result nor error was found
+    """
+
+    codec = codec or get_codec()
+    offsets = array.array("q" if six.PY3 else "l")
+    pos = _skip_whitespace(buffer, 0)
+
+    if buffer[pos : pos + 1] == b"{":
+        pos += 1
+
+        while True:
+            match = _KEY.match(buffer, pos)
+
+            if match is None:
+                break
+
+            key = match.group(1)
+            start = match.end()
+
+            if key == b'"result"' and buffer[start : start + 1] == b"[":
+                _scan_records(buffer, start, offsets)
+                return RecordViews(buffer, offsets, codec)
+
+            end = _skip_value(buffer, start)
+
+            if key == b'"result"' and buffer[start : start + 1] == b"{":
+                offsets.extend([start, end])
+                return RecordViews(buffer, offsets, codec)
+            elif key == b'"error"':
+                raise ResponseError(codec.loads(bytes(buffer[start:end])))
+
+            pos = _skip_whitespace(buffer, end)
+
+            if buffer[pos : pos + 1] != b",":
+                break
+
+            pos += 1
+
+    raise MissingResult(
+        "The expected `result` key was missing in the response. Cannot continue"
+    )
+
+
+class RecordView(object):
+    """Read-only view of a record in a response buffer, which decodes fields only when they are accessed.
+
+    Views store the offsets of the record, and can be used as read-only mappings of field names and values. Values
+    are decoded on every access and not kept, use :meth:`_asdict` to decode the whole record.
+
+    :param views: :class:`RecordViews` object owning the buffer
+    :param start: Offset of the record in the buffer
+    :param end: End offset of the record in the buffer
+    """
+
+    __slots__ = ("_views", "_start", "_end")
+
+    def __init__(self, views, start, end):
+        self._views = views
+        self._start = start
+        self._end = end
+
+    @property
+    def raw(self):
+        """:class:`memoryview` of the record's JSON, without copying it"""
+
+        return memoryview(self._views.buffer)[self._start : self._end]
+
+    def _members(self):
+        """Yields the keys of the record and the offsets of their values, followed by None if the rest of the
+        record is nested deeper than the fast patterns allow"""
+
+        buffer = self._views.buffer
+        pos = self._start + 1
+
+        while True:
+            match = _MEMBER.match(buffer, pos, self._end)
+
+            if match is None:
+                break
+
+            yield match.group(1), match.start(2), match.end(2)
+            pos = match.end()
+
+        if buffer[_skip_whitespace(buffer, pos) : self._end] != b"}":
+            yield None
+
+    def __getitem__(self, key):
+        buffer = self._views.buffer
+        codec = self._views.codec
+        name = b'"' + key.encode("utf-8") + b'"'
+        pos = self._start + 1
+
+        while True:
+            match = _MEMBER.match(buffer, pos, self._end)
+
+            if match is None:
+                break
+
+            member = match.group(1)
+
+            if member == name or (b"\\" in member and codec.loads(member) == key):
+                return _decode(codec, match.group(2))
+
+            pos = match.end()
+
+        if buffer[_skip_whitespace(buffer, pos) : self._end] == b"}":
+            raise KeyError(key)
+
+        # The rest of the record is nested deeper than the fast patterns allow
+        return self._asdict()[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        codec = self._views.codec
+        members = list(self._members())
+
+        if members and members[-1] is None:
+            return list(self._asdict().keys())
+
+        return [_decode(codec, member[0]) for member in members]
+
+    def values(self):
+        return list(self._asdict().values())
+
+    def items(self):
+        return list(self._asdict().items())
+
+    def _asdict(self):
+        """Decodes the record into a dictionary"""
+
+        return self._views.codec.loads(bytes(self.raw))
+
+    def __eq__(self, other):
+        if isinstance(other, (RecordView, dict)):
+            return self._asdict() == other
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "<%s [%d:%d]>" % (self.__class__.__name__, self._start, self._end)
+
+
+class RecordViews(object):
+    """Sequence of :class:`RecordView` objects over a response buffer. The offsets of the records are stored in
+    an array, and views are created when accessed.
+
+    :param buffer: Bytes-like object of the response content
+    :param offsets: :class:`array.array` of the start and end offsets of each record
+    :param codec: :class:`codec.JSONCodec` to decode values with
+    """
+
+    def __init__(self, buffer, offsets, codec):
+        self.buffer = buffer
+        self.codec = codec
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        return RecordView(self, self._offsets[index * 2], self._offsets[index * 2 + 1])
+
+    def __iter__(self):
+        offsets = self._offsets
+
+        for i in range(0, len(offsets), 2):
+            yield RecordView(self, offsets[i], offsets[i + 1])
+
+    def __repr__(self):
+        return "<%s [%d]>" % (self.__class__.__name__, len(self))
+
+    def close(self):
+        """Closes the buffer if it's a memory-mapped file. Views can't be used after closing"""
+
+        if hasattr(self.buffer, "close"):
+            self.buffer.close()
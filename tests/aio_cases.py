@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Imported by test_aio.py on Python 3.5 and later
+import asyncio
+import json
+import unittest
+
+try:
+    from aiohttp import web
+    from pysnow.aio import AsyncClient, AsyncResponse
+
+    HAS_AIOHTTP = True
+except ImportError:  # pragma: no cover
+    HAS_AIOHTTP = False
+
+from pysnow.exceptions import (
+    InvalidUsage,
+    NoResults,
+    MultipleResults,
+    ResponseError,
+)
+
+
+def get_serialized_result(dict_mock):
+    return json.dumps({"result": dict_mock})
+
+
+mock_records = [
+    {"sys_id": "37ea2a00cf5c9c995399098ace1a5e19", "attr1": "foo1"},
+    {"sys_id": "98ace1a537ea2a00cf5c9c9953990e19", "attr1": "foo2"},
+    {"sys_id": "a00cf5c9c9953990e1998ace1a537ea2", "attr1": "foo3"},
+]
+
+
+@unittest.skipIf(not HAS_AIOHTTP, "aiohttp is not installed")
+class TestAsyncClient(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.requests = []
+        self.run_async(self.start_server())
+
+    def tearDown(self):
+        self.run_async(self.client.close())
+        self.run_async(self.runner.cleanup())
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    async def start_server(self):
+        async def handler(request):
+            body = await request.text()
+            self.requests.append((request.method, request.path, request.query, body))
+            return self.handle(request, body)
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = site._server.sockets[0].getsockname()[1]
+        self.client = AsyncClient(
+            host="127.0.0.1:%d" % port, user="user", password="password", use_ssl=False
+        )
+        self.resource = self.client.resource(api_path="/table/incident")
+
+    def handle(self, request, body):
+        query = request.query.get("sysparm_query")
+
+        if request.method == "DELETE":
+            return web.Response(status=204)
+        elif request.method in ("PUT", "PATCH", "POST"):
+            record = dict(json.loads(body), sys_id=request.path.rsplit("/", 1)[1])
+            return web.Response(
+                text=get_serialized_result(record), content_type="application/json"
+            )
+        elif query == "error=true":
+            return web.Response(
+                text=json.dumps({"error": {"message": "foo", "detail": "bar"}}),
+                content_type="application/json",
+            )
+        elif query == "sys_id=98ace1a537ea2a00cf5c9c9953990e19":
+            records = mock_records[1:2]
+        elif query == "empty=true":
+            records = []
+        else:
+            records = mock_records
+
+        return web.Response(
+            text=get_serialized_result(records), content_type="application/json"
+        )
+
+    def test_client_invalid_args(self):
+        """Invalid combinations of arguments should raise an exception"""
+
+        self.assertRaises(InvalidUsage, AsyncClient, instance="foo", host="foo")
+        self.assertRaises(InvalidUsage, AsyncClient, instance="foo")
+        self.assertRaises(
+            InvalidUsage, AsyncClient, instance="foo", user="a", password="b", use_ssl=1
+        )
+
+    def test_get_stream(self):
+        """Iterating over the response should yield all records"""
+
+        async def get():
+            response = await self.resource.get(query={})
+            return [record async for record in response], response
+
+        records, response = self.run_async(get())
+
+        self.assertEqual(records, mock_records)
+        self.assertEqual(response.count, 3)
+        self.assertEqual(type(response), AsyncResponse)
+        self.assertEqual(self.requests[0][2]["sysparm_display_value"], "False")
+
+    def test_get_all(self):
+        """:meth:`all` should return a list of all records"""
+
+        async def get():
+            return await (await self.resource.get(query={})).all()
+
+        self.assertEqual(self.run_async(get()), mock_records)
+
+    def test_get_one(self):
+        """:meth:`one` should return a single record or raise an exception"""
+
+        async def get(query):
+            return await (await self.resource.get(query=query)).one()
+
+        self.assertEqual(
+            self.run_async(get({"sys_id": mock_records[1]["sys_id"]})), mock_records[1]
+        )
+        self.assertRaises(MultipleResults, self.run_async, get({}))
+        self.assertRaises(NoResults, self.run_async, get({"empty": "true"}))
+
+    def test_get_first(self):
+        """:meth:`first` should return the first record"""
+
+        async def get(query):
+            return await (await self.resource.get(query=query)).first_or_none()
+
+        self.assertEqual(self.run_async(get({})), mock_records[0])
+        self.assertEqual(self.run_async(get({"empty": "true"})), None)
+
+    def test_get_error(self):
+        """An error in the response should raise ResponseError"""
+
+        async def get():
+            return await (await self.resource.get(query={"error": "true"})).all()
+
+        self.assertRaises(ResponseError, self.run_async, get())
+
+    def test_create(self):
+        """:meth:`create` should post the payload"""
+
+        async def create():
+            return await (await self.resource.create({"attr1": "foo"})).one()
+
+        self.assertEqual(self.run_async(create())["attr1"], "foo")
+        self.assertEqual(self.requests[0][0], "POST")
+
+    def test_update(self):
+        """:meth:`update` should look up the record and update it by sys_id"""
+
+        async def update():
+            query = {"sys_id": mock_records[1]["sys_id"]}
+            return await (await self.resource.update(query, {"attr1": "bar"})).one()
+
+        result = self.run_async(update())
+
+        self.assertEqual(result, {"sys_id": mock_records[1]["sys_id"], "attr1": "bar"})
+        self.assertEqual([r[0] for r in self.requests], ["GET", "PUT"])
+
+    def test_one_then_update(self):
+        """:meth:`one` and the convenience methods should share the records read from the response"""
+
+        async def get():
+            query = {"sys_id": mock_records[1]["sys_id"]}
+            response = await self.resource.get(query=query)
+            record = await response.one()
+
+            self.assertIs(await response.one(), record)
+            self.assertEqual(await response.all(), [record])
+
+            result = await response.update({"attr1": "bar"})
+            return await result.one()
+
+        self.assertEqual(
+            self.run_async(get()), {"sys_id": mock_records[1]["sys_id"], "attr1": "bar"}
+        )
+        self.assertEqual(self.requests[-1][0], "PUT")
+
+    def test_first_released(self):
+        """Only the records read by :meth:`first` should be available once it released the connection"""
+
+        async def get():
+            response = await self.resource.get(query={})
+            first = await response.first()
+
+            self.assertIs(await response.first(), first)
+            await response.all()
+
+        self.assertRaises(InvalidUsage, self.run_async, get())
+
+    def test_get_error_again(self):
+        """The error of a response should be raised by every accessor"""
+
+        async def get():
+            response = await self.resource.get(query={"error": "true"})
+
+            for _ in range(2):
+                with self.assertRaises(ResponseError):
+                    await response.one()
+
+        self.run_async(get())
+
+    def test_patch_no_changes(self):
+        """:meth:`patch` should skip the request if nothing changed"""
+
+        async def patch():
+            record = mock_records[0]
+            return await self.resource.patch(
+                record["sys_id"], {"attr1": "foo1"}, record
+            )
+
+        self.assertEqual(self.run_async(patch()), None)
+        self.assertEqual(self.requests, [])
+
+    def test_delete(self):
+        """:meth:`delete_by_sys_id` should delete the record without a lookup"""
+
+        async def delete():
+            return await self.resource.delete_by_sys_id(mock_records[0]["sys_id"])
+
+        self.assertEqual(self.run_async(delete()), {"status": "record deleted"})
+        self.assertEqual([r[0] for r in self.requests], ["DELETE"])
+
+    def test_concurrent_gets(self):
+        """Many queries should run concurrently on one event loop"""
+
+        async def get():
+            return await (await self.resource.get(query={})).all()
+
+        async def gather():
+            return await asyncio.gather(*[get() for _ in range(20)])
+
+        self.assertEqual(self.run_async(gather()), [mock_records] * 20)
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+import sys
+
+# The asyncio tests use syntax that's only available from Python 3.5, which Python 2 can't even compile
+if sys.version_info >= (3, 5):
+    from .aio_cases import *  # noqa: F401,F403
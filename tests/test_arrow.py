@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import httpretty
+
+from pysnow.client import Client
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def get_serialized_result(dict_mock):
+    return json.dumps({"result": dict_mock})
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(instance="mock_instance", user="foo", password="bar")
+        self.resource = self.client.resource(api_path="/table/incident")
+        self.url = self.resource._url_builder.get_url()
+
+        self.records = [
+            {
+                "number": "INC000%d" % i,
+                "reassignment_count": str(i),
+                "caller_id": {"link": "https://foo/sys_user/%d" % i, "value": str(i)},
+                "closed_at": "",
+            }
+            for i in range(5)
+        ]
+
+    def register(self, records):
+        httpretty.register_uri(
+            httpretty.GET,
+            self.url,
+            body=get_serialized_result(records),
+            status=200,
+            content_type="application/json",
+        )
+
+    @httpretty.activate
+    def test_iter_arrow_batches(self):
+        """Records should be converted into batches of `batch_size` rows with an inferred string schema"""
+
+        self.register(self.records)
+
+        response = self.resource.get(query={}, stream=True)
+        batches = list(response.iter_arrow_batches(2))
+
+        self.assertEqual([b.num_rows for b in batches], [2, 2, 1])
+        self.assertEqual(
+            batches[0].schema.names,
+            ["number", "reassignment_count", "caller_id", "closed_at"],
+        )
+        self.assertTrue(all(b.schema == batches[0].schema for b in batches))
+        self.assertEqual(
+            pyarrow.Table.from_batches(batches).column("caller_id").to_pylist(),
+            [str(i) for i in range(5)],
+        )
+
+    @httpretty.activate
+    def test_iter_arrow_batches_schema(self):
+        """Values should be converted to the types of the given schema"""
+
+        self.register(self.records)
+
+        schema = pyarrow.schema(
+            [
+                ("number", pyarrow.string()),
+                ("reassignment_count", pyarrow.int64()),
+                ("closed_at", pyarrow.timestamp("s")),
+            ]
+        )
+
+        response = self.resource.get(query={}, stream=True)
+        table = pyarrow.Table.from_batches(
+            list(response.iter_arrow_batches(3, schema=schema))
+        )
+
+        self.assertEqual(table.schema, schema)
+        self.assertEqual(table.column("reassignment_count").to_pylist(), list(range(5)))
+        self.assertEqual(table.column("closed_at").null_count, 5)
+
+    @httpretty.activate
+    def test_iter_arrow_batches_empty(self):
+        """No batches should be yielded for an empty result"""
+
+        self.register([])
+
+        response = self.resource.get(query={}, stream=True)
+        self.assertEqual(list(response.iter_arrow_batches(2)), [])
+
+    @httpretty.activate
+    def test_export_parquet(self):
+        """Records should be written to a Parquet file"""
+
+        self.register(self.records)
+
+        buf = io.BytesIO()
+        rows = self.resource.export_parquet(
+            buf, query={}, fields=["number", "caller_id"], batch_size=2
+        )
+
+        table = pyarrow.parquet.read_table(io.BytesIO(buf.getvalue()))
+
+        self.assertEqual(rows, 5)
+        self.assertEqual(table.schema.names, ["number", "caller_id"])
+        self.assertEqual(
+            table.column("number").to_pylist(), [r["number"] for r in self.records]
+        )
+        self.assertEqual(
+            httpretty.last_request().querystring["sysparm_fields"], ["number,caller_id"]
+        )
+
+    @httpretty.activate
+    def test_export_parquet_empty(self):
+        """An empty file with the schema of `fields` should be written for an empty result"""
+
+        self.register([])
+
+        buf = io.BytesIO()
+        rows = self.resource.export_parquet(buf, query={}, fields=["number"])
+
+        table = pyarrow.parquet.read_table(io.BytesIO(buf.getvalue()))
+
+        self.assertEqual(rows, 0)
+        self.assertEqual(table.schema.names, ["number"])
+
+
+class TestArrowImport(unittest.TestCase):
+    def test_import_lazy(self):
+        """pyarrow should be imported on first use, rather than along with pysnow"""
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pysnow; print('pyarrow' in sys.modules)",
+            ],
+            cwd=root,
+        )
+
+        self.assertEqual(output.strip(), b"False")
@@ -108,15 +108,7 @@ class TestAttachment(unittest.TestCase):
 
     @httpretty.activate
     def test_upload_delete(self):
-        """Deleting an attachment should trigger pysnow to perform a lookup followed by a delete"""
-
-        httpretty.register_uri(
-            httpretty.GET,
-            self.attachment_base_url,
-            body=get_serialized_result(attachment),
-            status=200,
-            content_type="application/json",
-        )
+        """Deleting an attachment should delete it by sys_id, without a lookup"""
 
         httpretty.register_uri(
             httpretty.DELETE,
@@ -130,6 +122,7 @@ class TestAttachment(unittest.TestCase):
         result = resource.attachments.delete(mock_sys_id)
 
         self.assertEqual(result, delete_status)
+        self.assertEqual([r.method for r in httpretty.latest_requests()], ["DELETE"])
 
     def test_upload_invalid_multipart_type(self):
         """Passing a non-bool type as multipart argument should raise InvalidUsage"""
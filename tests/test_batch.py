@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import base64
+import unittest
+import json
+import httpretty
+import pysnow
+
+from requests.exceptions import HTTPError
+
+from pysnow.batch import Batch
+from pysnow.exceptions import InvalidUsage, UnservicedRequest
+
+
+def get_serialized_result(dict_mock):
+    return json.dumps({"result": dict_mock})
+
+
+def encode(body):
+    return base64.b64encode(body.encode("utf-8")).decode("ascii")
+
+
+def decode(body):
+    return json.loads(base64.b64decode(body).decode("utf-8"))
+
+
+mock_sys_id = "98ace1a537ea2a00cf5c9c9953990e19"
+mock_api_path = "/table/incident"
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.client = pysnow.Client(instance="test", user="test", password="test")
+        self.resource = self.client.resource(api_path=mock_api_path)
+        self.batch_url = self.client.base_url + "/api/now/v1/batch"
+        self.batches = []
+
+    def register_batch(self, unserviced=(), failing=()):
+        def callback(request, uri, headers):
+            content = json.loads(request.body.decode("utf-8"))
+            self.batches.append(content)
+            serviced = []
+
+            if len(self.batches) in failing:
+                return 500, headers, ""
+
+            for r in content["rest_requests"]:
+                if r["id"] in unserviced:
+                    continue
+
+                if r["method"] == "DELETE":
+                    status, body = 204, ""
+                elif r["method"] == "POST":
+                    status, body = 201, get_serialized_result(decode(r["body"]))
+                else:
+                    record = dict(decode(r["body"]), sys_id=mock_sys_id)
+                    status, body = 200, get_serialized_result(record)
+
+                serviced.append(
+                    {
+                        "id": r["id"],
+                        "status_code": status,
+                        "status_text": "OK",
+                        "headers": [
+                            {"name": "Content-Type", "value": "application/json"}
+                        ],
+                        "body": encode(body),
+                    }
+                )
+
+            return (
+                200,
+                headers,
+                json.dumps(
+                    {
+                        "batch_request_id": content["batch_request_id"],
+                        "serviced_requests": serviced,
+                        "unserviced_requests": list(unserviced),
+                    }
+                ),
+            )
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.batch_url,
+            body=callback,
+            content_type="application/json",
+        )
+
+    def test_batch_type(self):
+        """`Client.batch()` should return a Batch object"""
+
+        self.assertEqual(type(self.client.batch()), Batch)
+
+    def test_invalid_max_requests(self):
+        """`Client.batch()` should raise an exception if max_requests isn't a positive integer"""
+
+        self.assertRaises(InvalidUsage, self.client.batch, max_requests=0)
+        self.assertRaises(InvalidUsage, self.client.batch, max_requests="1")
+
+    @httpretty.activate
+    def test_batch_requests(self):
+        """Queued requests should be sent in one batch and map back to per-request responses"""
+
+        self.register_batch()
+
+        with self.client.batch() as batch:
+            created = batch.create(self.resource, {"short_description": "foo"})
+            updated = batch.update(self.resource, mock_sys_id, {"state": "2"})
+            deleted = batch.delete(self.resource, mock_sys_id)
+
+        self.assertEqual(len(self.batches), 1)
+
+        rest_requests = self.batches[0]["rest_requests"]
+        self.assertEqual(
+            [r["method"] for r in rest_requests], ["POST", "PUT", "DELETE"]
+        )
+        self.assertTrue(
+            rest_requests[1]["url"].startswith(
+                "/api/now/table/incident/%s?" % mock_sys_id
+            )
+        )
+
+        self.assertEqual(created.response.one(), {"short_description": "foo"})
+        self.assertEqual(updated.response["state"], "2")
+        self.assertEqual(deleted.response.one(), {"status": "record deleted"})
+
+    @httpretty.activate
+    def test_batch_split(self):
+        """Requests should be split into batches of at most max_requests"""
+
+        self.register_batch()
+
+        batch = self.client.batch(max_requests=2)
+
+        for i in range(5):
+            batch.create(self.resource, {"number": str(i)})
+
+        sent = batch.send()
+
+        self.assertEqual([len(b["rest_requests"]) for b in self.batches], [2, 2, 1])
+        self.assertEqual(
+            [r.response["number"] for r in sent], [str(i) for i in range(5)]
+        )
+        self.assertEqual(len(set(r.id for r in sent)), 5)
+
+    @httpretty.activate
+    def test_batch_failed(self):
+        """Requests of a failed batch and the following ones should stay queued, and be sent again"""
+
+        self.register_batch(failing=[2])
+
+        batch = self.client.batch(max_requests=2)
+        requests = [batch.create(self.resource, {"number": str(i)}) for i in range(5)]
+
+        self.assertRaises(HTTPError, batch.send)
+        self.assertEqual(batch.queue, requests[2:])
+        self.assertEqual([r.sent for r in requests], [True, True, False, False, False])
+
+        # Ids of new requests should not collide with those still queued
+        requests.append(batch.create(self.resource, {"number": "5"}))
+        sent = batch.send()
+
+        self.assertEqual(sent, requests[2:])
+        self.assertEqual(batch.queue, [])
+        self.assertEqual(len(set(r.id for r in requests)), 6)
+        self.assertEqual(
+            [r.response["number"] for r in requests], [str(i) for i in range(6)]
+        )
+
+    @httpretty.activate
+    def test_batch_unserviced(self):
+        """Accessing the response of an unserviced request should raise an exception"""
+
+        self.register_batch(unserviced=["2"])
+
+        with self.client.batch() as batch:
+            first = batch.create(self.resource, {"number": "1"})
+            second = batch.create(self.resource, {"number": "2"})
+
+        self.assertEqual(first.response["number"], "1")
+        self.assertRaises(UnservicedRequest, getattr, second, "response")
+
+    def test_batch_not_sent(self):
+        """Accessing the response before the batch has been sent should raise an exception"""
+
+        batch = self.client.batch()
+        request = batch.create(self.resource, {"number": "1"})
+
+        self.assertRaises(InvalidUsage, getattr, request, "response")
+
+    def test_batch_invalid_update_payload(self):
+        """Queueing an update with a non-dict payload should raise an exception"""
+
+        batch = self.client.batch()
+
+        self.assertRaises(InvalidUsage, batch.update, self.resource, mock_sys_id, "foo")
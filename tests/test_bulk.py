@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+import unittest
+import json
+import re
+import threading
+import httpretty
+import pysnow
+
+from pysnow.bulk import BulkResult, BulkSummary
+from pysnow.exceptions import InvalidUsage
+
+
+def get_serialized_result(dict_mock):
+    return json.dumps({"result": dict_mock})
+
+
+class ConcurrencyTracker(object):
+    """Context manager counting the calls in flight, which waits until `expected` calls are in flight at once"""
+
+    def __init__(self, expected=3):
+        self.expected = expected
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._barrier = threading.Event()
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+            if self.current >= self.expected:
+                self._barrier.set()
+
+        self._barrier.wait(1)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.current -= 1
+
+
+class MockResponse(object):
+    def __init__(self, record):
+        self.record = record
+
+    def one(self):
+        return self.record
+
+    def __getitem__(self, key):
+        return self.record[key]
+
+
+mock_api_path = "/table/incident"
+mock_records = [{"sys_id": "sys_id_%d" % i} for i in range(5)]
+
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.client = pysnow.Client(instance="test", user="test", password="test")
+        self.resource = self.client.resource(api_path=mock_api_path)
+        self.base_url = self.resource._url_builder.get_url()
+
+    def register_update(self, method, failing=()):
+        def callback(request, uri, headers):
+            sys_id = uri.split("?")[0].rsplit("/", 1)[1]
+
+            if sys_id in failing:
+                return 500, headers, ""
+
+            payload = json.loads(request.body.decode("utf-8"))
+            return 200, headers, get_serialized_result(dict(payload, sys_id=sys_id))
+
+        httpretty.register_uri(
+            method,
+            re.compile(re.escape(self.base_url) + "/.+"),
+            body=callback,
+            content_type="application/json",
+        )
+
+    @httpretty.activate
+    def test_update_many(self):
+        """:meth:`update_many` should update all matching records by sys_id"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.base_url,
+            body=get_serialized_result(mock_records),
+            status=200,
+            content_type="application/json",
+        )
+        self.register_update(httpretty.PATCH, failing=["sys_id_3"])
+
+        summary = self.resource.update_many(
+            {"active": "true"}, {"state": "2"}, concurrency=1
+        )
+
+        self.assertEqual(
+            sorted(summary.succeeded), ["sys_id_0", "sys_id_1", "sys_id_2", "sys_id_4"]
+        )
+        self.assertEqual([r.item for r in summary.failed], ["sys_id_3"])
+        self.assertFalse(summary.failed[0].ok)
+
+        get_request = [r for r in httpretty.latest_requests() if r.method == "GET"][0]
+        self.assertEqual(get_request.querystring["sysparm_fields"], ["sys_id"])
+
+        # The lookup parameters should not leak into the updates
+        for request in httpretty.latest_requests():
+            if request.method == "PATCH":
+                self.assertNotIn("sysparm_fields", request.querystring)
+                self.assertNotIn("sysparm_query", request.querystring)
+
+        self.assertEqual(self.resource.parameters.query, "")
+
+    @httpretty.activate
+    def test_update_many_concurrent(self):
+        """:meth:`update_many` should send updates concurrently, with at most `concurrency` in flight"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.base_url,
+            body=get_serialized_result(mock_records),
+            status=200,
+            content_type="application/json",
+        )
+
+        tracker = ConcurrencyTracker()
+
+        def patch(sys_id, payload):
+            with tracker:
+                return MockResponse(dict(payload, sys_id=sys_id))
+
+        self.resource.patch = patch
+        summary = self.resource.update_many({}, {"state": "2"}, concurrency=3)
+
+        self.assertEqual(sorted(summary.succeeded), [r["sys_id"] for r in mock_records])
+        self.assertEqual(tracker.peak, 3)
+
+    @httpretty.activate
+    def test_update_many_put(self):
+        """:meth:`update_many` should use PUT if requested"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.base_url,
+            body=get_serialized_result(mock_records[:1]),
+            status=200,
+            content_type="application/json",
+        )
+        self.register_update(httpretty.PUT)
+
+        summary = self.resource.update_many({}, {"state": "2"}, method="PUT")
+
+        self.assertEqual(summary.succeeded, ["sys_id_0"])
+        self.assertEqual(summary.failed, [])
+
+    def test_update_many_invalid(self):
+        """:meth:`update_many` should validate its arguments"""
+
+        update_many = self.resource.update_many
+
+        self.assertRaises(InvalidUsage, update_many, {}, "foo")
+        self.assertRaises(InvalidUsage, update_many, {}, {}, method="POST")
+        self.assertRaises(InvalidUsage, update_many, {}, {}, concurrency=0)
+
+    @httpretty.activate
+    def test_create_many(self):
+        """:meth:`create_many` should lazily create records and yield a result per payload"""
+
+        def callback(request, uri, headers):
+            payload = json.loads(request.body.decode("utf-8"))
+
+            if payload["number"] == "2":
+                return 500, headers, ""
+
+            return 201, headers, get_serialized_result(payload)
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.base_url,
+            body=callback,
+            content_type="application/json",
+        )
+
+        payloads = ({"number": str(i)} for i in range(5))
+        results = list(self.resource.create_many(payloads, concurrency=1, ordered=True))
+
+        self.assertEqual([r.item["number"] for r in results], ["0", "1", "2", "3", "4"])
+        self.assertEqual([r.ok for r in results], [True, True, False, True, True])
+        self.assertEqual(results[0].response["number"], "0")
+
+    @httpretty.activate
+    def test_create_many_unordered(self):
+        """:meth:`create_many` with ordered=False should yield a result for every payload"""
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.base_url,
+            body=lambda request, uri, headers: (
+                201,
+                headers,
+                get_serialized_result(json.loads(request.body.decode("utf-8"))),
+            ),
+            content_type="application/json",
+        )
+
+        results = self.resource.create_many([{"number": str(i)} for i in range(5)], 1)
+
+        self.assertEqual(
+            sorted(r.response["number"] for r in results), ["0", "1", "2", "3", "4"]
+        )
+
+    def test_create_many_concurrent(self):
+        """:meth:`create_many` should send creates concurrently, with at most `concurrency` in flight"""
+
+        for ordered in (True, False):
+            tracker = ConcurrencyTracker()
+
+            def create(payload):
+                with tracker:
+                    if payload["number"] == "2":
+                        raise ValueError("Failed")
+
+                    return MockResponse(payload)
+
+            self.resource.create = create
+            payloads = ({"number": str(i)} for i in range(6))
+            results = list(
+                self.resource.create_many(payloads, concurrency=3, ordered=ordered)
+            )
+            numbers = [r.item["number"] for r in results]
+
+            self.assertEqual(sorted(numbers), ["0", "1", "2", "3", "4", "5"])
+            self.assertEqual(
+                [r.ok for r in results], [number != "2" for number in numbers]
+            )
+            self.assertEqual(tracker.peak, 3)
+
+            if ordered:
+                self.assertEqual(numbers, ["0", "1", "2", "3", "4", "5"])
+
+    def test_create_many_invalid_concurrency(self):
+        """:meth:`create_many` should raise an exception if concurrency isn't a positive integer"""
+
+        self.assertRaises(InvalidUsage, self.resource.create_many, [], concurrency=0)
+
+    def test_bulk_result(self):
+        """:class:`BulkResult` should be ok unless an error is set"""
+
+        self.assertTrue(BulkResult("foo", response=object()).ok)
+        self.assertFalse(BulkResult("foo", error=Exception()).ok)
+
+    def test_bulk_summary_repr(self):
+        """:class:`BulkSummary` repr should contain the number of succeeded and failed items"""
+
+        summary = BulkSummary(["a", "b"], [BulkResult("c", error=Exception())])
+
+        self.assertEqual(repr(summary), "<BulkSummary [succeeded: 2, failed: 1]>")
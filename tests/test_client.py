@@ -220,3 +220,21 @@ class TestClient(unittest.TestCase):
         params = {"foo": "bar"}
         c = Client(instance="test", user="foo", password="foo", request_params=params)
         self.assertEqual(c.request_params, params)
+
+    def test_client_json_codec(self):
+        """Client should resolve the JSON codec, and pass it along to resources"""
+
+        c = Client(instance="test", user="foo", password="bar", json_codec="json")
+
+        self.assertEqual(c.json_codec.name, "json")
+        self.assertEqual(
+            c.resource(api_path="/table/incident")._request._codec, c.json_codec
+        )
+        self.assertRaises(
+            InvalidUsage,
+            Client,
+            instance="test",
+            user="foo",
+            password="bar",
+            json_codec="foo",
+        )
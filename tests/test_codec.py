@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from pysnow.codec import CODECS, get_codec
+from pysnow.exceptions import InvalidUsage
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self):
+        self.obj = {"result": [{"sys_id": "1", "short_description": "caf\xe9"}]}
+
+    def test_get_codec_default(self):
+        """The default codec should be the fastest one available"""
+
+        available = []
+
+        for name in CODECS:
+            try:
+                available.append(get_codec(name).name)
+            except InvalidUsage:
+                pass
+
+        self.assertEqual(get_codec().name, available[0])
+
+    def test_get_codec_unknown(self):
+        """Unknown codecs should raise InvalidUsage"""
+
+        self.assertRaises(InvalidUsage, get_codec, "foo")
+
+    def test_codecs_bytes(self):
+        """Available codecs should encode to and decode from bytes"""
+
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+            except InvalidUsage:
+                continue
+
+            data = codec.dumps(self.obj)
+
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(json.loads(data.decode("utf-8")), self.obj)
+            self.assertEqual(
+                codec.loads(json.dumps(self.obj).encode("utf-8")), self.obj
+            )
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+import array
+import io
+import json
+import math
+import os
+import subprocess
+import sys
+import unittest
+
+from datetime import datetime
+from pysnow import columns
+from pysnow.columns import Column, ColumnParser
+from pysnow.parser import get_backend
+from pysnow.schema import Schema
+from pysnow.exceptions import InvalidUsage
+
+
+def parse_columns(result, *args, **kwargs):
+    parser = ColumnParser(*args, **kwargs)
+    content = json.dumps({"result": result}).encode("utf-8")
+    batches = []
+
+    for prefix, event, value in get_backend().parse(io.BytesIO(content)):
+        batch = parser.feed(prefix, event, value)
+
+        if batch is not None:
+            batches.append(batch)
+
+    parser.close()
+    batches.append(parser.flush())
+
+    return batches
+
+
+class WithoutNumpy(object):
+    def __enter__(self):
+        self.get_numpy, columns.get_numpy = columns.get_numpy, lambda: None
+
+    def __exit__(self, *args):
+        columns.get_numpy = self.get_numpy
+
+
+class TestColumnParser(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {
+                "number": "INC0001",
+                "reassignment_count": "1",
+                "active": "true",
+                "business_duration": "2.5",
+                "caller_id": {"link": "https://foo/sys_user/1", "value": "1"},
+                "work_notes": [{"a": "b"}],
+            },
+            {
+                "number": "INC0002",
+                "reassignment_count": "0",
+                "active": "false",
+                "business_duration": "",
+                "work_notes": [],
+            },
+        ]
+
+        self.fields = ["number", "caller_id", "reassignment_count", "active"]
+
+    def test_columns_lists(self):
+        """Untyped columns should contain the values, with reference values reduced and missing values as None"""
+
+        with WithoutNumpy():
+            result = parse_columns(self.records, self.fields)[0]
+
+        self.assertEqual(list(result.keys()), self.fields)
+        self.assertEqual(result["number"], ["INC0001", "INC0002"])
+        self.assertEqual(result["caller_id"], ["1", None])
+        self.assertEqual(result["reassignment_count"], ["1", "0"])
+
+    def test_columns_arrays(self):
+        """Typed columns should be arrays if NumPy isn't installed"""
+
+        dtypes = {"reassignment_count": "int64", "active": "bool"}
+
+        with WithoutNumpy():
+            result = parse_columns(self.records, self.fields, dtypes)[0]
+
+        self.assertEqual(type(result["reassignment_count"]), array.array)
+        self.assertEqual(list(result["reassignment_count"]), [1, 0])
+        self.assertEqual(list(result["active"]), [1, 0])
+
+    def test_columns_float(self):
+        """Empty values in float columns should be NaN"""
+
+        with WithoutNumpy():
+            result = parse_columns(
+                self.records, ["business_duration"], {"business_duration": "d"}
+            )[0]
+
+        self.assertEqual(result["business_duration"][0], 2.5)
+        self.assertTrue(math.isnan(result["business_duration"][1]))
+
+    def test_columns_single(self):
+        """A `result` object should give columns of one row"""
+
+        with WithoutNumpy():
+            result = parse_columns(self.records[0], ["number"])[0]
+
+        self.assertEqual(result["number"], ["INC0001"])
+
+    def test_columns_batches(self):
+        """Columns should be returned every `batch_size` rows"""
+
+        with WithoutNumpy():
+            batches = parse_columns(self.records * 2, ["number"], batch_size=3)
+
+        self.assertEqual(
+            [b["number"] for b in batches],
+            [["INC0001", "INC0002", "INC0001"], ["INC0002"]],
+        )
+
+    def test_columns_invalid(self):
+        """Invalid arguments should raise InvalidUsage"""
+
+        self.assertRaises(InvalidUsage, ColumnParser, "number")
+        self.assertRaises(InvalidUsage, ColumnParser, [])
+        self.assertRaises(InvalidUsage, ColumnParser, ["number"], {"foo": "d"})
+
+        with WithoutNumpy():
+            self.assertRaises(InvalidUsage, Column, "foo", "foo")
+
+    def test_columns_empty_int(self):
+        """Empty values in integer columns should raise InvalidUsage"""
+
+        column = Column("foo", "int32")
+        self.assertRaises(InvalidUsage, column.append, "")
+
+
+@unittest.skipIf(columns.get_numpy() is None, "NumPy is not installed")
+class TestColumnParserNumpy(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"number": "INC0001", "count": "1", "active": "true", "duration": "2.5"},
+            {"number": "INC0002", "count": "0", "active": "false", "duration": ""},
+        ]
+
+    def test_columns_numpy(self):
+        """Columns should be NumPy arrays of the given dtypes"""
+
+        numpy = columns.get_numpy()
+        dtypes = {"count": "int64", "active": "bool", "duration": "float64"}
+
+        result = parse_columns(
+            self.records, ["number", "count", "active", "duration"], dtypes
+        )[0]
+
+        self.assertEqual(result["number"].dtype, numpy.dtype(object))
+        self.assertEqual(result["number"].tolist(), ["INC0001", "INC0002"])
+        self.assertEqual(result["count"].dtype, numpy.dtype("int64"))
+        self.assertEqual(result["count"].tolist(), [1, 0])
+        self.assertEqual(result["active"].tolist(), [True, False])
+        self.assertEqual(result["duration"][0], 2.5)
+        self.assertTrue(numpy.isnan(result["duration"][1]))
+
+    def test_columns_numpy_other_dtype(self):
+        """Columns of non-numeric dtypes should be converted by NumPy"""
+
+        result = parse_columns(self.records, ["number"], {"number": "U7"})[0]
+        self.assertEqual(result["number"].dtype, columns.get_numpy().dtype("U7"))
+
+    def test_columns_schema(self):
+        """Columns of fields in the schema should be given matching dtypes, and converted as a whole"""
+
+        numpy = columns.get_numpy()
+        records = [
+            {"opened_at": "2024-01-02 10:20:30", "count": "1"},
+            {"opened_at": "", "count": ""},
+        ]
+        schema = Schema({"opened_at": "glide_date_time", "count": "integer"})
+
+        result = parse_columns(records, ["opened_at", "count"], schema=schema)[0]
+
+        self.assertEqual(result["opened_at"].dtype, numpy.dtype("datetime64[s]"))
+        self.assertEqual(
+            result["opened_at"][0], numpy.datetime64("2024-01-02T10:20:30")
+        )
+        self.assertTrue(numpy.isnat(result["opened_at"][1]))
+        self.assertEqual(result["count"][0], 1.0)
+        self.assertTrue(numpy.isnan(result["count"][1]))
+
+    def test_columns_schema_without_numpy(self):
+        """Without NumPy, fields without an array typecode should be converted value by value"""
+
+        schema = Schema({"opened_at": "glide_date_time", "active": "boolean"})
+        records = [{"opened_at": "2024-01-02 10:20:30", "active": "true"}]
+
+        with WithoutNumpy():
+            result = parse_columns(records, ["opened_at", "active"], schema=schema)[0]
+
+        self.assertEqual(result["opened_at"], [datetime(2024, 1, 2, 10, 20, 30)])
+        self.assertEqual(list(result["active"]), [1])
+
+    def test_columns_numpy_empty(self):
+        """Columns of an empty result should be empty arrays"""
+
+        result = parse_columns([], ["count"], {"count": "int64"})[0]
+        self.assertEqual(len(result["count"]), 0)
+
+    def test_numpy_import_lazy(self):
+        """NumPy should be imported on first use, rather than along with pysnow"""
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output(
+            [sys.executable, "-c", "import sys, pysnow; print('numpy' in sys.modules)"],
+            cwd=root,
+        )
+
+        self.assertEqual(output.strip(), b"False")
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from pysnow.concurrency import bounded_map, size_pool, validate_concurrency
+from pysnow.exceptions import InvalidUsage
+
+
+class TestConcurrency(unittest.TestCase):
+    def test_validate_concurrency(self):
+        """validate_concurrency() should only accept positive integers"""
+
+        self.assertEqual(validate_concurrency(2), 2)
+        self.assertRaises(InvalidUsage, validate_concurrency, 0)
+        self.assertRaises(InvalidUsage, validate_concurrency, True)
+        self.assertRaises(InvalidUsage, validate_concurrency, "2")
+
+    def test_size_pool(self):
+        """size_pool() should grow the connection pools of the session's adapters, but never shrink them"""
+
+        session = requests.Session()
+        retrying = HTTPAdapter(max_retries=3)
+        session.mount("https://", retrying)
+
+        size_pool(session, 32)
+
+        for adapter in session.adapters.values():
+            self.assertEqual(adapter._pool_maxsize, 32)
+            self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+        self.assertIs(session.adapters["https://"], retrying)
+        self.assertEqual(retrying.max_retries.total, 3)
+
+        size_pool(session, 4)
+        size_pool(None, 4)
+
+        self.assertEqual(session.adapters["https://"]._pool_maxsize, 32)
+
+    def test_bounded_map_ordered(self):
+        """bounded_map() should yield results in input order when ordered=True"""
+
+        def slow_identity(item):
+            time.sleep(0.01 * (5 - item))
+            return item
+
+        result = [f.result() for _, f in bounded_map(slow_identity, range(5), 3)]
+
+        self.assertEqual(result, list(range(5)))
+
+    def test_bounded_map_unordered(self):
+        """bounded_map() should yield every item when ordered=False"""
+
+        result = [
+            f.result() for _, f in bounded_map(lambda x: x * 2, range(10), 3, False)
+        ]
+
+        self.assertEqual(sorted(result), [x * 2 for x in range(10)])
+
+    def test_bounded_map_window(self):
+        """bounded_map() should never have more than `workers` calls in flight"""
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def track(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.005)
+            with lock:
+                state["active"] -= 1
+
+        list(bounded_map(track, range(20), 4))
+
+        self.assertTrue(state["peak"] <= 4)
+
+    def test_bounded_map_lazy(self):
+        """bounded_map() should pull items from the iterable lazily"""
+
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = bounded_map(lambda x: x, items(), 2)
+        next(results)
+        results.close()
+
+        self.assertTrue(len(consumed) < 100)
+
+    def test_bounded_map_exception(self):
+        """Exceptions raised by `func` should be available on the yielded future"""
+
+        def fail(item):
+            raise ValueError(item)
+
+        ((item, future),) = list(bounded_map(fail, [1], 1))
+
+        self.assertEqual(item, 1)
+        self.assertTrue(isinstance(future.exception(), ValueError))
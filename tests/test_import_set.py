@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import unittest
+import json
+import httpretty
+import pysnow
+
+from pysnow.import_set import ImportSet
+from pysnow.exceptions import InvalidUsage
+
+
+def get_serialized_result(dict_mock):
+    return json.dumps({"result": dict_mock})
+
+
+def get_transform_result(record):
+    return {
+        "transform_map": "u_incident_import",
+        "table": "incident",
+        "status": "inserted",
+        "sys_id": "sys_id_%s" % record["u_number"],
+    }
+
+
+class TestImportSet(unittest.TestCase):
+    def setUp(self):
+        self.client = pysnow.Client(instance="test", user="test", password="test")
+        self.import_set = self.client.import_set("u_incident_import")
+        self.base_url = self.client.base_url + "/api/now/import/u_incident_import"
+        self.bodies = []
+
+    def register_insert_multiple(self):
+        def callback(request, uri, headers):
+            records = json.loads(request.body.decode("utf-8"))["records"]
+            self.bodies.append(records)
+
+            return (
+                201,
+                headers,
+                json.dumps(
+                    {
+                        "import_set_id": "import_set_id",
+                        "result": [get_transform_result(r) for r in records],
+                    }
+                ),
+            )
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.base_url + "/insertMultiple",
+            body=callback,
+            content_type="application/json",
+        )
+
+    def test_import_set_type(self):
+        """`Client.import_set()` should return an ImportSet for the staging table"""
+
+        self.assertEqual(type(self.import_set), ImportSet)
+        self.assertEqual(
+            self.import_set.resource.path, "/api/now/import/u_incident_import"
+        )
+
+    def test_import_set_invalid_table(self):
+        """`Client.import_set()` should raise an exception if the table name is invalid"""
+
+        self.assertRaises(InvalidUsage, self.client.import_set, "foo/")
+
+    @httpretty.activate
+    def test_insert(self):
+        """:meth:`insert` should post a single record to the staging table"""
+
+        record = {"u_number": "1"}
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.base_url,
+            body=get_serialized_result([get_transform_result(record)]),
+            status=201,
+            content_type="application/json",
+        )
+
+        response = self.import_set.insert(record)
+
+        self.assertEqual(list(response.all()), [get_transform_result(record)])
+
+    @httpretty.activate
+    def test_insert_multiple(self):
+        """:meth:`insert_multiple` should send chunks of records and yield transform results in order"""
+
+        self.register_insert_multiple()
+
+        records = ({"u_number": str(i)} for i in range(7))
+        results = list(
+            self.import_set.insert_multiple(records, chunk_size=3, concurrency=1)
+        )
+
+        self.assertEqual(
+            [r["sys_id"] for r in results], ["sys_id_%d" % i for i in range(7)]
+        )
+        self.assertEqual(sorted(len(b) for b in self.bodies), [1, 3, 3])
+
+    def test_chunks_max_bytes(self):
+        """Chunks should be split when exceeding max_bytes"""
+
+        records = [{"u_description": "x" * 10}] * 4
+        chunks = list(ImportSet._get_chunks(records, 100, 80))
+
+        self.assertEqual([len(json.loads(c)["records"]) for c in chunks], [2, 2])
+
+        # The size of the body includes the `records` envelope
+        for max_bytes in range(47, 120):
+            chunks = list(ImportSet._get_chunks(records, 100, max_bytes))
+
+            self.assertTrue(all(len(c) <= max_bytes for c in chunks))
+            self.assertEqual(sum(len(json.loads(c)["records"]) for c in chunks), 4)
+
+    def test_chunks_max_bytes_record(self):
+        """A record that doesn't fit in a body of max_bytes should raise an exception"""
+
+        records = [{"u_description": "x"}, {"u_description": "x" * 100}]
+        chunks = ImportSet._get_chunks(records, 100, 80)
+
+        self.assertRaises(InvalidUsage, list, chunks)
+
+    def test_insert_multiple_invalid(self):
+        """:meth:`insert_multiple` should validate its arguments"""
+
+        insert_multiple = self.import_set.insert_multiple
+
+        self.assertRaises(InvalidUsage, insert_multiple, [], chunk_size=0)
+        self.assertRaises(InvalidUsage, insert_multiple, [], concurrency=0)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pysnow.pagination import KeysetPager
+from pysnow.params_builder import ParamsBuilder
+from pysnow.exceptions import InvalidUsage
+
+
+class MockRequest(object):
+    def __init__(self, query=""):
+        self._parameters = ParamsBuilder()
+        self._parameters.query = query
+
+
+class TestKeysetPager(unittest.TestCase):
+    def test_first_page_query(self):
+        """The first page should be ordered by the keys"""
+
+        pager = KeysetPager(MockRequest("active=true"), ["sys_updated_on", "sys_id"])
+
+        self.assertEqual(
+            pager.get_query(), "active=true^ORDERBYsys_updated_on^ORDERBYsys_id"
+        )
+
+    def test_single_key_query(self):
+        """The query following a record should seek past its key"""
+
+        pager = KeysetPager(MockRequest("active=true"), "sys_id")
+
+        self.assertEqual(
+            pager.get_query({"sys_id": "abc"}), "active=true^sys_id>abc^ORDERBYsys_id"
+        )
+
+    def test_composite_key_query(self):
+        """Composite keys should seek using one ^NQ branch per key"""
+
+        pager = KeysetPager(MockRequest(), "sys_updated_on,sys_id")
+        last = {"sys_updated_on": "2020-01-01 10:00:00", "sys_id": "abc"}
+
+        self.assertEqual(
+            pager.get_query(last),
+            "sys_updated_on>2020-01-01 10:00:00"
+            "^NQsys_updated_on=2020-01-01 10:00:00^sys_id>abc"
+            "^ORDERBYsys_updated_on^ORDERBYsys_id",
+        )
+
+    def test_reference_key_value(self):
+        """Reference fields should seek by their value"""
+
+        pager = KeysetPager(MockRequest(), ["caller_id"])
+        last = {"caller_id": {"link": "http://foo", "value": "abc"}}
+
+        self.assertEqual(pager.get_query(last), "caller_id>abc^ORDERBYcaller_id")
+
+    def test_missing_key(self):
+        """Records missing the key should raise an exception"""
+
+        pager = KeysetPager(MockRequest(), ["sys_id"])
+
+        self.assertRaises(InvalidUsage, pager.get_query, {"foo": "bar"})
+
+    def test_invalid_keys(self):
+        """Invalid keys should raise an exception"""
+
+        self.assertRaises(InvalidUsage, KeysetPager, MockRequest(), [])
+        self.assertRaises(InvalidUsage, KeysetPager, MockRequest(), [1])
+
+    def test_invalid_query(self):
+        """Queries containing ^NQ or ORDERBY cannot be combined with keyset pagination"""
+
+        self.assertRaises(
+            InvalidUsage, KeysetPager, MockRequest("a=b^NQc=d"), ["sys_id"]
+        )
+        self.assertRaises(
+            InvalidUsage, KeysetPager, MockRequest("a=b^ORDERBYc"), ["sys_id"]
+        )
+
+    def test_last_page(self):
+        """No request should be sent after a page smaller than the limit"""
+
+        request = MockRequest()
+        request._parameters.limit = 10
+        pager = KeysetPager(request, ["sys_id"])
+
+        self.assertEqual(pager.next_page(None, {"sys_id": "abc"}, 9), None)
+        self.assertEqual(pager.next_page(None, None, 0), None)
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import unittest
+
+from pysnow.parser import (
+    BACKENDS,
+    InternTable,
+    ResultParser,
+    get_backend,
+    get_backend_name,
+    get_parser,
+    pop_parser_options,
+)
+from pysnow.record import DisplayValue, Record, Reference
+from pysnow.exceptions import InvalidUsage, ResponseError, MissingResult
+
+
+class TestParserBackend(unittest.TestCase):
+    def test_get_backend_default(self):
+        """The default backend should be the fastest one available"""
+
+        available = []
+
+        for name in BACKENDS:
+            try:
+                available.append(get_backend_name(get_backend(name)))
+            except InvalidUsage:
+                pass
+
+        self.assertEqual(get_backend_name(get_backend()), available[0])
+
+    def test_get_backend_python(self):
+        """The pure-Python backend should always be available"""
+
+        backend = get_backend("python")
+
+        self.assertEqual(get_backend_name(backend), "python")
+        self.assertTrue(hasattr(backend, "parse"))
+
+    def test_get_backend_unknown(self):
+        """Unknown backends should raise InvalidUsage"""
+
+        self.assertRaises(InvalidUsage, get_backend, "foo")
+
+
+def parse(content, **kwargs):
+    parser = get_parser(**kwargs)
+    records = []
+
+    for prefix, event, value in get_backend().parse(io.BytesIO(content)):
+        record = parser.feed(prefix, event, value)
+
+        if record is not None:
+            records.append(record)
+
+    parser.close()
+    return records
+
+
+class TestResultParser(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {
+                "sys_id": "37ea2a00cf5c9c995399098ace1a5e19",
+                "number": "INC0001",
+                "caller_id": {"link": "https://foo/sys_user/1", "value": "1"},
+                "work_notes": [{"a": [1, {"b": "c"}]}, []],
+                "caller_id.name": "Foo",
+            },
+            {
+                "sys_id": "98ace1a537ea2a00cf5c9c9953990e19",
+                "number": "INC0002",
+                "caller_id": "",
+                "work_notes": [],
+                "caller_id.name": "",
+            },
+        ]
+
+    def test_parse_many(self):
+        """Records of a `result` array should be built"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        self.assertEqual(parse(content), self.records)
+
+    def test_parse_single(self):
+        """A `result` object should be built"""
+
+        content = json.dumps({"result": self.records[0]}).encode("utf-8")
+        self.assertEqual(parse(content), self.records[:1])
+
+    def test_parse_error(self):
+        """An `error` object should raise ResponseError"""
+
+        content = json.dumps({"error": {"message": "foo"}}).encode("utf-8")
+        self.assertRaises(ResponseError, parse, content)
+
+    def test_parse_missing_result(self):
+        """A response without `result` or `error` should raise MissingResult"""
+
+        self.assertRaises(MissingResult, parse, b'{"foo": []}')
+
+    def test_parse_projection(self):
+        """Only fields in the projection should be built, including nested values and dotted names"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        fields = ["number", "caller_id", "caller_id.name"]
+
+        self.assertEqual(
+            parse(content, fields=fields),
+            [dict((k, r[k]) for k in fields) for r in self.records],
+        )
+
+    def test_parse_projection_single(self):
+        """Projection should apply to a `result` object"""
+
+        content = json.dumps({"result": self.records[0]}).encode("utf-8")
+
+        self.assertEqual(
+            parse(content, fields=["sys_id"]),
+            [{"sys_id": self.records[0]["sys_id"]}],
+        )
+
+    def test_parse_projection_missing(self):
+        """Fields missing from the response should be left out"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        self.assertEqual(parse(content, fields=["foo"]), [{}, {}])
+
+    def test_parse_slots(self):
+        """Records should be built as instances of the record class, with missing fields set to None"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        options = pop_parser_options(
+            {"record_class": "slots", "projection": ["number", "caller_id", "foo"]}
+        )
+        records = parse(content, **options)
+
+        self.assertTrue(all(isinstance(r, Record) for r in records))
+        self.assertEqual(records[0].number, "INC0001")
+        self.assertEqual(records[0]["caller_id"], self.records[0]["caller_id"])
+        self.assertEqual(records[1].foo, None)
+
+    def test_parse_objects(self):
+        """Flat and nested object values should be built as dictionaries"""
+
+        records = [
+            {"a": {}, "b": {"c": "d", "e": {"f": [1, {"g": None}]}, "h": 1.5}},
+            {"a": {"link": "https://foo/sys_user/1", "value": "1", "foo": "bar"}},
+        ]
+        content = json.dumps({"result": records}).encode("utf-8")
+
+        self.assertEqual(parse(content), records)
+        self.assertEqual(parse(content, references="value"), records)
+
+    def test_parse_references_value(self):
+        """Reference objects should be collapsed to their value with references='value'"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        records = parse(content, references="value")
+
+        self.assertEqual(records[0]["caller_id"], "1")
+        self.assertEqual(records[0]["work_notes"], self.records[0]["work_notes"])
+        self.assertEqual(records[1], self.records[1])
+
+    def test_parse_references_tuple(self):
+        """Reference objects should be collapsed to a Reference with references='tuple'"""
+
+        content = json.dumps({"result": self.records}).encode("utf-8")
+        options = pop_parser_options(
+            {
+                "record_class": "slots",
+                "projection": ["caller_id"],
+                "references": "tuple",
+            }
+        )
+
+        for record in [
+            parse(content, references="tuple")[0],
+            parse(content, **options)[0],
+        ]:
+            self.assertEqual(
+                record["caller_id"], Reference("1", "https://foo/sys_user/1")
+            )
+            self.assertEqual(record["caller_id"].value, "1")
+
+    def test_parse_display_values(self):
+        """Display value objects should be collapsed to a DisplayValue with display_values='tuple'"""
+
+        records = [
+            {
+                "state": {"display_value": "New", "value": "1"},
+                "caller_id": {
+                    "display_value": "Foo",
+                    "link": "https://foo/sys_user/1",
+                    "value": "1",
+                },
+                "sys_tags": {"display_value": "", "value": "", "foo": "bar"},
+            }
+        ]
+        content = json.dumps({"result": records}).encode("utf-8")
+        record = parse(content, display_values="tuple")[0]
+
+        self.assertEqual(record["state"], DisplayValue("1", "New", None))
+        self.assertEqual(
+            record["caller_id"], DisplayValue("1", "Foo", "https://foo/sys_user/1")
+        )
+        self.assertEqual(record["sys_tags"], records[0]["sys_tags"])
+
+    def test_parse_types(self):
+        """Values should be converted to the types of the schema"""
+
+        records = [
+            {"count": "3", "active": {"display_value": "Yes", "value": "true"}},
+            {"count": "", "active": {"display_value": "No", "value": "false"}},
+        ]
+        content = json.dumps({"result": records}).encode("utf-8")
+        options = pop_parser_options(
+            {
+                "types": {"count": "integer", "active": "boolean"},
+                "display_values": "tuple",
+            }
+        )
+        records = parse(content, **options)
+
+        self.assertEqual(
+            records[0], {"count": 3, "active": DisplayValue(True, "Yes", None)}
+        )
+        self.assertEqual(records[1]["count"], None)
+        self.assertEqual(records[1]["active"].value, False)
+
+    def test_parse_types_display_value_objects(self):
+        """The raw value of display value objects should be converted if they aren't collapsed"""
+
+        records = [
+            {
+                "count": {"display_value": "3", "value": "3"},
+                "active": {"display_value": "Yes", "value": "true"},
+                "caller_id": {
+                    "display_value": "Foo",
+                    "link": "https://foo/sys_user/1",
+                    "value": "1",
+                },
+            }
+        ]
+        content = json.dumps({"result": records}).encode("utf-8")
+        options = pop_parser_options(
+            {"types": {"count": "integer", "active": "boolean"}}
+        )
+
+        self.assertEqual(
+            parse(content, **options)[0],
+            {
+                "count": {"display_value": "3", "value": 3},
+                "active": {"display_value": "Yes", "value": True},
+                "caller_id": records[0]["caller_id"],
+            },
+        )
+
+    def test_parse_intern(self):
+        """Repeated keys and string values should share one object if interning is enabled"""
+
+        records = [
+            {"state": "open%d" % (i % 2), "x" * 200: "y" * 200} for i in range(4)
+        ]
+        content = json.dumps({"result": records}).encode("utf-8")
+
+        parsed = parse(content, intern=100)
+        keys = [list(r.keys())[0] for r in parsed]
+
+        self.assertEqual(parsed, records)
+        self.assertIs(parsed[0]["state"], parsed[2]["state"])
+        self.assertIs(keys[0], keys[1])
+        self.assertIsNot(parsed[0]["x" * 200], parsed[1]["x" * 200])
+
+
+class TestInternTable(unittest.TestCase):
+    def test_intern(self):
+        """Equal strings should be returned as the first one seen"""
+
+        table = InternTable()
+        a, b = "".join(["fo", "o"]), "".join(["f", "oo"])
+
+        self.assertIs(table(a), a)
+        self.assertIs(table(b), a)
+
+    def test_intern_bounded(self):
+        """The table should be cleared when full, and long strings shouldn't be interned"""
+
+        table = InternTable(max_size=2, max_length=3)
+
+        table("a")
+        table("b")
+        self.assertEqual(len(table), 2)
+
+        table("c")
+        self.assertEqual(len(table), 1)
+
+        table("long")
+        self.assertEqual(len(table), 1)
+
+
+class TestParserOptions(unittest.TestCase):
+    def test_options_projection(self):
+        """Projection should be validated and extended with required fields"""
+
+        kwargs = {"projection": ["a"], "foo": "bar"}
+
+        self.assertEqual(
+            pop_parser_options(kwargs, required=["b"]), {"fields": ["a", "b"]}
+        )
+        self.assertEqual(kwargs, {"foo": "bar"})
+        self.assertEqual(pop_parser_options({}), {})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"projection": "a"})
+
+    def test_options_record_class(self):
+        """record_class='slots' should take its fields from the projection or `fields`"""
+
+        options = pop_parser_options({"record_class": "slots"}, fields=["a", "b", "a"])
+
+        self.assertEqual(options["record_class"]._fields, ("a", "b"))
+        self.assertEqual(pop_parser_options({"record_class": "dict"}), {})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"record_class": "slots"})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"record_class": "foo"})
+
+    def test_options_references(self):
+        """references should be either 'value' or 'tuple'"""
+
+        self.assertEqual(
+            pop_parser_options({"references": "value"}), {"references": "value"}
+        )
+        self.assertEqual(pop_parser_options({"references": None}), {})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"references": "foo"})
+
+    def test_options_display_values(self):
+        """display_values should be 'tuple'"""
+
+        self.assertEqual(
+            pop_parser_options({"display_values": "tuple"}),
+            {"display_values": "tuple"},
+        )
+        self.assertRaises(InvalidUsage, pop_parser_options, {"display_values": "foo"})
+
+    def test_options_intern(self):
+        """intern should be a boolean or the maximum size of the intern table"""
+
+        self.assertEqual(pop_parser_options({"intern": True}), {"intern": 10000})
+        self.assertEqual(pop_parser_options({"intern": 10}), {"intern": 10})
+        self.assertEqual(pop_parser_options({"intern": False}), {})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"intern": 0})
+        self.assertRaises(InvalidUsage, pop_parser_options, {"intern": "foo"})
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import pickle
+import unittest
+
+from pysnow.record import (
+    DisplayValue,
+    Record,
+    Reference,
+    get_display_value,
+    get_record_class,
+    get_value,
+)
+
+
+class TestRecord(unittest.TestCase):
+    def setUp(self):
+        self.fields = ["sys_id", "number", "caller_id.name", "class", "keys"]
+        self.record_class = get_record_class(self.fields)
+        self.record = self.record_class("1", "INC0001", "Foo", "incident", None)
+
+    def test_record_class_cached(self):
+        """Record classes should be generated once per field list"""
+
+        self.assertIs(get_record_class(list(self.fields)), self.record_class)
+        self.assertIsNot(get_record_class(["sys_id"]), self.record_class)
+        self.assertTrue(issubclass(self.record_class, Record))
+
+    def test_record_slots(self):
+        """Records should not have a __dict__"""
+
+        self.assertFalse(hasattr(self.record, "__dict__"))
+        self.assertRaises(AttributeError, setattr, self.record, "foo", "bar")
+
+    def test_record_mapping(self):
+        """Records should be usable as read-only mappings"""
+
+        record = self.record
+
+        self.assertEqual(record["number"], "INC0001")
+        self.assertEqual(record["caller_id.name"], "Foo")
+        self.assertEqual(record["class"], "incident")
+        self.assertEqual(record.get("keys"), None)
+        self.assertEqual(record.get("foo", "bar"), "bar")
+        self.assertRaises(KeyError, record.__getitem__, "foo")
+        self.assertTrue("sys_id" in record)
+        self.assertFalse("foo" in record)
+        self.assertEqual(list(record), self.fields)
+        self.assertEqual(len(record), 5)
+        self.assertEqual(record.values(), ["1", "INC0001", "Foo", "incident", None])
+
+    def test_record_attributes(self):
+        """Fields that are valid identifiers should be accessible as attributes"""
+
+        self.assertEqual(self.record.sys_id, "1")
+        self.assertEqual(self.record.number, "INC0001")
+
+    def test_record_equality(self):
+        """Records should compare equal to records and dictionaries with the same items"""
+
+        other = self.record_class("1", "INC0001", "Foo", "incident", None)
+
+        self.assertEqual(self.record, other)
+        self.assertEqual(self.record, self.record._asdict())
+        self.assertNotEqual(self.record, {"sys_id": "1"})
+
+    def test_record_pickle(self):
+        """Records should survive pickling"""
+
+        self.assertEqual(pickle.loads(pickle.dumps(self.record)), self.record)
+
+    def test_record_duplicate_fields(self):
+        """Duplicate field names should raise ValueError"""
+
+        self.assertRaises(ValueError, get_record_class, ["a", "a"])
+
+
+class TestReference(unittest.TestCase):
+    def test_reference(self):
+        """References should be lightweight tuples of value and link"""
+
+        reference = Reference("1", "https://foo/sys_user/1")
+
+        self.assertEqual(reference.value, "1")
+        self.assertEqual(reference.link, "https://foo/sys_user/1")
+        self.assertFalse(hasattr(reference, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(reference)), reference)
+
+    def test_get_value(self):
+        """get_value should unwrap references and reference objects"""
+
+        self.assertEqual(get_value(Reference("1", "https://foo")), "1")
+        self.assertEqual(get_value({"link": "https://foo", "value": "1"}), "1")
+        self.assertEqual(get_value({"display_value": "Foo"}), {"display_value": "Foo"})
+        self.assertEqual(get_value("1"), "1")
+
+    def test_display_value(self):
+        """get_value and get_display_value should unwrap display values and display value objects"""
+
+        value = DisplayValue("1", "New", None)
+
+        self.assertEqual(get_value(value), "1")
+        self.assertEqual(get_display_value(value), "New")
+        self.assertEqual(
+            get_display_value({"display_value": "New", "value": "1"}), "New"
+        )
+        self.assertEqual(get_display_value("New"), "New")
+        self.assertEqual(value.link, None)
@@ -2,11 +2,17 @@
 import unittest
 import httpretty
 import json
+import io
+import os
+import tempfile
 from six.moves.urllib.parse import urlparse, unquote
 
 from pysnow.response import Response
 from pysnow.client import Client
 from pysnow.attachment import Attachment
+from pysnow.parser import get_backend, get_backend_name
+from pysnow.codec import JSONCodec, get_codec
+from pysnow.record import DisplayValue, Reference
 
 from requests.exceptions import HTTPError
 
@@ -17,6 +23,7 @@ from pysnow.exceptions import (
     InvalidUsage,
     MissingResult,
     EmptyContent,
+    UnexpectedResponseFormat,
 )
 
 
@@ -135,6 +142,62 @@ class TestResourceRequest(unittest.TestCase):
         self.assertEquals(r._api_path, self.api_path)
         self.assertEquals(r.path, self.base_path + self.api_path)
 
+    def test_create_resource_parser_backend(self):
+        """:class:`Resource` should report the selected parser backend, defaulting to the fastest available"""
+
+        r = self.client.resource(api_path=self.api_path, parser_backend="python")
+
+        self.assertEqual(r.parser_backend, "python")
+        self.assertEqual(self.resource.parser_backend, get_backend_name(get_backend()))
+        self.assertRaises(
+            InvalidUsage,
+            self.client.resource,
+            api_path=self.api_path,
+            parser_backend="foo",
+        )
+
+    @httpretty.activate
+    def test_get_stream_parser_backend(self):
+        """Streamed responses should be parsed using the selected backend"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        resource = self.client.resource(api_path=self.api_path, parser_backend="python")
+        response = resource.get(query={}, stream=True)
+
+        self.assertEqual(response._parser_backend, get_backend("python"))
+        self.assertEqual(list(response.all()), self.record_response_get_three)
+
+    @httpretty.activate
+    def test_json_codec(self):
+        """Payloads and buffered responses should go through the client's JSON codec"""
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_create),
+            status=200,
+            content_type="application/json",
+        )
+
+        client = Client(json_codec="json", **self.client_kwargs)
+        response = client.resource(api_path=self.api_path).create(
+            self.record_response_create
+        )
+
+        self.assertEqual(response._codec, get_codec("json"))
+        self.assertEqual(response.one(), self.record_response_create)
+        self.assertEqual(
+            httpretty.last_request().body,
+            json.dumps(self.record_response_create).encode("utf-8"),
+        )
+
     @httpretty.activate
     def test_resource_request_default_timeout(self):
         resource = self.client.resource(
@@ -317,6 +380,306 @@ class TestResourceRequest(unittest.TestCase):
 
         self.assertEquals(result, [])
 
+    @httpretty.activate
+    def test_get_paginated_stream(self):
+        """Using paginate=True with the stream parser should follow `next` links and yield records from all pages"""
+
+        next_url = self.mock_url_builder_base + "?sysparm_offset=3&sysparm_limit=3"
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                    adding_headers={"Link": '<%s>;rel="next"' % next_url},
+                ),
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_one),
+                    status=200,
+                    content_type="application/json",
+                ),
+            ],
+        )
+
+        response = self.resource.get(
+            self.dict_query, limit=3, stream=True, paginate=True
+        )
+        result = list(response.all())
+
+        self.assertEqual(
+            result, self.record_response_get_three + self.record_response_get_one
+        )
+        self.assertEqual(response.count, 4)
+        self.assertEqual(
+            qs_as_dict(httpretty.last_request().path)["sysparm_offset"], "3"
+        )
+
+    @httpretty.activate
+    def test_get_paginated_columns(self):
+        """:meth:`to_columns` should include the records of all pages"""
+
+        next_url = self.mock_url_builder_base + "?sysparm_offset=3&sysparm_limit=3"
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                    adding_headers={"Link": '<%s>;rel="next"' % next_url},
+                ),
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_one),
+                    status=200,
+                    content_type="application/json",
+                ),
+            ],
+        )
+
+        response = self.resource.get(
+            self.dict_query, limit=3, stream=True, paginate=True
+        )
+        columns = response.to_columns(["sys_id"])
+
+        self.assertEqual(
+            list(columns["sys_id"]),
+            [
+                r["sys_id"]
+                for r in self.record_response_get_three + self.record_response_get_one
+            ],
+        )
+
+    @httpretty.activate
+    def test_get_paginated_buffered(self):
+        """Using paginate=True without the stream parser should follow `next` links and return all records"""
+
+        next_url = self.mock_url_builder_base + "?sysparm_offset=3&sysparm_limit=3"
+
+        # Without and with parser options, which decode the pages with the parser
+        for options in ({}, {"references": "value"}):
+            httpretty.register_uri(
+                httpretty.GET,
+                self.mock_url_builder_base,
+                responses=[
+                    httpretty.Response(
+                        body=get_serialized_result(self.record_response_get_three),
+                        status=200,
+                        content_type="application/json",
+                        adding_headers={"Link": '<%s>;rel="next"' % next_url},
+                    ),
+                    httpretty.Response(
+                        body=get_serialized_result(self.record_response_get_one),
+                        status=200,
+                        content_type="application/json",
+                    ),
+                ],
+            )
+
+            response = self.resource.get(
+                self.dict_query, limit=3, paginate=True, **options
+            )
+
+            self.assertEqual(
+                list(response.all()),
+                self.record_response_get_three + self.record_response_get_one,
+            )
+            self.assertEqual(response.count, 4)
+
+    @httpretty.activate
+    def test_get_keyset(self):
+        """Using keyset should seek past the last record of each page and yield records from all pages"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                ),
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_one),
+                    status=200,
+                    content_type="application/json",
+                ),
+            ],
+        )
+
+        response = self.resource.get(
+            {"active": "true"}, limit=3, stream=True, keyset="sys_id"
+        )
+        result = list(response.all())
+
+        self.assertEqual(
+            result, self.record_response_get_three + self.record_response_get_one
+        )
+
+        queries = [
+            qs_as_dict(r.path)["sysparm_query"] for r in httpretty.latest_requests()
+        ]
+        self.assertEqual(
+            queries,
+            [
+                "active=true^ORDERBYsys_id",
+                "active=true^sys_id>%s^ORDERBYsys_id"
+                % self.record_response_get_three[-1]["sys_id"],
+            ],
+        )
+
+    @httpretty.activate
+    def test_get_keyset_interleaved(self):
+        """Requests made with the resource between keyset pages should not affect the following pages"""
+
+        pages = {
+            "active=true^ORDERBYsys_id": self.record_response_get_three,
+            "active=true^sys_id>%s^ORDERBYsys_id"
+            % self.record_response_get_three[-1][
+                "sys_id"
+            ]: self.record_response_get_one,
+        }
+
+        def callback(request, uri, headers):
+            query = qs_as_dict(uri).get("sysparm_query")
+            return 200, headers, get_serialized_result(pages.get(query, []))
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=callback,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(
+            {"active": "true"}, limit=3, stream=True, keyset="sys_id"
+        )
+        records = response.all()
+        result = [next(records) for _ in range(3)]
+
+        list(self.resource.get(fields=["number"], limit=50).all())
+        result.extend(records)
+
+        self.assertEqual(
+            result, self.record_response_get_three + self.record_response_get_one
+        )
+
+        qs = qs_as_dict(httpretty.last_request().path)
+        self.assertEqual(qs["sysparm_limit"], "3")
+        self.assertEqual(qs["sysparm_fields"], "")
+        self.assertNotIn("sys_id>", self.resource.parameters.query)
+
+    @httpretty.activate
+    def test_get_keyset_fields(self):
+        """Keyset fields should be added to the requested fields"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(fields=["attr1"], keyset="sys_id", stream=True)
+        qs = qs_as_dict(response._response.request.url)
+
+        self.assertEqual(list(response.all()), [])
+        self.assertEqual(qs["sysparm_fields"], "attr1,sys_id")
+
+    def _register_scan(self, records, total=None):
+        def callback(request, uri, headers):
+            qs = qs_as_dict(uri)
+            offset = int(qs["sysparm_offset"])
+            limit = int(qs["sysparm_limit"])
+            headers["X-Total-Count"] = str(len(records) if total is None else total)
+            return 200, headers, get_serialized_result(records[offset : offset + limit])
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=callback,
+            content_type="application/json",
+        )
+
+    @httpretty.activate
+    def test_scan(self):
+        """:meth:`scan` should fetch disjoint windows and yield all records in order"""
+
+        records = self.record_response_get_three + self.record_response_get_one
+        self._register_scan(records)
+
+        result = list(self.resource.scan(self.dict_query, parallel=2))
+
+        self.assertEqual(result, records)
+
+        window_offsets = sorted(
+            int(qs_as_dict(r.path)["sysparm_offset"])
+            for r in httpretty.latest_requests()
+            if qs_as_dict(r.path)["sysparm_limit"] != "1"
+        )
+        self.assertEqual(window_offsets, [0, 2])
+
+    @httpretty.activate
+    def test_scan_pool_size(self):
+        """:meth:`scan` should grow the connection pools of the session to hold a connection per request"""
+
+        self._register_scan(self.record_response_get_one)
+
+        list(self.resource.scan(self.dict_query, parallel=16))
+
+        for adapter in self.client.session.adapters.values():
+            self.assertEqual(adapter._pool_maxsize, 16)
+
+    @httpretty.activate
+    def test_scan_unordered(self):
+        """:meth:`scan` with ordered=False should yield all records"""
+
+        records = self.record_response_get_three + self.record_response_get_one
+        self._register_scan(records)
+
+        result = list(
+            self.resource.scan(self.dict_query, parallel=3, limit=1, ordered=False)
+        )
+
+        self.assertEqual(
+            sorted(r["attr1"] for r in result), sorted(r["attr1"] for r in records)
+        )
+
+    @httpretty.activate
+    def test_scan_orders_by_sys_id(self):
+        """:meth:`scan` should add a sys_id ordering to unordered queries"""
+
+        self._register_scan([])
+
+        self.assertEqual(list(self.resource.scan(self.dict_query)), [])
+
+        qs = qs_as_dict(httpretty.last_request().path)
+        self.assertTrue(qs["sysparm_query"].endswith("ORDERBYsys_id"))
+
+    @httpretty.activate
+    def test_scan_missing_total_count(self):
+        """:meth:`scan` should raise an exception if the X-Total-Count header is missing"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        self.assertRaises(UnexpectedResponseFormat, self.resource.scan, {})
+
+    def test_scan_invalid_parallel(self):
+        """:meth:`scan` should raise an exception if parallel isn't a positive integer"""
+
+        self.assertRaises(InvalidUsage, self.resource.scan, {}, parallel=0)
+
     @httpretty.activate
     def test_get_nocontent(self):
         """Result.one should raise EmptyContent for GET 202"""
@@ -385,23 +748,34 @@ class TestResourceRequest(unittest.TestCase):
         self.assertRaises(MissingResult, response.first)
 
     @httpretty.activate
-    def test_http_error_get_one(self):
-        """:meth:`one` of :class:`pysnow.Response` should raise an HTTPError exception if a
-        non-200 response code was encountered"""
+    def test_get_projection(self):
+        """:meth:`get` should only keep the fields in `projection`, both streamed and buffered"""
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            status=500,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query)
-        self.assertRaises(HTTPError, response.one)
+        expected = [
+            {"sys_id": r["sys_id"], "attr1": r["attr1"]}
+            for r in self.record_response_get_three
+        ]
+
+        for stream in [True, False]:
+            response = self.resource.get(
+                query={}, projection=["sys_id", "attr1"], stream=stream
+            )
+            self.assertEqual(list(response.all()), expected)
+
+        qs = qs_as_dict(httpretty.last_request().path)
+        self.assertEqual(qs["sysparm_fields"], "")
 
     @httpretty.activate
-    def test_get_one_many(self):
-        """:meth:`one` of :class:`pysnow.Response` should raise an exception if more than one match was found"""
+    def test_get_slots(self):
+        """:meth:`get` should build records as instances of a generated record class if record_class='slots'"""
 
         httpretty.register_uri(
             httpretty.GET,
@@ -411,153 +785,1087 @@ class TestResourceRequest(unittest.TestCase):
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query)
-        self.assertRaises(MultipleResults, response.one)
+        for stream in [True, False]:
+            response = self.resource.get(
+                query={},
+                fields=["sys_id", "attr1"],
+                record_class="slots",
+                stream=stream,
+            )
+            records = list(response.all())
+
+            self.assertEqual(
+                [(r.sys_id, r.attr1) for r in records],
+                [(r["sys_id"], r["attr1"]) for r in self.record_response_get_three],
+            )
+            self.assertFalse(hasattr(records[0], "__dict__"))
 
     @httpretty.activate
-    def test_get_one_empty(self):
-        """:meth:`one` of :class:`pysnow.Response` should raise an exception if no matches were found"""
+    def test_get_intern(self):
+        """:meth:`get` should share repeated strings between records if intern=True"""
+
+        records = [dict(r, attr2="bar") for r in self.record_response_get_three]
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result([]),
+            body=get_serialized_result(records),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query)
-        self.assertRaises(NoResults, response.one)
+        for stream in [True, False]:
+            result = list(self.resource.get(query={}, intern=True, stream=stream).all())
+
+            self.assertEqual(result, records)
+            self.assertIs(result[0]["attr2"], result[2]["attr2"])
 
     @httpretty.activate
-    def test_get_one_or_none_empty(self):
-        """:meth:`one_or_none` of :class:`pysnow.Response` should return `None` if no matches were found """
+    def test_get_references(self):
+        """:meth:`get` should collapse reference objects with the references option, and accept the results in
+        dictionary queries"""
+
+        link = "http://mock_instance.service-now.com/api/now/table/sys_user/abc"
+        records = [
+            dict(r, caller_id={"link": link, "value": "abc"})
+            for r in self.record_response_get_three
+        ]
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result([]),
+            body=get_serialized_result(records),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query)
-        result = response.one_or_none()
+        for stream in [True, False]:
+            result = list(
+                self.resource.get(query={}, references="value", stream=stream).all()
+            )
+            self.assertEqual(result[0]["caller_id"], "abc")
 
-        self.assertEquals(result, None)
+        result = list(self.resource.get(query={}, references="tuple").all())
+        self.assertEqual(result[0]["caller_id"], Reference("abc", link))
+
+        self.resource.get(query={"caller_id": result[0]["caller_id"]})
+        qs = qs_as_dict(httpretty.last_request().path)
+
+        self.assertEqual(qs["sysparm_query"], "caller_id=abc")
 
     @httpretty.activate
-    def test_get_first_or_none_empty(self):
-        """:meth:`first_or_none` of :class:`pysnow.Response` should return None if no records were found"""
+    def test_get_display_values(self):
+        """:meth:`get` should collapse display value objects with display_values='tuple'"""
+
+        records = [
+            {"sys_id": {"display_value": r["sys_id"], "value": r["sys_id"]}}
+            for r in self.record_response_get_three
+        ]
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result([]),
+            body=get_serialized_result(records),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query, stream=True)
-        result = response.first_or_none()
+        result = list(
+            self.resource.get(
+                query={}, display_value="all", display_values="tuple", stream=True
+            ).all()
+        )
+        sys_id = self.record_response_get_three[0]["sys_id"]
 
-        self.assertEquals(result, None)
+        self.assertEqual(result[0]["sys_id"], DisplayValue(sys_id, sys_id, None))
+        self.assertEqual(
+            qs_as_dict(httpretty.last_request().path)["sysparm_display_value"], "all"
+        )
 
     @httpretty.activate
-    def test_get_first_or_none(self):
-        """:meth:`first_or_none` of :class:`pysnow.Response` should return first match if multiple records were found"""
+    def test_get_types(self):
+        """:meth:`get` should convert values with the schema loaded from sys_dictionary if types=True"""
+
+        url = self.resource._base_url + self.base_path + "/table/%s"
 
+        httpretty.register_uri(
+            httpretty.GET,
+            url % "sys_db_object",
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result([{"super_class.name": "task"}])
+                ),
+                httpretty.Response(
+                    body=get_serialized_result([{"super_class.name": ""}])
+                ),
+            ],
+            content_type="application/json",
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            url % "sys_dictionary",
+            body=get_serialized_result(
+                [
+                    {
+                        "name": "incident",
+                        "element": "active",
+                        "internal_type": "string",
+                    },
+                    {"name": "task", "element": "active", "internal_type": "boolean"},
+                    {
+                        "name": "incident",
+                        "element": "severity",
+                        "internal_type": "integer",
+                    },
+                    {"name": "task", "element": "number", "internal_type": "string"},
+                ]
+            ),
+            content_type="application/json",
+        )
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result(self.record_response_get_three),
-            status=200,
+            body=get_serialized_result(
+                [{"number": "INC0001", "severity": "3", "active": "true"}]
+            ),
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query, stream=True)
-        result = response.first_or_none()
+        record = self.resource.get(query={}, types=True, stream=True).first()
+        dictionary_query = qs_as_dict(httpretty.latest_requests()[2].path)
 
-        self.assertEquals(result, self.record_response_get_three[0])
+        self.assertEqual(record, {"number": "INC0001", "severity": 3, "active": "true"})
+        self.assertEqual(
+            dictionary_query["sysparm_query"], "nameINincident,task^elementISNOTEMPTY"
+        )
+        self.assertEqual(self.resource.get_schema().types, {"severity": int})
+        self.assertEqual(len(httpretty.latest_requests()), 4)
+
+    def test_get_slots_without_fields(self):
+        """:meth:`get` should raise InvalidUsage if record_class='slots' is used without fields"""
+
+        self.assertRaises(
+            InvalidUsage, self.resource.get, query={}, record_class="slots"
+        )
 
     @httpretty.activate
-    def test_get_first(self):
-        """:meth:`first` of :class:`pysnow.Response` should return first match if multiple records were found"""
+    def test_request_projection(self):
+        """:meth:`request` should only keep the fields in `projection`"""
 
         httpretty.register_uri(
             httpretty.GET,
-            self.mock_url_builder_base,
+            self.mock_url_builder_base + "/foo",
             body=get_serialized_result(self.record_response_get_three),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query, stream=True)
-        result = response.first()
+        response = self.resource.request(
+            "GET", path_append="/foo", projection=["attr2"], stream=True
+        )
 
-        self.assertEquals(result, self.record_response_get_three[0])
+        self.assertEqual(
+            list(response.all()),
+            [{"attr2": r["attr2"]} for r in self.record_response_get_three],
+        )
+
+    def test_get_invalid_projection(self):
+        """:meth:`get` should raise InvalidUsage if `projection` isn't a list of fields"""
+
+        self.assertRaises(InvalidUsage, self.resource.get, query={}, projection="foo")
+        self.assertRaises(InvalidUsage, self.resource.get, query={}, projection=[1])
 
     @httpretty.activate
-    def test_get_first_empty(self):
-        """:meth:`first` of :class:`pysnow.Response` should raise an exception if matches were found"""
+    def test_get_columns(self):
+        """:meth:`to_columns` should return a column per field, both streamed and buffered"""
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result([]),
+            body=get_serialized_result(self.record_response_get_three),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.get(self.dict_query, stream=True)
+        for stream in [True, False]:
+            response = self.resource.get(query={}, stream=stream)
+            columns = response.to_columns(["attr1", "sys_id"])
 
-        self.assertRaises(NoResults, response.first)
+            self.assertEqual(list(columns.keys()), ["attr1", "sys_id"])
+            self.assertEqual(
+                list(columns["attr1"]),
+                [r["attr1"] for r in self.record_response_get_three],
+            )
+            self.assertEqual(response.count, 3)
 
     @httpretty.activate
-    def test_create(self):
-        """:meth:`create` should return a dictionary of the new record"""
+    def test_get_iter_batches(self):
+        """:meth:`iter_batches` should yield lists of up to `batch_size` records"""
 
         httpretty.register_uri(
-            httpretty.POST,
+            httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result(self.record_response_create),
+            body=get_serialized_result(self.record_response_get_three),
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.create(self.record_response_create)
+        records = self.record_response_get_three
 
-        self.assertEquals(type(response.one()), dict)
-        self.assertEquals(response.one(), self.record_response_create)
+        for stream in [True, False]:
+            response = self.resource.get(query={}, stream=stream)
+            batches = list(response.iter_batches(2))
+
+            self.assertEqual(batches, [records[:2], records[2:]])
 
     @httpretty.activate
-    def test_update(self):
-        """:meth:`update` should return a dictionary of the updated record"""
+    def test_get_iter_batches_columns(self):
+        """:meth:`iter_batches` should yield columns of up to `batch_size` rows if `fields` is given"""
 
         httpretty.register_uri(
             httpretty.GET,
             self.mock_url_builder_base,
-            body=get_serialized_result(self.record_response_get_one),
+            body=get_serialized_result(self.record_response_get_three),
             status=200,
             content_type="application/json",
         )
 
+        response = self.resource.get(query={}, stream=True)
+        batches = list(response.iter_batches(2, fields=["attr1"]))
+
+        self.assertEqual(
+            [list(b["attr1"]) for b in batches], [["foo1", "foo2"], ["foo3"]]
+        )
+
+    def test_get_iter_batches_invalid(self):
+        """:meth:`iter_batches` should raise InvalidUsage if `batch_size` isn't a positive integer"""
+
+        response = Response(None, self.resource)
+        self.assertRaises(InvalidUsage, response.iter_batches, 0)
+
+    @httpretty.activate
+    def test_get_iter_raw(self):
+        """:meth:`iter_raw` should yield the unparsed response body"""
+
+        body = get_serialized_result(self.record_response_get_three)
+
         httpretty.register_uri(
-            httpretty.PUT,
-            self.mock_url_builder_sys_id,
-            body=get_serialized_result(self.record_response_update),
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=body,
             status=200,
             content_type="application/json",
         )
 
-        response = self.resource.update(self.dict_query, self.record_response_update)
-        result = response.one()
+        for stream in [True, False]:
+            response = self.resource.get(query={}, stream=stream)
+            chunks = list(response.iter_raw(16))
 
-        self.assertEquals(type(result), dict)
-        self.assertEquals(self.record_response_update["attr1"], result["attr1"])
+            self.assertEqual(b"".join(chunks), body.encode("utf-8"))
+            self.assertTrue(all(len(chunk) <= 16 for chunk in chunks))
 
     @httpretty.activate
-    def test_update_invalid_payload(self):
+    def test_get_save(self):
+        """:meth:`save` should write the unparsed response body to a path or file object"""
+
+        body = get_serialized_result(self.record_response_get_three)
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=body,
+            status=200,
+            content_type="application/json",
+        )
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            size = self.resource.get(query={}, stream=True).save(path)
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), body.encode("utf-8"))
+        finally:
+            os.remove(path)
+
+        self.assertEqual(size, len(body))
+
+        buf = io.BytesIO()
+        self.resource.get(query={}, stream=True).save(buf)
+
+        self.assertEqual(buf.getvalue(), body.encode("utf-8"))
+
+    @httpretty.activate
+    def test_get_save_ndjson(self):
+        """:meth:`save` should write a line of JSON per record if ndjson=True"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        buf = io.BytesIO()
+        self.resource.get(query={}, stream=True).save(buf, ndjson=True)
+
+        lines = buf.getvalue().decode("utf-8").splitlines()
+
+        self.assertEqual(
+            [json.loads(line) for line in lines], self.record_response_get_three
+        )
+
+    @httpretty.activate
+    def test_get_iter_ndjson_slots(self):
+        """:meth:`iter_ndjson` should serialize slots records as JSON objects"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(
+            query={}, fields=["sys_id", "attr1"], record_class="slots", stream=True
+        )
+        lines = [json.loads(line.decode("utf-8")) for line in response.iter_ndjson()]
+
+        self.assertEqual(
+            lines,
+            [
+                {"sys_id": record["sys_id"], "attr1": record["attr1"]}
+                for record in self.record_response_get_three
+            ],
+        )
+
+    @httpretty.activate
+    def test_get_iter_ndjson_references(self):
+        """:meth:`iter_ndjson` should write reference tuples as `{link, value}` objects"""
+
+        record = {
+            "sys_id": "1",
+            "caller_id": {"link": "https://x/api/now/table/sys_user/2", "value": "2"},
+        }
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([record]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(query={}, references="tuple", stream=True)
+        lines = [json.loads(line.decode("utf-8")) for line in response.iter_ndjson()]
+
+        self.assertEqual(lines, [record])
+
+    @httpretty.activate
+    def test_get_iter_ndjson_display_values(self):
+        """:meth:`iter_ndjson` should write display value tuples as `{display_value, value}` objects"""
+
+        record = {
+            "state": {"display_value": "New", "value": "1"},
+            "caller_id": {
+                "display_value": "Abel Tuter",
+                "link": "https://x/api/now/table/sys_user/2",
+                "value": "2",
+            },
+        }
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([record]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(
+            query={}, display_value="all", display_values="tuple", stream=True
+        )
+        lines = [json.loads(line.decode("utf-8")) for line in response.iter_ndjson()]
+
+        self.assertEqual(lines, [record])
+
+    @httpretty.activate
+    def test_get_iter_ndjson_types(self):
+        """:meth:`iter_ndjson` should write converted values back in ServiceNow's format"""
+
+        record = {
+            "opened_at": "2024-01-02 03:04:05",
+            "due": "2024-01-02",
+            "price": "1234.10",
+            "count": "3",
+            "closed_at": "",
+        }
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([record]),
+            status=200,
+            content_type="application/json",
+        )
+
+        types = {
+            "opened_at": "glide_date_time",
+            "due": "glide_date",
+            "price": "currency",
+            "count": "integer",
+            "closed_at": "glide_date_time",
+        }
+        response = self.resource.get(query={}, types=types, stream=True)
+        lines = [json.loads(line.decode("utf-8")) for line in response.iter_ndjson()]
+
+        self.assertEqual(lines, [dict(record, count=3, closed_at=None)])
+
+    def test_get_types_display_value(self):
+        """:meth:`get` should raise an exception if types are combined with display_value=True"""
+
+        types = {"priority": "integer"}
+
+        self.assertRaises(
+            InvalidUsage, self.resource.get, {}, types=types, display_value=True
+        )
+
+    @httpretty.activate
+    def test_get_save_error(self):
+        """:meth:`save` should raise an HTTPError on non-200 responses"""
+
+        httpretty.register_uri(
+            httpretty.GET, self.mock_url_builder_base, status=500, body=""
+        )
+
+        response = self.resource.get(query={}, stream=True)
+        self.assertRaises(HTTPError, response.save, io.BytesIO())
+
+    def test_get_iter_raw_paginated(self):
+        """:meth:`iter_raw` should raise InvalidUsage for paginated responses"""
+
+        response = Response(None, self.resource, pager=object())
+        self.assertRaises(InvalidUsage, response.iter_raw)
+
+    @httpretty.activate
+    def test_http_error_get_one(self):
+        """:meth:`one` of :class:`pysnow.Response` should raise an HTTPError exception if a
+        non-200 response code was encountered"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            status=500,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query)
+        self.assertRaises(HTTPError, response.one)
+
+    @httpretty.activate
+    def test_get_one_many(self):
+        """:meth:`one` of :class:`pysnow.Response` should raise an exception if more than one match was found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query)
+        self.assertRaises(MultipleResults, response.one)
+
+    @httpretty.activate
+    def test_get_one_empty(self):
+        """:meth:`one` of :class:`pysnow.Response` should raise an exception if no matches were found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query)
+        self.assertRaises(NoResults, response.one)
+
+    @httpretty.activate
+    def test_get_one_or_none_empty(self):
+        """:meth:`one_or_none` of :class:`pysnow.Response` should return `None` if no matches were found """
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query)
+        result = response.one_or_none()
+
+        self.assertEquals(result, None)
+
+    @httpretty.activate
+    def test_get_first_or_none_empty(self):
+        """:meth:`first_or_none` of :class:`pysnow.Response` should return None if no records were found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        result = response.first_or_none()
+
+        self.assertEquals(result, None)
+
+    @httpretty.activate
+    def test_get_first_or_none(self):
+        """:meth:`first_or_none` of :class:`pysnow.Response` should return first match if multiple records were found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        result = response.first_or_none()
+
+        self.assertEquals(result, self.record_response_get_three[0])
+
+    @httpretty.activate
+    def test_get_first(self):
+        """:meth:`first` of :class:`pysnow.Response` should return first match if multiple records were found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        result = response.first()
+
+        self.assertEquals(result, self.record_response_get_three[0])
+
+    @httpretty.activate
+    def test_get_first_all_stream(self):
+        """:meth:`first` and :meth:`all` of a streamed response should share one parser and the first records"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        first = response.first()
+        result = list(response.all())
+
+        self.assertEqual(result, self.record_response_get_three)
+        self.assertIs(result[0], first)
+        self.assertIs(response.first(), first)
+        self.assertEqual(list(response.all()), [])
+        self.assertEqual(response.count, 3)
+        self.assertRaises(MultipleResults, response.one)
+        self.assertRaises(InvalidUsage, response.iter_raw)
+
+    @httpretty.activate
+    def test_get_all_twice_stream(self):
+        """Calling :meth:`all` again should continue where the stream was left, without replaying records"""
+
+        next_url = self.mock_url_builder_base + "?sysparm_offset=3&sysparm_limit=3"
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                    adding_headers={"Link": '<%s>;rel="next"' % next_url},
+                ),
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                ),
+            ],
+        )
+
+        response = self.resource.get(
+            self.dict_query, limit=3, stream=True, paginate=True
+        )
+        records = response.all()
+
+        # The kept record is yielded again until the stream was read past it
+        self.assertEqual(next(records), self.record_response_get_three[0])
+        self.assertEqual(len(list(response.all())), 6)
+        self.assertEqual(list(response.all()), [])
+        self.assertEqual(list(records), [])
+        self.assertEqual(response.count, 6)
+
+    @httpretty.activate
+    def test_get_first_columns_stream(self):
+        """Columns of a streamed response should include the records read by :meth:`first`"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        response.first()
+        columns = response.to_columns(["sys_id"])
+
+        self.assertEqual(
+            list(columns["sys_id"]),
+            [r["sys_id"] for r in self.record_response_get_three],
+        )
+
+    @httpretty.activate
+    def test_get_columns_stream_consumed(self):
+        """A streamed response should not be parsed once its body was read into columns"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        for read in (
+            lambda r: r.to_columns(["sys_id"]),
+            lambda r: list(r.iter_batches(2, fields=["sys_id"])),
+        ):
+            response = self.resource.get(self.dict_query, stream=True)
+            read(response)
+
+            self.assertRaises(InvalidUsage, list, response.all())
+            self.assertRaises(InvalidUsage, response.one)
+            self.assertRaises(InvalidUsage, response.to_columns, ["sys_id"])
+            self.assertRaises(InvalidUsage, response.views)
+
+        # Buffered responses keep their content
+        response = self.resource.get(self.dict_query)
+        response.to_columns(["sys_id"])
+
+        self.assertEqual(response.all(), self.record_response_get_three)
+
+    @httpretty.activate
+    def test_get_one_stream(self):
+        """:meth:`one` of a streamed response should read the record from the stream, and keep it"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_one),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+
+        self.assertEqual(response["sys_id"], self.record_response_get_one[0]["sys_id"])
+        self.assertIs(response.one(), response.first())
+        self.assertEqual(list(response.all()), self.record_response_get_one)
+
+    @httpretty.activate
+    def test_get_buffered_decoded_once(self):
+        """A buffered response should be decoded once, and its records shared"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_one),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query)
+        codec = response._codec
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            return codec.loads(data)
+
+        response._codec = JSONCodec("counting", codec.dumps, loads)
+
+        self.assertEqual(response["sys_id"], self.record_response_get_one[0]["sys_id"])
+        self.assertIs(response.one(), response.all()[0])
+        self.assertEqual(response.count, 1)
+        self.assertEqual(len(calls), 1)
+
+    @httpretty.activate
+    def test_get_views(self):
+        """:meth:`views` of :class:`pysnow.Response` should return views of the records, in memory or spilled"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        for spill in (False, True):
+            response = self.resource.get(self.dict_query, stream=True)
+            views = response.views(spill=spill)
+
+            self.assertEqual(list(views), self.record_response_get_three)
+            self.assertEqual(
+                views[1]["sys_id"], self.record_response_get_three[1]["sys_id"]
+            )
+            self.assertEqual(response.count, 3)
+            views.close()
+
+    @httpretty.activate
+    def test_get_views_invalid(self):
+        """:meth:`views` of :class:`pysnow.Response` should raise an exception once the stream was parsed"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+        response.first()
+
+        self.assertRaises(InvalidUsage, response.views)
+
+    @httpretty.activate
+    def test_get_views_consumed(self):
+        """A streamed response should not be parsed once its body was read by :meth:`views`"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        for spill in (False, True):
+            response = self.resource.get(self.dict_query, stream=True)
+            response.views(spill=spill)
+
+            self.assertRaises(InvalidUsage, list, response.all())
+            self.assertRaises(InvalidUsage, response.first)
+            self.assertRaises(InvalidUsage, response.to_columns, ["sys_id"])
+            self.assertRaises(InvalidUsage, response.iter_raw)
+            self.assertRaises(InvalidUsage, response.views)
+
+        # Buffered responses keep their content
+        response = self.resource.get(self.dict_query)
+        response.views(spill=True)
+
+        self.assertEqual(response.all(), self.record_response_get_three)
+
+    @httpretty.activate
+    def test_get_spill(self):
+        """Spilled responses should be parsed from the temporary file whenever the records are read"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_three),
+            status=200,
+            content_type="application/json",
+        )
+
+        # Small enough to be moved to disk
+        response = self.resource.get(self.dict_query, spill=16)
+
+        self.assertEqual(list(response.all()), self.record_response_get_three)
+        self.assertEqual(list(response.all()), self.record_response_get_three)
+        self.assertEqual(response.count, 3)
+        self.assertEqual(
+            list(response.iter_batches(2)),
+            [self.record_response_get_three[:2], self.record_response_get_three[2:]],
+        )
+        self.assertRaises(MultipleResults, response.one)
+        self.assertEqual(
+            list(response.to_columns(["sys_id"])["sys_id"]),
+            [record["sys_id"] for record in self.record_response_get_three],
+        )
+        self.assertEqual(
+            b"".join(response.iter_raw(8)),
+            get_serialized_result(self.record_response_get_three).encode("utf-8"),
+        )
+        self.assertEqual(list(response.views()), self.record_response_get_three)
+
+    @httpretty.activate
+    def test_get_spill_one(self):
+        """:meth:`one` of a spilled response should return the only record"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_one),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, spill=True)
+
+        self.assertEqual(response.one(), self.record_response_get_one[0])
+        self.assertEqual(response["sys_id"], self.record_response_get_one[0]["sys_id"])
+
+    @httpretty.activate
+    def test_get_spill_paginated(self):
+        """Each page of a spilled paginated response should be parsed from a temporary file"""
+
+        next_url = self.mock_url_builder_base + "?sysparm_offset=3&sysparm_limit=3"
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            responses=[
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_three),
+                    status=200,
+                    content_type="application/json",
+                    adding_headers={"Link": '<%s>;rel="next"' % next_url},
+                ),
+                httpretty.Response(
+                    body=get_serialized_result(self.record_response_get_one),
+                    status=200,
+                    content_type="application/json",
+                ),
+            ],
+        )
+
+        response = self.resource.get(self.dict_query, limit=3, spill=16, paginate=True)
+
+        self.assertEqual(
+            list(response.all()),
+            self.record_response_get_three + self.record_response_get_one,
+        )
+        self.assertEqual(response.count, 4)
+
+    def test_get_spill_invalid(self):
+        """Invalid spill sizes, or spilling a streamed response, should raise an exception"""
+
+        for spill in (0, -1, "1", 1.5):
+            self.assertRaises(
+                InvalidUsage, self.resource.get, self.dict_query, spill=spill
+            )
+
+        self.assertRaises(
+            InvalidUsage, self.resource.get, self.dict_query, stream=True, spill=True
+        )
+
+    @httpretty.activate
+    def test_get_first_empty(self):
+        """:meth:`first` of :class:`pysnow.Response` should raise an exception if matches were found"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result([]),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(self.dict_query, stream=True)
+
+        self.assertRaises(NoResults, response.first)
+
+    @httpretty.activate
+    def test_create(self):
+        """:meth:`create` should return a dictionary of the new record"""
+
+        httpretty.register_uri(
+            httpretty.POST,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_create),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.create(self.record_response_create)
+
+        self.assertEquals(type(response.one()), dict)
+        self.assertEquals(response.one(), self.record_response_create)
+
+    @httpretty.activate
+    def test_update(self):
+        """:meth:`update` should return a dictionary of the updated record"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_one),
+            status=200,
+            content_type="application/json",
+        )
+
+        httpretty.register_uri(
+            httpretty.PUT,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_update),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.update(self.dict_query, self.record_response_update)
+        result = response.one()
+
+        self.assertEquals(type(result), dict)
+        self.assertEquals(self.record_response_update["attr1"], result["attr1"])
+
+    @httpretty.activate
+    def test_update_by_sys_id(self):
+        """:meth:`update_by_sys_id` should update the record without a lookup request"""
+
+        httpretty.register_uri(
+            httpretty.PUT,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_update),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.update_by_sys_id(
+            self.record_response_get_one[0]["sys_id"], self.record_response_update
+        )
+
+        self.assertEqual(response["attr1"], self.record_response_update["attr1"])
+        self.assertNotIn("GET", [r.method for r in httpretty.latest_requests()])
+
+    def test_update_by_sys_id_invalid_payload(self):
+        """:meth:`update_by_sys_id` should raise an exception if payload is of invalid type"""
+
+        self.assertRaises(
+            InvalidUsage, self.resource.update_by_sys_id, "sys_id", ["foo"]
+        )
+
+    @httpretty.activate
+    def test_patch(self):
+        """:meth:`patch` should send a PATCH request with the full payload if no record is given"""
+
+        httpretty.register_uri(
+            httpretty.PATCH,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_update),
+            status=200,
+            content_type="application/json",
+        )
+
+        sys_id = self.record_response_get_one[0]["sys_id"]
+        response = self.resource.patch(sys_id, {"attr1": "foo_updated"})
+
+        self.assertEqual(response["attr1"], "foo_updated")
+        self.assertEqual(
+            json.loads(httpretty.last_request().body.decode("utf-8")),
+            {"attr1": "foo_updated"},
+        )
+
+    @httpretty.activate
+    def test_patch_diff(self):
+        """:meth:`patch` should only send fields that differ from the given record"""
+
+        httpretty.register_uri(
+            httpretty.PATCH,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_update),
+            status=200,
+            content_type="application/json",
+        )
+
+        record = dict(
+            self.record_response_get_one[0],
+            state="2",
+            active="true",
+            caller_id={"link": "http://foo", "value": "abc"},
+        )
+        payload = {
+            "attr1": "foo",
+            "attr2": "changed",
+            "state": 2,
+            "active": True,
+            "caller_id": "abc",
+        }
+
+        self.resource.patch(record["sys_id"], payload, record=record)
+
+        self.assertEqual(
+            json.loads(httpretty.last_request().body.decode("utf-8")),
+            {"attr2": "changed"},
+        )
+
+    @httpretty.activate
+    def test_patch_no_changes(self):
+        """:meth:`patch` should skip the request and return None if nothing changed"""
+
+        record = self.record_response_get_one[0]
+
+        result = self.resource.patch(record["sys_id"], {"attr1": "foo"}, record=record)
+
+        self.assertEqual(result, None)
+        self.assertEqual(httpretty.latest_requests(), [])
+
+    @httpretty.activate
+    def test_response_patch(self):
+        """Using Response.patch should only send changed fields of the fetched record"""
+
+        httpretty.register_uri(
+            httpretty.GET,
+            self.mock_url_builder_base,
+            body=get_serialized_result(self.record_response_get_one),
+            status=200,
+            content_type="application/json",
+        )
+
+        httpretty.register_uri(
+            httpretty.PATCH,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_update),
+            status=200,
+            content_type="application/json",
+        )
+
+        response = self.resource.get(query={})
+        response.patch({"attr1": "foo", "attr2": "bar_updated"})
+
+        self.assertEqual(
+            json.loads(httpretty.last_request().body.decode("utf-8")),
+            {"attr2": "bar_updated"},
+        )
+
+    def test_patch_invalid_payload(self):
+        """:meth:`patch` should raise an exception if payload is of invalid type"""
+
+        self.assertRaises(InvalidUsage, self.resource.patch, "sys_id", "foo")
+
+    @httpretty.activate
+    def test_update_invalid_payload(self):
         """:meth:`update` should raise an exception if payload is of invalid type"""
 
         self.assertRaises(InvalidUsage, self.resource.update, self.dict_query, "foo")
@@ -595,6 +1903,25 @@ class TestResourceRequest(unittest.TestCase):
         self.assertEquals(type(result), dict)
         self.assertEquals(result["status"], "record deleted")
 
+    @httpretty.activate
+    def test_delete_by_sys_id(self):
+        """:meth:`delete_by_sys_id` should delete the record without a lookup request"""
+
+        httpretty.register_uri(
+            httpretty.DELETE,
+            self.mock_url_builder_sys_id,
+            body=get_serialized_result(self.record_response_delete),
+            status=204,
+            content_type="application/json",
+        )
+
+        result = self.resource.delete_by_sys_id(
+            self.record_response_get_one[0]["sys_id"]
+        )
+
+        self.assertEqual(result["status"], "record deleted")
+        self.assertEqual([r.method for r in httpretty.latest_requests()], ["DELETE"])
+
     @httpretty.activate
     def test_delete_chained(self):
         """:meth:`Response.delete` should return a dictionary containing status"""
@@ -619,6 +1946,9 @@ class TestResourceRequest(unittest.TestCase):
 
         self.assertEquals(type(result), dict)
         self.assertEquals(result["status"], "record deleted")
+        self.assertEqual(
+            [r.method for r in httpretty.latest_requests()], ["GET", "DELETE"]
+        )
 
     @httpretty.activate
     def test_custom(self):
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from pysnow.schema import Schema, get_schema
+from pysnow.exceptions import InvalidUsage
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(
+            {
+                "reassignment_count": "integer",
+                "business_stc": int,
+                "price": "currency",
+                "active": "boolean",
+                "opened_at": "glide_date_time",
+                "due": datetime,
+                "birthday": "glide_date",
+            }
+        )
+
+    def test_schema_convert(self):
+        """Values should be converted to the type of their field"""
+
+        convert = self.schema.convert
+
+        self.assertEqual(convert("reassignment_count", "3"), 3)
+        self.assertEqual(convert("business_stc", "0"), 0)
+        self.assertEqual(convert("price", "10.10"), Decimal("10.10"))
+        self.assertEqual(convert("active", "true"), True)
+        self.assertEqual(convert("active", "false"), False)
+        self.assertEqual(
+            convert("opened_at", "2024-01-02 10:20:30"),
+            datetime(2024, 1, 2, 10, 20, 30),
+        )
+        self.assertEqual(convert("birthday", "2024-01-02"), date(2024, 1, 2))
+
+    def test_schema_convert_other(self):
+        """Empty values should be converted to None, other fields and non-string values returned as-is"""
+
+        convert = self.schema.convert
+
+        self.assertEqual(convert("due", ""), None)
+        self.assertEqual(convert("number", "INC0001"), "INC0001")
+        self.assertEqual(convert("reassignment_count", None), None)
+        self.assertEqual(convert("reassignment_count", 3), 3)
+
+    def test_schema_dtype(self):
+        """Fields should have a column dtype matching their type"""
+
+        self.assertEqual(self.schema.get_dtype("reassignment_count"), "float64")
+        self.assertEqual(self.schema.get_dtype("active"), "bool")
+        self.assertEqual(self.schema.get_dtype("opened_at"), "datetime64[s]")
+        self.assertEqual(self.schema.get_dtype("number"), None)
+
+    def test_schema_invalid_type(self):
+        """Unsupported types should raise InvalidUsage"""
+
+        self.assertRaises(InvalidUsage, Schema, {"caller_id": "reference"})
+        self.assertRaises(InvalidUsage, Schema, {"caller_id": list})
+
+    def test_schema_from_dictionary(self):
+        """Schemas should be created from sys_dictionary records, skipping unsupported types"""
+
+        schema = Schema.from_dictionary(
+            [
+                {"element": "opened_at", "internal_type": {"value": "glide_date_time"}},
+                {"element": "active", "internal_type": "boolean"},
+                {"element": "caller_id", "internal_type": {"value": "reference"}},
+                {"element": "", "internal_type": "collection"},
+            ]
+        )
+
+        self.assertEqual(schema, Schema({"opened_at": datetime, "active": bool}))
+
+    def test_get_schema(self):
+        """The types option should be a schema or a dictionary"""
+
+        self.assertIs(get_schema(self.schema), self.schema)
+        self.assertEqual(get_schema({"active": "boolean"}), Schema({"active": bool}))
+        self.assertRaises(InvalidUsage, get_schema, True)
+        self.assertRaises(InvalidUsage, get_schema, ["active"])
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from pysnow.codec import get_codec
+from pysnow.views import RecordView, RecordViews, scan
+from pysnow.exceptions import MissingResult, ResponseError
+
+
+class TestViews(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {
+                "sys_id": "1",
+                "number": "INC0000001",
+                "caller_id": {"link": "https://x/api/now/sys_user/2", "value": "2"},
+                "short_description": 'caf\xe9 "quoted" \\ ☃',
+                "reassignment_count": 3,
+                "active": True,
+                "closed_at": None,
+                "watch_list": ["3", "4"],
+            },
+            {
+                "sys_id": "5",
+                "number": "INC0000002",
+                "caller_id": "",
+                "nested": {"a": {"b": [1, {"c": 2}]}},
+                "short_description": 'text with } and ] and \\"',
+            },
+        ]
+        self.body = json.dumps({"result": self.records}, indent=2).encode("utf-8")
+
+    def test_scan(self):
+        """Records of a result array should be found without decoding them"""
+
+        views = scan(self.body)
+
+        self.assertIsInstance(views, RecordViews)
+        self.assertEqual(len(views), 2)
+        self.assertEqual(repr(views), "<RecordViews [2]>")
+        self.assertEqual(list(views), self.records)
+        self.assertIsInstance(views[-1], RecordView)
+        self.assertEqual(views[-1], self.records[1])
+        self.assertRaises(IndexError, views.__getitem__, 2)
+
+    def test_scan_one(self):
+        """A result object should be found as a single record"""
+
+        views = scan(json.dumps({"result": self.records[0]}).encode("utf-8"))
+
+        self.assertEqual(len(views), 1)
+        self.assertEqual(views[0], self.records[0])
+
+    def test_scan_other_keys(self):
+        """Keys before the result should be skipped, however nested"""
+
+        body = json.dumps({"meta": {"a": [{"b": "}"}]}, "result": self.records}).encode(
+            "utf-8"
+        )
+
+        self.assertEqual(list(scan(body)), self.records)
+
+    def test_scan_empty(self):
+        """An empty result should have no views"""
+
+        self.assertEqual(len(scan(b'{"result": []}')), 0)
+
+    def test_scan_error(self):
+        """An error in the response should be raised"""
+
+        body = json.dumps(
+            {"error": {"message": "Not found", "detail": "No record"}}
+        ).encode("utf-8")
+
+        self.assertRaises(ResponseError, scan, body)
+
+    def test_scan_missing_result(self):
+        """A response without a result should raise an exception"""
+
+        self.assertRaises(MissingResult, scan, b'{"other": 1}')
+        self.assertRaises(MissingResult, scan, b"[]")
+        self.assertRaises(MissingResult, scan, b'{"result": [{"a": "1"}')
+
+    def test_view_fields(self):
+        """Fields should be decoded when accessed"""
+
+        view = scan(self.body, get_codec("json"))[0]
+
+        for key, value in self.records[0].items():
+            self.assertEqual(view[key], value)
+
+        self.assertEqual(view.get("unknown", "default"), "default")
+        self.assertRaises(KeyError, view.__getitem__, "unknown")
+        self.assertIn("caller_id", view)
+        self.assertEqual(view.keys(), list(self.records[0].keys()))
+        self.assertEqual(len(view), len(self.records[0]))
+
+    def test_view_nested_fields(self):
+        """Records nested deeper than the fast patterns should be decoded as a whole"""
+
+        view = scan(self.body)[1]
+
+        self.assertEqual(view["nested"], self.records[1]["nested"])
+        self.assertEqual(
+            view["short_description"], self.records[1]["short_description"]
+        )
+        self.assertEqual(view.keys(), list(self.records[1].keys()))
+        self.assertRaises(KeyError, view.__getitem__, "unknown")
+
+    def test_view_escaped_keys(self):
+        """Escaped keys should match their decoded names"""
+
+        view = scan(b'{"result": [{"caf\\u00e9": "1", "a\\"b": "2"}]}')[0]
+
+        self.assertEqual(view["caf\xe9"], "1")
+        self.assertEqual(view['a"b'], "2")
+        self.assertEqual(view.keys(), ["caf\xe9", 'a"b'])
+
+    def test_view_raw(self):
+        """The raw record should be a memoryview of the buffer"""
+
+        views = scan(self.body)
+        raw = views[0].raw
+
+        self.assertIsInstance(raw, memoryview)
+        self.assertEqual(json.loads(raw.tobytes().decode("utf-8")), self.records[0])
+        self.assertEqual(views[0]._asdict(), self.records[0])
+        self.assertEqual(dict(views[1].items()), self.records[1])
+        self.assertNotEqual(views[0], views[1])